@@ -0,0 +1,69 @@
+# benchmarks/bench_batching.py
+"""
+Offline throughput benchmark for BatchingAdapter against the FakeLLMAdapter backend.
+
+The fake backend serves at most `--server-concurrency` requests at once, each costing
+`--latency` seconds plus `--per-prompt-ms` per prompt, so request round-trips (not
+prompts) are the bottleneck, as with a real provider behind a small connection pool.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_batching.py [--prompts 400] [--callers 64]
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agentic_report_swarm.adapters.batching_adapter import BatchingAdapter
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+
+
+def _run(adapter, prompts, callers):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(adapter.generate, prompts))
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--prompts", type=int, default=400)
+    ap.add_argument("--callers", type=int, default=64)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--per-prompt-ms", type=float, default=1.0)
+    ap.add_argument("--server-concurrency", type=int, default=8)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    prompts = [f"summarise segment {i}" for i in range(args.prompts)]
+
+    def backend():
+        return FakeLLMAdapter(latency=args.latency, per_prompt_latency=args.per_prompt_ms / 1000.0,
+                              max_concurrency=args.server_concurrency)
+
+    rows = []
+    plain = backend()
+    elapsed = _run(plain, prompts, args.callers)
+    rows.append({"mode": "unbatched", "elapsed_s": elapsed, "requests": plain.stats()["requests"]})
+    for batch_size, wait_ms in ((8, 5.0), (16, 10.0), (32, 20.0)):
+        be = backend()
+        adapter = BatchingAdapter(be, max_batch_size=batch_size, max_wait_ms=wait_ms,
+                                  max_inflight_batches=args.server_concurrency)
+        elapsed = _run(adapter, prompts, args.callers)
+        adapter.close()
+        rows.append({"mode": f"batch={batch_size},wait={wait_ms}ms", "elapsed_s": elapsed,
+                     "requests": be.stats()["requests"]})
+    for r in rows:
+        r["prompts_per_s"] = round(args.prompts / r["elapsed_s"], 1)
+        r["elapsed_s"] = round(r["elapsed_s"], 3)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'mode':<26}{'elapsed s':>10}{'requests':>10}{'prompts/s':>11}")
+    for r in rows:
+        print(f"{r['mode']:<26}{r['elapsed_s']:>10}{r['requests']:>10}{r['prompts_per_s']:>11}")
+
+
+if __name__ == "__main__":
+    main()
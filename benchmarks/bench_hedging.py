@@ -0,0 +1,95 @@
+# benchmarks/bench_hedging.py
+"""
+Offline tail-latency benchmark for HedgedAdapter against a FakeLLMAdapter backend.
+
+The fake backend draws each request's latency from a straggler-heavy distribution
+(`--dist bimodal`: `--fast` seconds, but `--p-slow` of requests take `--slow`;
+`--dist lognormal`: median `--fast`, `--sigma`). Compares plain calls, hedging at
+the observed p95 on the same backend, and hedging to an alternate backend, reporting
+p50/p95/p99 latency and the extra requests hedging costs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_hedging.py [--calls 400] [--callers 16] [--json]
+"""
+import argparse
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter, bimodal_latency, lognormal_latency
+from agentic_report_swarm.adapters.hedged_adapter import HedgedAdapter
+
+
+def _pct(vals, q):
+    vals = sorted(vals)
+    return vals[max(0, min(len(vals) - 1, math.ceil(q * len(vals)) - 1))]
+
+
+def _run(adapter, prompts, callers):
+    def one(prompt):
+        started = time.perf_counter()
+        adapter.generate(prompt)
+        return time.perf_counter() - started
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        return list(pool.map(one, prompts))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--calls", type=int, default=400)
+    ap.add_argument("--callers", type=int, default=16)
+    ap.add_argument("--dist", choices=("bimodal", "lognormal"), default="bimodal")
+    ap.add_argument("--fast", type=float, default=0.02)
+    ap.add_argument("--slow", type=float, default=0.5)
+    ap.add_argument("--p-slow", type=float, default=0.05)
+    ap.add_argument("--sigma", type=float, default=0.8)
+    ap.add_argument("--quantile", type=float, default=0.95)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    prompts = [f"summarise segment {i}" for i in range(args.calls)]
+    if args.dist == "bimodal":
+        dist = bimodal_latency(args.fast, args.slow, args.p_slow)
+    else:
+        dist = lognormal_latency(args.fast, args.sigma)
+
+    def backend(seed):
+        return FakeLLMAdapter(latency_dist=dist, seed=seed)
+
+    rows = []
+    plain = backend(args.seed)
+    rows.append({"mode": "plain", "latencies": _run(plain, prompts, args.callers), "requests": plain.stats()["requests"]})
+    for mode, alternate in (("hedged", None), ("hedged+alternate", backend(args.seed + 1))):
+        primary = backend(args.seed)
+        adapter = HedgedAdapter(primary, alternate=alternate, quantile=args.quantile)
+        # warm the latency window so hedging is armed from the first measured call
+        _run(adapter, prompts[: adapter.min_samples * 2], args.callers)
+        backends = [b for b in (primary, alternate) if b is not None]
+        warm = adapter.stats()
+        before = sum(b.stats()["requests"] for b in backends)
+        latencies = _run(adapter, prompts, args.callers)
+        stats = adapter.stats()
+        adapter.close()
+        rows.append({"mode": mode, "latencies": latencies,
+                     "requests": sum(b.stats()["requests"] for b in backends) - before,
+                     "hedged": stats["hedged"] - warm["hedged"], "hedge_wins": stats["hedge_wins"] - warm["hedge_wins"],
+                     "hedge_delay_ms": round(stats["hedge_delay_s"] * 1000, 1)})
+
+    for r in rows:
+        lat = r.pop("latencies")
+        requests = r.pop("requests")
+        r.update(p50_ms=round(_pct(lat, 0.5) * 1000, 1), p95_ms=round(_pct(lat, 0.95) * 1000, 1),
+                 p99_ms=round(_pct(lat, 0.99) * 1000, 1), extra_requests_pct=round(100.0 * (requests - args.calls) / args.calls, 1))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'mode':<20}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'extra req %':>13}")
+    for r in rows:
+        print(f"{r['mode']:<20}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['extra_requests_pct']:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# benchmarks/bench_llm_json.py
+"""
+Micro-benchmark: llm_json.parse_maybe_json vs. the previous multi-pass implementation.
+
+Corpus: synthetic but realistic multi-KB LLM responses (pure JSON, fenced JSON after
+commentary, bare JSON embedded in prose, braces inside string literals, repairable
+pseudo-JSON, truncated JSON and plain prose with no JSON at all).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_llm_json.py [--repeat 200] [--size-kb 8]
+"""
+import argparse
+import json
+import random
+import re
+import time
+
+from agentic_report_swarm.utils.llm_json import parse_maybe_json
+
+
+# --- previous implementation (frozen copy, for comparison only) ----------------
+
+def _legacy_safe_json_loads(s):
+    if not isinstance(s, str):
+        return None
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        return json.loads(s)
+    except Exception:
+        pass
+    try:
+        cand = s.replace("'", '"')
+        cand = re.sub(r',\s*([\]\}])', r'\1', cand)
+        return json.loads(cand)
+    except Exception:
+        pass
+    return None
+
+
+def _legacy_extract_code_blocks(text):
+    blocks = re.findall(r"```(?:json)?\s*([\s\S]*?)```", text, flags=re.IGNORECASE)
+    return [b.strip() for b in blocks if b and b.strip()]
+
+
+def _legacy_find_brace_substring(text):
+    start_idx = None
+    for i, ch in enumerate(text):
+        if ch in ('{', '['):
+            start_idx = i
+            break
+    if start_idx is None:
+        return None
+    stack = []
+    for j in range(start_idx, len(text)):
+        ch = text[j]
+        if ch in ('{', '['):
+            stack.append(ch)
+        elif ch in ('}', ']') and stack:
+            top = stack[-1]
+            if (top == '{' and ch == '}') or (top == '[' and ch == ']'):
+                stack.pop()
+                if not stack:
+                    return text[start_idx:j + 1]
+    return None
+
+
+def legacy_parse_maybe_json(text):
+    if not isinstance(text, str):
+        return text
+    text = text.strip()
+    if not text:
+        return text
+    parsed = _legacy_safe_json_loads(text)
+    if parsed is not None:
+        return parsed
+    for b in _legacy_extract_code_blocks(text):
+        p = _legacy_safe_json_loads(b)
+        if p is not None:
+            return p
+    cand = _legacy_find_brace_substring(text)
+    if cand:
+        p = _legacy_safe_json_loads(cand)
+        if p is not None:
+            return p
+    return text
+
+
+# --- corpus --------------------------------------------------------------------
+
+WORDS = ("market", "growth", "segment", "customer", "adoption", "regulation", "pricing",
+         "channel", "retention", "margin", "forecast", "region", "supply", "demand")
+
+
+def _prose(rng, n_chars):
+    out = []
+    size = 0
+    while size < n_chars:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize() + ". "
+        out.append(sentence)
+        size += len(sentence)
+    return "".join(out)
+
+
+def _payload(rng, n_chars):
+    items = []
+    size = 0
+    while size < n_chars:
+        item = {"title": _prose(rng, 40).strip(), "score": rng.random(), "tags": rng.sample(WORDS, 3),
+                "note": "uses {braces} and [brackets] inside strings"}
+        items.append(item)
+        size += len(json.dumps(item))
+    return {"insights": items, "summary": _prose(rng, 200)}
+
+
+def build_corpus(size_kb: int, seed: int = 7):
+    rng = random.Random(seed)
+    n = size_kb * 1024
+    half = n // 2
+    data = _payload(rng, half)
+    js = json.dumps(data, indent=2)
+    return {
+        "pure_json": js,
+        "fenced_after_prose": _prose(rng, half) + "\n```json\n" + js + "\n```\nLet me know if you need more.",
+        "bare_in_prose": _prose(rng, half) + " " + json.dumps(data) + " " + _prose(rng, 300),
+        "repairable": _prose(rng, 300) + " " + js.replace('"', "'").rstrip("}") + ",}",
+        "truncated": _prose(rng, 300) + " " + js[: int(len(js) * 0.8)],
+        "prose_only": _prose(rng, n),
+    }
+
+
+def _time(fn, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--size-kb", type=int, default=8)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    rows = []
+    for name, text in build_corpus(args.size_kb).items():
+        legacy_us = _time(legacy_parse_maybe_json, text, args.repeat)
+        new_us = _time(parse_maybe_json, text, args.repeat)
+        rows.append({
+            "case": name,
+            "bytes": len(text),
+            "legacy_us": round(legacy_us, 1),
+            "new_us": round(new_us, 1),
+            "speedup": round(legacy_us / new_us, 2) if new_us else None,
+            "legacy_type": type(legacy_parse_maybe_json(text)).__name__,
+            "new_type": type(parse_maybe_json(text)).__name__,
+        })
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'case':<20}{'bytes':>8}{'legacy us':>12}{'new us':>10}{'speedup':>9}  result (legacy -> new)")
+    for r in rows:
+        print(f"{r['case']:<20}{r['bytes']:>8}{r['legacy_us']:>12}{r['new_us']:>10}{r['speedup']:>9}  {r['legacy_type']} -> {r['new_type']}")
+
+
+if __name__ == "__main__":
+    main()
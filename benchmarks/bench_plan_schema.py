@@ -0,0 +1,151 @@
+# benchmarks/bench_plan_schema.py
+"""
+Memory per plan and serialization throughput: slotted schema + to_bytes vs the old
+dict-backed dataclasses + asdict/json.
+
+The "legacy" types below are the previous plan_schema (plain dataclasses, uuid4 ids,
+`asdict`-based to_dict). Plans carry `--subtasks` subtasks each; results carry a
+`--text-chars` markdown/JSON agent output with its parsed `json` copy, as GenericAgent
+produces them.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_plan_schema.py [--plans 20000] [--subtasks 8] [--json]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from agentic_report_swarm.core.plan_schema import CODEC_JSON, CODEC_MSGPACK, Plan, SubTask, SubtaskResult
+
+
+@dataclass
+class LegacySubTask:
+    id: str
+    type: str
+    payload: Dict[str, Any]
+    depends_on: List[str] = field(default_factory=list)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass
+class LegacyPlan:
+    plan_id: str
+    topic: str
+    subtasks: List[LegacySubTask] = field(default_factory=list)
+
+    def to_dict(self):
+        return {"plan_id": self.plan_id, "topic": self.topic, "subtasks": [st.to_dict() for st in self.subtasks]}
+
+
+@dataclass
+class LegacyResult:
+    id: str
+    success: bool
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return asdict(self)
+
+
+TYPES = ("research", "trends", "insights", "writer")
+
+
+def _legacy_plan(i, n):
+    subs = [LegacySubTask(str(uuid.uuid4()), TYPES[j % 4], {"topic": f"topic {i}"}, []) for j in range(n)]
+    for j in range(1, n):
+        subs[j].depends_on = [subs[j - 1].id]
+    return LegacyPlan(str(uuid.uuid4()), f"topic {i}", subs)
+
+
+def _plan(i, n):
+    subs = [SubTask.make(TYPES[j % 4], {"topic": f"topic {i}"}) for j in range(n)]
+    for j in range(1, n):
+        subs[j].depends_on = [subs[j - 1].id]
+    return Plan(str(uuid.uuid4()), f"topic {i}", subs)
+
+
+def _memory_per_item(build, count):
+    gc.collect()
+    tracemalloc.start()
+    items = [build(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / count
+
+
+def _throughput(fn, items):
+    t0 = time.perf_counter()
+    out = [fn(x) for x in items]
+    return len(items) / (time.perf_counter() - t0), out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--plans", type=int, default=20_000)
+    ap.add_argument("--subtasks", type=int, default=8)
+    ap.add_argument("--text-chars", type=int, default=2000)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    rows = []
+    n = args.subtasks
+    legacy_mem = _memory_per_item(lambda i: _legacy_plan(i, n), args.plans)
+    slotted_mem = _memory_per_item(lambda i: _plan(i, n), args.plans)
+
+    legacy_plans = [_legacy_plan(i, n) for i in range(args.plans)]
+    enc, blobs = _throughput(lambda p: json.dumps(p.to_dict()).encode("utf-8"), legacy_plans)
+    dec, _ = _throughput(lambda b: (lambda d: LegacyPlan(d["plan_id"], d["topic"], [LegacySubTask(**s) for s in d["subtasks"]]))(json.loads(b)), blobs)
+    rows.append({"case": "plan: dataclass + asdict/json", "bytes_per_item": round(sum(map(len, blobs)) / len(blobs)),
+                 "mem_per_item": round(legacy_mem), "encode_per_s": round(enc), "decode_per_s": round(dec)})
+
+    plans = [_plan(i, n) for i in range(args.plans)]
+    codecs = [("json", CODEC_JSON)]
+    try:
+        import msgpack  # noqa: F401
+        codecs.append(("msgpack", CODEC_MSGPACK))
+    except ImportError:
+        pass
+    for name, codec in codecs:
+        enc, blobs = _throughput(lambda p: p.to_bytes(codec=codec), plans)
+        dec, _ = _throughput(Plan.from_bytes, blobs)
+        rows.append({"case": f"plan: slotted + to_bytes ({name})", "bytes_per_item": round(sum(map(len, blobs)) / len(blobs)),
+                     "mem_per_item": round(slotted_mem), "encode_per_s": round(enc), "decode_per_s": round(dec)})
+
+    body = "\n".join(f"- fact {i}: " + "x" * 60 for i in range(args.text_chars // 70))
+    text = json.dumps({"summary": body, "facts": [f"fact {i}" for i in range(10)]})
+    output = {"text": text, "json": json.loads(text), "meta": {"agent": "research_agent", "task_id": "t1"}}
+    count = max(1, args.plans // 4)
+    legacy_results = [LegacyResult(f"t{i}", True, output) for i in range(count)]
+    enc, blobs = _throughput(lambda r: json.dumps(r.to_dict()).encode("utf-8"), legacy_results)
+    dec, _ = _throughput(lambda b: LegacyResult(**json.loads(b)), blobs)
+    rows.append({"case": "result: asdict/json", "bytes_per_item": round(sum(map(len, blobs)) / len(blobs)),
+                 "mem_per_item": None, "encode_per_s": round(enc), "decode_per_s": round(dec)})
+    results = [SubtaskResult(f"t{i}", True, output) for i in range(count)]
+    for name, codec in codecs:
+        enc, blobs = _throughput(lambda r: r.to_bytes(codec=codec), results)
+        dec, decoded = _throughput(SubtaskResult.from_bytes, blobs)
+        # forwarding a result unread (e.g. worker -> parent -> sink) re-encodes nothing
+        fwd, _ = _throughput(lambda r: r.to_bytes(codec=codec), decoded)
+        rows.append({"case": f"result: to_bytes ({name}), lazy", "bytes_per_item": round(sum(map(len, blobs)) / len(blobs)),
+                     "mem_per_item": None, "encode_per_s": round(enc), "decode_per_s": round(dec), "forward_per_s": round(fwd)})
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'case':<36}{'bytes':>8}{'mem B':>9}{'enc/s':>11}{'dec/s':>11}{'fwd/s':>11}")
+    for r in rows:
+        print(f"{r['case']:<36}{r['bytes_per_item']:>8}{str(r['mem_per_item'] or '-'):>9}"
+              f"{r['encode_per_s']:>11}{r['decode_per_s']:>11}{str(r.get('forward_per_s', '-')):>11}")
+
+
+if __name__ == "__main__":
+    main()
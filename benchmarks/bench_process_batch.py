@@ -0,0 +1,69 @@
+# benchmarks/bench_process_batch.py
+"""
+Batch throughput on a CPU-bound workload: one process (threads) vs worker processes.
+
+The fake LLM answers instantly with a large fenced-JSON response (`--response-kb`),
+so time goes to prompt rendering, parse_maybe_json and aggregation - the parts that
+share one GIL in a single process. Each process count runs the same topics through
+`run_batch(processes=N)`; 0 is the threaded in-process runner. Expect near-linear
+scaling up to the number of physical cores (reported as `cpus`).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_process_batch.py [--topics 400] [--processes 0,1,2,4,8] [--json]
+"""
+import argparse
+import functools
+import json
+import os
+
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.orchestrator.batch_runner import run_batch
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+
+def _response(size_kb: int, prompt: str) -> str:
+    items = [{"name": f"finding {i}", "detail": "d" * 80, "score": i % 7} for i in range(max(1, size_kb * 1024 // 120))]
+    return "Here is the analysis:\n```json\n" + json.dumps({"items": items}) + "\n```\n"
+
+
+def build_factory(size_kb: int) -> AgentFactory:
+    # module-level (and wrapped in functools.partial) so worker processes can unpickle it
+    return AgentFactory(llm_client=LLMClient(FakeLLMAdapter(response=functools.partial(_response, size_kb))))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--topics", type=int, default=400)
+    ap.add_argument("--processes", default="0,1,2,4,8", help="comma-separated process counts (0 = in-process threads)")
+    ap.add_argument("--concurrency", type=int, default=4, help="topics in flight per process")
+    ap.add_argument("--response-kb", type=int, default=64)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    builder = functools.partial(build_factory, args.response_kb)
+    topics = [f"topic {i}" for i in range(args.topics)]
+    rows = []
+    for n in (int(x) for x in args.processes.split(",")):
+        if n > 0:
+            summary = run_batch(topics, processes=n, factory_builder=builder, max_concurrency=args.concurrency)
+        else:
+            summary = run_batch(topics, agent_factory=builder(), max_concurrency=args.concurrency)
+        assert summary["failed"] == 0, summary
+        rows.append({"processes": n, "elapsed_s": summary["elapsed_s"],
+                     "reports_per_s": round(args.topics / summary["elapsed_s"], 1)})
+    base = rows[0]["reports_per_s"]
+    for r in rows:
+        r["speedup"] = round(r["reports_per_s"] / base, 2)
+
+    if args.json:
+        print(json.dumps({"cpus": os.cpu_count(), "rows": rows}, indent=2))
+        return
+    print(f"cpus={os.cpu_count()} topics={args.topics} response={args.response_kb}KB")
+    print(f"{'processes':>10}{'elapsed s':>11}{'reports/s':>11}{'speedup':>9}")
+    for r in rows:
+        print(f"{r['processes']:>10}{r['elapsed_s']:>11}{r['reports_per_s']:>11}{r['speedup']:>9}")
+
+
+if __name__ == "__main__":
+    main()
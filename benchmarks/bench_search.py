@@ -0,0 +1,116 @@
+# benchmarks/bench_search.py
+"""
+Indexing throughput and query latency benchmark for the offline BM25 SearchIndex.
+
+The corpus is synthetic: `--docs` documents of ~`--doc-len` terms drawn from a
+Zipf-distributed vocabulary, written as JSONL shards (`--shard-docs` per file) into
+a temporary directory and indexed with `index_directory`. Queries are 2-4 terms
+sampled from the mid-frequency vocabulary. Reports cold single-query latency
+(cache cleared), cached latency, batched throughput and incremental re-index time
+after one shard changes.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_search.py [--docs 100000] [--queries 200] [--json]
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from agentic_report_swarm.agents.tools.search_tool import SearchIndex
+
+
+def _pcts(lat):
+    lat = sorted(lat)
+    return round(lat[len(lat) // 2], 3), round(lat[min(len(lat) - 1, int(len(lat) * 0.95))], 3)
+
+
+def _write_corpus(root: Path, docs: int, doc_len: int, vocab: int, shard_docs: int, rng: random.Random):
+    words = [f"w{i}" for i in range(vocab)]
+    cum_weights = list(itertools.accumulate(1.0 / (i + 1) for i in range(vocab)))
+    for shard in range(0, docs, shard_docs):
+        with open(root / f"shard-{shard // shard_docs:05d}.jsonl", "w", encoding="utf-8") as fh:
+            for i in range(shard, min(docs, shard + shard_docs)):
+                text = " ".join(rng.choices(words, cum_weights=cum_weights, k=doc_len))
+                fh.write(json.dumps({"id": f"d{i}", "text": text}) + "\n")
+    return words
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--docs", type=int, default=100_000)
+    ap.add_argument("--doc-len", type=int, default=80)
+    ap.add_argument("--vocab", type=int, default=50_000)
+    ap.add_argument("--shard-docs", type=int, default=10_000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--batch", type=int, default=32)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "corpus"
+        corpus.mkdir()
+        words = _write_corpus(corpus, args.docs, args.doc_len, args.vocab, args.shard_docs, rng)
+
+        index = SearchIndex(Path(tmp) / "index")
+        t0 = time.perf_counter()
+        index.index_directory(corpus)
+        index_s = time.perf_counter() - t0
+        index_bytes = sum(f.stat().st_size for f in (Path(tmp) / "index").iterdir())
+
+        mid = words[50:5000]
+        queries = [" ".join(rng.sample(mid, rng.randint(2, 4))) for _ in range(args.queries)]
+
+        cold = []
+        for q in queries:
+            index.clear_cache()
+            t0 = time.perf_counter()
+            index.search(q, k=args.k)
+            cold.append((time.perf_counter() - t0) * 1000.0)
+        for q in queries:
+            index.search(q, k=args.k)  # prime the result cache
+        warm = []
+        for q in queries:
+            t0 = time.perf_counter()
+            index.search(q, k=args.k)
+            warm.append((time.perf_counter() - t0) * 1000.0)
+
+        index.clear_cache()
+        t0 = time.perf_counter()
+        for start in range(0, len(queries), args.batch):
+            index.search_batch(queries[start:start + args.batch], k=args.k)
+        batch_s = time.perf_counter() - t0
+
+        shard = corpus / "shard-00000.jsonl"
+        with open(shard, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"id": "new", "text": "freshly added document"}) + "\n")
+        os.utime(shard)
+        t0 = time.perf_counter()
+        index.index_directory(corpus)
+        reindex_s = time.perf_counter() - t0
+        index.close()
+
+    cold_p50, cold_p95 = _pcts(cold)
+    warm_p50, warm_p95 = _pcts(warm)
+    row = {
+        "docs": args.docs, "index_s": round(index_s, 2), "docs_per_s": round(args.docs / index_s),
+        "index_mb": round(index_bytes / 2**20, 1),
+        "cold_p50_ms": cold_p50, "cold_p95_ms": cold_p95, "cached_p50_ms": warm_p50, "cached_p95_ms": warm_p95,
+        "batch_queries_per_s": round(len(queries) / batch_s, 1), "reindex_one_shard_s": round(reindex_s, 2),
+    }
+    if args.json:
+        print(json.dumps(row, indent=2))
+        return
+    for key, value in row.items():
+        print(f"{key:<22}{value:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# benchmarks/bench_suite.py
+"""
+Offline end-to-end benchmark suite for the report pipeline, with baseline comparison.
+
+Everything runs against FakeLLMAdapter (no network). The LLM is given a log-normal
+latency (`--latency-ms` median), a decode speed (`--tokens-per-s`) and, for the
+retry case, a transient failure rate (`--failure-rate`). Measured:
+
+    render.*          GenericAgent prompt rendering per template (us/op)
+    parse_json.*      parse_maybe_json on typical LLM outputs (us/op)
+    aggregate.wN      aggregate_to_markdown for a plan of width N (us/op)
+    scheduler.wN      execute_plan overhead per subtask, zero-latency LLM (us/subtask)
+    plan.wN           execute_plan wall time, fan-out of width N with LLM latency (ms)
+    run_topic.*       single-report latency p50/p95 and multi-topic throughput
+
+Every metric has a unit and a direction. `--baseline FILE` compares against a stored
+run and exits 1 when a metric got worse by more than `--tolerance` (relative);
+`--save FILE` stores this run as the new baseline. CPU-bound metrics (us/op) are
+compared after scaling by `calibration` (a fixed pure-Python loop, timed before
+and after the CPU benchmarks in both runs), so a slower machine does not read as
+a regression; pass `--no-normalize` to compare raw numbers. A CPU metric flagged
+as a regression is re-measured (`--rechecks` times, calibration timed right around
+it) and only fails the run if every re-measurement is still past the tolerance,
+which keeps a noisy neighbour from failing an unchanged tree.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_suite.py --save benchmarks/baseline.json
+    PYTHONPATH=src python benchmarks/bench_suite.py --baseline benchmarks/baseline.json [--quick] [--json]
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter, lognormal_latency
+from agentic_report_swarm.agents.generic_agent import GenericAgent
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.orchestrator.batch_runner import run_batch
+from agentic_report_swarm.orchestrator.super_agent import aggregate_to_markdown, run_topic
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.utils.llm_json import parse_maybe_json
+from agentic_report_swarm.utils.retry import RetryPolicy
+from agentic_report_swarm.utils.template_registry import TemplateRegistry
+
+SUITE_VERSION = 1
+STATIC = {t: {"prompt": t + " on {{ task.payload.topic }}"} for t in ("research", "trends", "insights", "writer")}
+
+SAMPLE_OUTPUTS = {
+    "plain": json.dumps({"facts": [f"fact {i}" for i in range(20)], "summary": "s" * 400}),
+    "fenced": "Here you go:\n```json\n" + json.dumps({"trends": [{"name": f"t{i}", "why": "w" * 40} for i in range(10)]}) + "\n```\nDone.",
+    "prose": "Intro text. " * 40 + json.dumps({"insights": ["a", "b", "c"]}) + " trailing commentary." * 10,
+    "markdown": "\n".join(f"- point {i}: " + "x" * 60 for i in range(40)),
+}
+
+
+def _per_op_us(fn, min_time=0.2, repeat=5):
+    """Best-of-`repeat` microseconds per call, each run looping for at least `min_time` seconds."""
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        took = time.perf_counter() - t0
+        if took >= min_time / 10 or n >= 1 << 20:
+            break
+        n *= 4
+    loops = max(1, int(n * (min_time / max(took, 1e-9))))
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / loops)
+    return best * 1e6
+
+
+def _pct(vals, q):
+    vals = sorted(vals)
+    return vals[max(0, min(len(vals) - 1, math.ceil(q * len(vals)) - 1))]
+
+
+def _fanout_plan(width: int) -> Plan:
+    subtasks = [SubTask(id=f"r{i}", type="research", payload={"topic": f"segment {i}"}) for i in range(width)]
+    subtasks.append(SubTask(id="w", type="writer", payload={"topic": "all"}, depends_on=[st.id for st in subtasks]))
+    return Plan(plan_id="bench", topic="bench", subtasks=subtasks)
+
+
+def _calibration_work():
+    d = {}
+    for i in range(200):
+        d[str(i)] = i * i
+    return sorted(d, key=d.get)
+
+
+class Suite:
+    def __init__(self, args):
+        self.args = args
+        self.metrics = {}
+        # cpu metric name -> zero-arg callable re-measuring it (for rechecks)
+        self.measures = {}
+
+    def record(self, name, value, unit, better="lower", cpu=False):
+        self.metrics[name] = {"value": round(value, 3), "unit": unit, "better": better, "cpu": cpu}
+
+    def record_cpu(self, name, fn, unit="us/op", per=1, repeat=5):
+        measure = lambda: _per_op_us(fn, self.args.min_time, repeat) / per  # noqa: E731
+        self.measures[name] = measure
+        self.record(name, measure(), unit, cpu=True)
+
+    def calibrate(self):
+        return _per_op_us(_calibration_work, self.args.min_time)
+
+    def backend(self, **kw):
+        a = self.args
+        kw.setdefault("latency_dist", lognormal_latency(a.latency_ms / 1000.0, a.sigma))
+        kw.setdefault("tokens_per_s", a.tokens_per_s)
+        kw.setdefault("response", lambda p: "- finding " + p[:200])
+        return FakeLLMAdapter(seed=a.seed, **kw)
+
+    def bench_render(self):
+        templates = dict(TemplateRegistry.shared(None).templates)
+        upstream_task = {"id": "t3", "type": "insights", "payload": {"topic": "EV market in Indonesia"}}
+        for name, tpl in sorted(templates.items()):
+            agent = GenericAgent(f"{name}_agent", template=tpl)
+            self.record_cpu(f"render.{name}", lambda agent=agent: agent._render_prompt(upstream_task))
+
+    def bench_parse(self):
+        for name, text in SAMPLE_OUTPUTS.items():
+            self.record_cpu(f"parse_json.{name}", lambda text=text: parse_maybe_json(text))
+
+    def bench_aggregate(self):
+        for width in self.args.widths:
+            plan = _fanout_plan(width)
+            results = {st.id: {"id": st.id, "success": True, "output": {"text": "body " * 80}} for st in plan.subtasks}
+            self.record_cpu(f"aggregate.w{width}", lambda plan=plan, results=results: aggregate_to_markdown(plan, results))
+
+    def bench_scheduler(self):
+        af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter()), templates=STATIC)
+        for width in self.args.widths:
+            plan = _fanout_plan(width)
+            mgr = SwarmManager(agent_factory=af, max_workers=self.args.workers)
+            self.record_cpu(f"scheduler.w{width}", lambda mgr=mgr, plan=plan: mgr.execute_plan(plan), "us/subtask",
+                            per=len(plan.subtasks), repeat=2)
+
+    def bench_plan_latency(self):
+        for width in self.args.widths:
+            plan = _fanout_plan(width)
+            af = AgentFactory(llm_client=LLMClient(self.backend()), templates=STATIC)
+            mgr = SwarmManager(agent_factory=af, max_workers=self.args.workers)
+            lat = []
+            for _ in range(self.args.repeats):
+                t0 = time.perf_counter()
+                mgr.execute_plan(plan)
+                lat.append((time.perf_counter() - t0) * 1000.0)
+            self.record(f"plan.w{width}.p50", _pct(lat, 0.5), "ms")
+
+    def bench_run_topic(self):
+        a = self.args
+        af = AgentFactory(llm_client=LLMClient(self.backend()), templates=STATIC)
+        lat = []
+        for i in range(a.repeats * 2):
+            t0 = time.perf_counter()
+            run_topic(f"topic {i}", agent_factory=af, max_workers=a.workers)
+            lat.append((time.perf_counter() - t0) * 1000.0)
+        self.record("run_topic.p50", _pct(lat, 0.5), "ms")
+        self.record("run_topic.p95", _pct(lat, 0.95), "ms")
+
+        retrying = LLMClient(self.backend(failure_rate=a.failure_rate),
+                             retry_policy=RetryPolicy(max_attempts=6, base_delay=0.005, max_delay=0.05))
+        af = AgentFactory(llm_client=retrying, templates=STATIC)
+        lat = []
+        for i in range(a.repeats * 2):
+            t0 = time.perf_counter()
+            run_topic(f"topic {i}", agent_factory=af, max_workers=a.workers)
+            lat.append((time.perf_counter() - t0) * 1000.0)
+        self.record("run_topic.with_failures.p95", _pct(lat, 0.95), "ms")
+
+        for topics in a.topic_counts:
+            af = AgentFactory(llm_client=LLMClient(self.backend()), templates=STATIC)
+            summary = run_batch([f"topic {i}" for i in range(topics)], agent_factory=af,
+                                max_concurrency=a.concurrency, max_workers=a.workers)
+            self.record(f"run_topic.batch{topics}.reports_per_s", topics / summary["elapsed_s"], "reports/s", better="higher")
+
+    def run(self):
+        calibration = [self.calibrate()]
+        for step in (self.bench_render, self.bench_parse, self.bench_aggregate, self.bench_scheduler):
+            step()
+        calibration.append(self.calibrate())
+        self.record("calibration", min(calibration), "us/op", cpu=True)
+        for step in (self.bench_plan_latency, self.bench_run_topic):
+            step()
+        return {
+            "suite_version": SUITE_VERSION,
+            "python": platform.python_version(),
+            "config": {k: v for k, v in vars(self.args).items() if k not in ("baseline", "save", "json", "normalize", "rechecks")},
+            "metrics": self.metrics,
+        }
+
+
+def _base_calibration(baseline, normalize):
+    cal = baseline.get("metrics", {}).get("calibration")
+    return cal["value"] if normalize and cal and cal["value"] else None
+
+
+def _status(change, better, tolerance):
+    worse = change > tolerance if better == "lower" else change < -tolerance
+    improved = change < -tolerance if better == "lower" else change > tolerance
+    return "REGRESSION" if worse else ("improved" if improved else "ok")
+
+
+def compare(current, baseline, tolerance, normalize=True):
+    """Rows {name, base, value, change, status}; `change` of cpu metrics is calibration-scaled."""
+    base_metrics = baseline.get("metrics", {})
+    base_cal = _base_calibration(baseline, normalize)
+    speed = current["metrics"]["calibration"]["value"] / base_cal if base_cal else 1.0
+    rows = []
+    for name, m in current["metrics"].items():
+        b = base_metrics.get(name)
+        if b is None:
+            rows.append({"name": name, "base": None, "value": m["value"], "change": None, "status": "new"})
+            continue
+        if name == "calibration":
+            continue
+        base = b["value"]
+        value = m["value"] / speed if m.get("cpu") else m["value"]
+        change = (value - base) / base if base else 0.0
+        rows.append({"name": name, "base": base, "value": m["value"], "change": round(change, 4),
+                     "status": _status(change, m["better"], tolerance)})
+    return rows
+
+
+def recheck(suite, rows, baseline, tolerance, normalize=True, attempts=3):
+    """Re-measure flagged cpu metrics; a row stays a REGRESSION only if every attempt is past tolerance."""
+    base_cal = _base_calibration(baseline, normalize)
+    for r in rows:
+        measure = suite.measures.get(r["name"])
+        if r["status"] != "REGRESSION" or measure is None or not r["base"]:
+            continue
+        for attempt in range(1, attempts + 1):
+            # calibrate right around the metric, so both see the same machine load
+            before = suite.calibrate()
+            value = measure()
+            speed = min(before, suite.calibrate()) / base_cal if base_cal else 1.0
+            change = (value / speed - r["base"]) / r["base"]
+            r.update(rechecked=attempt, change=round(min(r["change"], change), 4))
+            r["status"] = _status(r["change"], "lower", tolerance)
+            if r["status"] != "REGRESSION":
+                break
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--quick", action="store_true", help="smaller widths/repeats for a fast smoke run")
+    ap.add_argument("--widths", type=lambda s: [int(x) for x in s.split(",")], default=[1, 8, 32, 128])
+    ap.add_argument("--topic-counts", type=lambda s: [int(x) for x in s.split(",")], default=[16, 64])
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--repeats", type=int, default=10)
+    ap.add_argument("--latency-ms", type=float, default=20.0)
+    ap.add_argument("--sigma", type=float, default=0.5)
+    ap.add_argument("--tokens-per-s", type=float, default=2000.0)
+    ap.add_argument("--failure-rate", type=float, default=0.05)
+    ap.add_argument("--min-time", type=float, default=0.2, help="seconds per micro-benchmark measurement")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--baseline", default=None, help="compare against this stored run")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="relative change tolerated before a regression")
+    ap.add_argument("--rechecks", type=int, default=3, help="re-measurements of a flagged cpu metric before failing")
+    ap.add_argument("--no-normalize", dest="normalize", action="store_false",
+                    help="compare cpu metrics raw, without calibration scaling")
+    ap.add_argument("--save", default=None, help="write this run (JSON) to this path")
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+    if args.quick:
+        args.widths, args.topic_counts, args.repeats, args.min_time = [1, 8], [8], 3, 0.05
+
+    suite = Suite(args)
+    current = suite.run()
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+            fh.write("\n")
+
+    rows = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        rows = recheck(suite, compare(current, baseline, args.tolerance, args.normalize), baseline,
+                       args.tolerance, args.normalize, args.rechecks)
+
+    if args.json:
+        print(json.dumps({"run": current, "comparison": rows}, indent=2))
+    elif rows is None:
+        print(f"{'metric':<34}{'value':>12}  unit")
+        for name, m in current["metrics"].items():
+            print(f"{name:<34}{m['value']:>12}  {m['unit']}")
+    else:
+        print(f"{'metric':<34}{'baseline':>12}{'current':>12}{'change':>9}  status")
+        for r in rows:
+            change = f"{r['change'] * 100:+.1f}%" if r["change"] is not None else "-"
+            note = f" (rechecked x{r['rechecked']})" if r.get("rechecked") else ""
+            print(f"{r['name']:<34}{str(r['base']):>12}{r['value']:>12}{change:>9}  {r['status']}{note}")
+    if rows and any(r["status"] == "REGRESSION" for r in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
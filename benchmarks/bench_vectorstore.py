@@ -0,0 +1,87 @@
+# benchmarks/bench_vectorstore.py
+"""
+Query latency and recall benchmark for VectorStore (exact vs IVF) by collection size.
+
+Data is synthetic clustered float32 vectors (`--clusters` Gaussian blobs), which
+is closer to real embedding distributions than uniform noise. Recall@k is the
+overlap of the IVF top-k with the exact top-k for the same queries.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_vectorstore.py [--sizes 10000,100000,1000000] [--dim 128]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from agentic_report_swarm.memory.vectorstore import VectorStore
+
+
+def _dataset(n, dim, clusters, rng):
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    out = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, 100_000):
+        m = min(100_000, n - start)
+        out[start:start + m] = centers[rng.integers(0, clusters, m)] + 0.35 * rng.normal(size=(m, dim)).astype(np.float32)
+    return out
+
+
+def _timed_search(store, queries, k, **kwargs):
+    lat = []
+    results = []
+    for q in queries:
+        t0 = time.perf_counter()
+        results.append(store.search(q, k=k, **kwargs)[0])
+        lat.append((time.perf_counter() - t0) * 1000.0)
+    lat.sort()
+    return results, lat[len(lat) // 2], lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", default="10000,100000", help="comma-separated collection sizes (e.g. add 1000000)")
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--queries", type=int, default=100)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--clusters", type=int, default=200)
+    ap.add_argument("--n-probe", type=int, default=8)
+    ap.add_argument("--json", action="store_true", help="print results as JSON")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        data = _dataset(size + args.queries, args.dim, args.clusters, rng)
+        queries, data = data[:args.queries], data[args.queries:]
+        store = VectorStore(dim=args.dim, initial_capacity=size)
+        store.add(data, ids=[str(i) for i in range(size)])
+
+        exact, exact_p50, exact_p95 = _timed_search(store, queries, args.k, exact=True)
+        batch_t0 = time.perf_counter()
+        store.search(queries, k=args.k, exact=True)
+        batch_ms = (time.perf_counter() - batch_t0) * 1000.0 / args.queries
+
+        t0 = time.perf_counter()
+        store.build_index(n_probe=args.n_probe)
+        build_s = time.perf_counter() - t0
+        approx, ivf_p50, ivf_p95 = _timed_search(store, queries, args.k)
+        recall = np.mean([len({a for a, _ in x} & {b for b, _ in y}) / args.k for x, y in zip(exact, approx)])
+        rows.append({
+            "size": size,
+            "exact_p50_ms": round(exact_p50, 3), "exact_p95_ms": round(exact_p95, 3),
+            "exact_batched_ms_per_query": round(batch_ms, 3),
+            "ivf_lists": store.index.n_lists, "ivf_build_s": round(build_s, 2),
+            "ivf_p50_ms": round(ivf_p50, 3), "ivf_p95_ms": round(ivf_p95, 3),
+            f"recall@{args.k}": round(float(recall), 3),
+        })
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    for r in rows:
+        print("  ".join(f"{k}={v}" for k, v in r.items()))
+
+
+if __name__ == "__main__":
+    main()
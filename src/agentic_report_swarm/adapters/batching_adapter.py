@@ -0,0 +1,180 @@
+# src/agentic_report_swarm/adapters/batching_adapter.py
+"""
+Request micro-batching for the LLM layer.
+
+BatchingAdapter wraps any adapter exposing `generate`. Calls arriving within a
+short window are coalesced into one `generate_batch(prompts, **kwargs)` request
+when the wrapped adapter supports it (e.g. RealOpenAIAdapter: the legacy
+completions endpoint accepts a prompt list); results are fanned back out to the
+waiting callers. Only calls with identical generation kwargs share a batch;
+transport kwargs (`timeout`) are not part of that key. A batch is sent with the
+tightest remaining timeout of its members, and a caller whose timeout passes
+while its prompt is still queued gets TimeoutError without it being sent.
+Adapters without `generate_batch` are called directly (no batching).
+
+Usage:
+    adapter = BatchingAdapter(RealOpenAIAdapter(), max_batch_size=16, max_wait_ms=10)
+    client = LLMClient(adapter)
+"""
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Dict, List, Tuple
+
+from .cache_adapter import NON_KEY_KWARGS
+
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT_MS = 10.0
+
+
+class BatchingAdapter:
+    def __init__(
+        self,
+        adapter,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_inflight_batches: int = 4,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.adapter = adapter
+        self.model = getattr(adapter, "model", None)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._can_batch = callable(getattr(adapter, "generate_batch", None))
+        # kwargs key -> (first arrival time, [(prompt, kwargs, future, expires_at), ...])
+        self._pending: Dict[str, Tuple[float, List[tuple]]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._dispatcher = None
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight_batches, thread_name_prefix="llm-batch")
+        self._stats = {"calls": 0, "batches": 0}
+
+    @staticmethod
+    def _kwargs_key(kwargs: Dict[str, Any]) -> str:
+        return json.dumps({k: v for k, v in kwargs.items() if k not in NON_KEY_KWARGS}, sort_keys=True, default=str)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="llm-batch-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def submit(self, prompt: str, **kwargs) -> Future:
+        """Enqueue a prompt and return a Future resolving to its completion text."""
+        fut: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchingAdapter is closed")
+            self._stats["calls"] += 1
+            key = self._kwargs_key(kwargs)
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = (time.monotonic(), [])
+                self._pending[key] = entry
+            timeout = kwargs.get("timeout")
+            entry[1].append((prompt, kwargs, fut, time.monotonic() + timeout if timeout is not None else None))
+            self._ensure_dispatcher()
+            self._cond.notify()
+        return fut
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        if not self._can_batch:
+            return self.adapter.generate(prompt, **kwargs)
+        fut = self.submit(prompt, **kwargs)
+        try:
+            return fut.result(timeout=kwargs.get("timeout"))
+        except FutureTimeout:
+            fut.cancel()
+            raise TimeoutError("batched LLM request timed out") from None
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        if not self._can_batch:
+            return await asyncio.to_thread(self.adapter.generate, prompt, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.submit(prompt, **kwargs)), kwargs.get("timeout"))
+        except asyncio.TimeoutError:
+            raise TimeoutError("batched LLM request timed out") from None
+
+    def _take_ready_batch(self) -> Tuple[List[tuple], float]:
+        """Pop one batch that is full or whose window expired; else return the time to wait."""
+        now = time.monotonic()
+        wait_for = None
+        for key, (first_ts, items) in self._pending.items():
+            if len(items) >= self.max_batch_size or now - first_ts >= self.max_wait:
+                batch, rest = items[: self.max_batch_size], items[self.max_batch_size:]
+                if rest:
+                    self._pending[key] = (now, rest)
+                else:
+                    del self._pending[key]
+                return batch, 0.0
+            remaining = first_ts + self.max_wait - now
+            wait_for = remaining if wait_for is None else min(wait_for, remaining)
+        return [], wait_for
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                batch, wait_for = self._take_ready_batch()
+                if not batch:
+                    # flush everything immediately once closing
+                    if not self._closed:
+                        self._cond.wait(wait_for)
+                        continue
+                    key = next(iter(self._pending))
+                    batch = self._pending.pop(key)[1]
+                self._stats["batches"] += 1
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch: List[tuple]) -> None:
+        now = time.monotonic()
+        live = []
+        for item in batch:
+            _, _, fut, expires = item
+            if not fut.set_running_or_notify_cancel():
+                continue  # caller gave up while queued
+            if expires is not None and expires <= now:
+                fut.set_exception(TimeoutError("batched LLM request timed out before dispatch"))
+                continue
+            live.append(item)
+        if not live:
+            return
+        batch = live
+        prompts = [item[0] for item in batch]
+        kwargs = {k: v for k, v in batch[0][1].items() if k not in NON_KEY_KWARGS}
+        expiries = [item[3] for item in batch if item[3] is not None]
+        if expiries:
+            kwargs["timeout"] = min(expiries) - now
+        try:
+            if len(batch) == 1:
+                outputs = [self.adapter.generate(prompts[0], **kwargs)]
+            else:
+                outputs = self.adapter.generate_batch(prompts, **kwargs)
+            if len(outputs) != len(batch):
+                raise RuntimeError(f"generate_batch returned {len(outputs)} results for {len(batch)} prompts")
+        except Exception as e:
+            for _, _, fut, _ in batch:
+                fut.set_exception(e)
+            return
+        for (_, _, fut, _), out in zip(batch, outputs):
+            fut.set_result(out)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = dict(self._stats)
+        out["avg_batch_size"] = out["calls"] / out["batches"] if out["batches"] else 0.0
+        return out
+
+    def close(self) -> None:
+        """Flush pending calls and stop the dispatcher."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,214 @@
+# src/agentic_report_swarm/adapters/cache_adapter.py
+"""
+Content-addressed response cache that wraps any adapter exposing `generate`.
+
+Keys are sha256 over (model, prompt, generation kwargs). Two tiers:
+- MemoryLRU: bounded in-process LRU with optional TTL.
+- SQLiteStore: optional on-disk tier (stdlib sqlite3) that survives restarts.
+
+Usage:
+    adapter = CachingAdapter(RealOpenAIAdapter(), max_entries=4096, ttl=86400, disk_path=".cache/llm.sqlite")
+    client = LLMClient(adapter)
+    adapter.stats()  # {"hits": ..., "misses": ..., ...}
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+# kwargs that control transport, not generation -> never part of the cache key
+NON_KEY_KWARGS = frozenset({"timeout"})
+
+
+def cache_key(model: Optional[str], prompt: str, kwargs: Dict[str, Any]) -> str:
+    gen_kwargs = {k: v for k, v in kwargs.items() if k not in NON_KEY_KWARGS}
+    raw = json.dumps({"model": model, "prompt": prompt, "kwargs": gen_kwargs}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class MemoryLRU:
+    """Thread-safe LRU with a size bound and optional TTL (seconds)."""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteStore:
+    """On-disk tier. Entries older than `ttl` seconds are treated as misses and purged lazily."""
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl is not None and created + self.ttl < time.time():
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingAdapter:
+    """
+    Wrap an adapter with a memory LRU (+ optional SQLite) response cache.
+    Only successful responses are cached; errors always propagate.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        disk_path: Optional[Union[str, Path]] = None,
+        disk_ttl: Optional[float] = None,
+        model: Optional[str] = None,
+    ):
+        self.adapter = adapter
+        self.model = model or getattr(adapter, "model", None)
+        self.memory = MemoryLRU(max_entries=max_entries, ttl=ttl)
+        self.disk = SQLiteStore(disk_path, ttl=disk_ttl if disk_ttl is not None else ttl) if disk_path else None
+        self._counts = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0}
+        self._count_lock = threading.Lock()
+
+    def _count(self, *names: str) -> None:
+        with self._count_lock:
+            for n in names:
+                self._counts[n] += 1
+
+    def _lookup(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("hits", "memory_hits")
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("hits", "disk_hits")
+                return value
+        self._count("misses")
+        return None
+
+    def _store(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = cache_key(self.model, prompt, kwargs)
+        value = self._lookup(key)
+        if value is not None:
+            return value
+        value = self.adapter.generate(prompt, **kwargs)
+        self._store(key, value)
+        return value
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        key = cache_key(self.model, prompt, kwargs)
+        value = self._lookup(key)
+        if value is not None:
+            return value
+        agenerate = getattr(self.adapter, "agenerate", None)
+        if agenerate is not None:
+            value = await agenerate(prompt, **kwargs)
+        else:
+            value = await asyncio.to_thread(self.adapter.generate, prompt, **kwargs)
+        self._store(key, value)
+        return value
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Cache hits are yielded as one chunk; misses stream through and are stored once complete."""
+        key = cache_key(self.model, prompt, kwargs)
+        value = self._lookup(key)
+        if value is not None:
+            yield value
+            return
+        stream = getattr(self.adapter, "stream", None)
+        if stream is None:
+            value = self.adapter.generate(prompt, **kwargs)
+            self._store(key, value)
+            yield value
+            return
+        chunks = []
+        for chunk in stream(prompt, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self._store(key, "".join(chunks))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._count_lock:
+            out: Dict[str, Any] = dict(self._counts)
+        total = out["hits"] + out["misses"]
+        out["hit_rate"] = out["hits"] / total if total else 0.0
+        out["memory_entries"] = len(self.memory)
+        return out
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
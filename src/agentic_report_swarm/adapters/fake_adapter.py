@@ -0,0 +1,188 @@
+# src/agentic_report_swarm/adapters/fake_adapter.py
+"""
+Offline fake LLM backend for tests and benchmarks (no network).
+
+FakeLLMAdapter simulates request latency and a server-side concurrency limit
+(how many requests the backend / connection pool serves at once). It supports
+`generate`, `agenerate` and the multi-prompt `generate_batch`, where one request
+carrying N prompts costs `latency + N * per_prompt_latency`.
+
+Fault injection: `fail_first` (first N requests fail), `failure_rate` (random
+transient 503s) and `rate_limit=(max_requests, window_s)` which answers with a
+429 `RateLimitError` (carrying retry_after) once the window budget is spent.
+
+Tail latency: `latency_dist(rng) -> seconds` replaces the fixed `latency` per
+request (see `lognormal_latency` / `bimodal_latency`). A per-call `timeout` kwarg
+is honoured like a real client: the call gives up after `timeout` seconds with
+TimeoutError. `stream` spreads the request cost over word chunks, so a consumer
+that stops reading (cancellation) stops the simulated work too.
+
+Token throughput: with `tokens_per_s`, each response also costs its (estimated)
+completion tokens / tokens_per_s, so long outputs are slower like real decoding.
+"""
+import asyncio
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from ..utils.logging import annotate
+from ..utils.retry import RateLimitError, TransientLLMError
+
+LatencyDist = Callable[[random.Random], float]
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDist:
+    """Log-normal request latency with the given median (seconds)."""
+    return lambda rng: median * math.exp(sigma * rng.gauss(0.0, 1.0))
+
+
+def bimodal_latency(fast: float, slow: float, p_slow: float = 0.05) -> LatencyDist:
+    """Mostly `fast`, but a `p_slow` fraction of requests take `slow` seconds (a straggler tail)."""
+    return lambda rng: slow if rng.random() < p_slow else fast
+
+
+class FakeLLMAdapter:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        per_prompt_latency: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        response: Optional[Union[str, Callable[[str], str]]] = None,
+        model: str = "fake-model",
+        fail_first: int = 0,
+        failure_rate: float = 0.0,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        seed: Optional[int] = None,
+        latency_dist: Optional[LatencyDist] = None,
+        tokens_per_s: Optional[float] = None,
+    ):
+        self.latency = latency
+        self.per_prompt_latency = per_prompt_latency
+        self.response = response
+        self.model = model
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._lock = threading.Lock()
+        self.fail_first = fail_first
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit
+        self.latency_dist = latency_dist
+        self.tokens_per_s = tokens_per_s
+        self._rng = random.Random(seed)
+        self._window: "deque[float]" = deque()
+        self.requests = 0
+        self.prompts = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self.timeouts = 0
+
+    def _respond(self, prompt: str) -> str:
+        if self.response is None:
+            return f"[FAKE] {prompt}"
+        if callable(self.response):
+            return self.response(prompt)
+        return self.response
+
+    def _request_cost(self, n_prompts: int, completion_tokens: int = 0) -> float:
+        base = self.latency
+        if self.latency_dist is not None:
+            with self._lock:
+                base = max(0.0, self.latency_dist(self._rng))
+        if self.tokens_per_s:
+            base += completion_tokens / self.tokens_per_s
+        return base + n_prompts * self.per_prompt_latency
+
+    def _timed_out(self) -> TimeoutError:
+        with self._lock:
+            self.timeouts += 1
+        return TimeoutError("fake LLM request timed out")
+
+    def _record(self, n_prompts: int) -> None:
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit is not None:
+                max_requests, window = self.rate_limit
+                now = time.monotonic()
+                while self._window and self._window[0] <= now - window:
+                    self._window.popleft()
+                if len(self._window) >= max_requests:
+                    self.rate_limited += 1
+                    raise RateLimitError(retry_after=self._window[0] + window - now)
+                self._window.append(now)
+            if self.requests <= self.fail_first or (self.failure_rate and self._rng.random() < self.failure_rate):
+                self.failures += 1
+                raise TransientLLMError("injected transient failure")
+            self.prompts += n_prompts
+
+    def _serve(self, n_prompts: int, timeout: Optional[float] = None, completion_tokens: int = 0) -> None:
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            self._record(n_prompts)
+            cost = self._request_cost(n_prompts, completion_tokens)
+            if timeout is not None and cost > timeout:
+                time.sleep(timeout)
+                raise self._timed_out()
+            if cost > 0:
+                time.sleep(cost)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return max(1, len(text) // 4)
+
+    def _completion_tokens(self, out: str) -> int:
+        return self.estimate_tokens(out) if self.tokens_per_s else 0
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        out = self._respond(prompt)
+        self._serve(1, kwargs.get("timeout"), self._completion_tokens(out))
+        annotate(prompt_tokens=self.estimate_tokens(prompt), completion_tokens=self.estimate_tokens(out))
+        return out
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        outs = [self._respond(p) for p in prompts]
+        self._serve(len(prompts), kwargs.get("timeout"), sum(self._completion_tokens(o) for o in outs))
+        return outs
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        if self._slots is not None:
+            # keep the simulated server limit without blocking the event loop
+            return await asyncio.to_thread(self.generate, prompt, **kwargs)
+        out = self._respond(prompt)
+        self._record(1)
+        cost = self._request_cost(1, self._completion_tokens(out))
+        timeout = kwargs.get("timeout")
+        if timeout is not None and cost > timeout:
+            await asyncio.sleep(timeout)
+            raise self._timed_out()
+        if cost > 0:
+            await asyncio.sleep(cost)
+        return out
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        # no server-slot limit here: the request cost is paid chunk by chunk
+        out = self._respond(prompt)
+        self._record(1)
+        cost = self._request_cost(1, self._completion_tokens(out))
+        timeout = kwargs.get("timeout")
+        chunks = re.findall(r"\S+\s*", out) or [""]
+        per_chunk = cost / len(chunks)
+        elapsed = 0.0
+        for chunk in chunks:
+            if timeout is not None and elapsed + per_chunk > timeout:
+                time.sleep(max(0.0, timeout - elapsed))
+                raise self._timed_out()
+            if per_chunk > 0:
+                time.sleep(per_chunk)
+            elapsed += per_chunk
+            yield chunk
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"requests": self.requests, "prompts": self.prompts, "failures": self.failures,
+                    "rate_limited": self.rate_limited, "timeouts": self.timeouts}
@@ -0,0 +1,257 @@
+# src/agentic_report_swarm/adapters/hedged_adapter.py
+"""
+Hedged requests for tail-latency control.
+
+HedgedAdapter wraps an adapter (and optionally an alternate one). A call that has
+not returned after the hedge delay, by default the observed p95 latency of recent
+successful calls, fires a duplicate request to the alternate (or the same) adapter;
+the first successful response wins and the loser is cancelled: async calls are
+cancelled outright, sync calls are streamed and abandoned mid-response when the
+adapter can stream. Until `min_samples` latencies are known, calls are not hedged
+(unless a fixed `hedge_after` is given).
+
+`stream` hedges too: the race is over whole responses, so a hedged stream yields
+the winner as one chunk (an unarmed one streams the primary through). Both sync
+entry points forward the caller's CancelToken (`cancel_token=` or the active
+`cancel_scope`) to every attempt: cancelling it abandons the primary and the hedge.
+
+Usage:
+    adapter = HedgedAdapter(HTTPOpenAIAdapter(...), alternate=HTTPOpenAIAdapter(base_url=...), quantile=0.95)
+    client = LLMClient(adapter)
+    adapter.stats()  # {"calls", "hedged", "hedge_wins", "cancelled", "hedge_delay_s"}
+"""
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, Optional
+
+from ..utils.cancellation import CancelToken, current_token
+
+DEFAULT_HEDGE_QUANTILE = 0.95
+# how often a blocked caller re-checks the outer CancelToken
+CANCEL_POLL_S = 0.02
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies (seconds)."""
+
+    def __init__(self, window: int = 500):
+        self._samples: "deque[float]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            vals = sorted(self._samples)
+        if not vals:
+            return None
+        # nearest-rank, like the tracing summary
+        return vals[max(0, min(len(vals) - 1, math.ceil(q * len(vals)) - 1))]
+
+
+class HedgedAdapter:
+    def __init__(
+        self,
+        adapter,
+        alternate=None,
+        quantile: float = DEFAULT_HEDGE_QUANTILE,
+        hedge_after: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 500,
+        max_workers: int = 64,
+    ):
+        self.adapter = adapter
+        self.alternate = alternate
+        self.model = getattr(adapter, "model", None)
+        self.quantile = quantile
+        self.hedge_after = hedge_after
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker(window)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+        self._counts = {"calls": 0, "hedged": 0, "hedge_wins": 0, "cancelled": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is not armed yet."""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if len(self.latencies) < self.min_samples:
+            return None
+        return self.latencies.quantile(self.quantile)
+
+    @staticmethod
+    def _remaining_kwargs(kwargs: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+        if kwargs.get("timeout") is None:
+            return kwargs
+        out = dict(kwargs)
+        out["timeout"] = max(0.0, kwargs["timeout"] - elapsed)
+        return out
+
+    def _attempt(self, adapter, prompt: str, kwargs: Dict[str, Any], token: CancelToken,
+                 outer: Optional[CancelToken] = None) -> str:
+        stream = getattr(adapter, "stream", None)
+        if stream is None:
+            text = adapter.generate(prompt, **kwargs)
+        else:
+            chunks = []
+            gen = stream(prompt, **kwargs)
+            try:
+                for chunk in gen:
+                    if token.cancelled or (outer is not None and outer.cancelled):
+                        break
+                    chunks.append(chunk)
+            finally:
+                close = getattr(gen, "close", None)
+                if close is not None:
+                    close()
+            text = "".join(chunks)
+        if outer is not None:
+            outer.raise_if_cancelled()
+        token.raise_if_cancelled()
+        return text
+
+    def _submit(self, adapter, prompt: str, kwargs: Dict[str, Any], token: CancelToken, outer: Optional[CancelToken]):
+        # run in a copy of the caller's context so tracing spans/annotations still attach
+        return self._executor.submit(contextvars.copy_context().run, self._attempt, adapter, prompt, kwargs, token, outer)
+
+    @staticmethod
+    def _wait(futures, timeout: Optional[float], outer: Optional[CancelToken]):
+        """`wait(FIRST_COMPLETED)` that also returns early once `outer` is cancelled."""
+        if outer is None:
+            return wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        until = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            step = CANCEL_POLL_S if until is None else max(0.0, min(CANCEL_POLL_S, until - time.perf_counter()))
+            done, pending = wait(futures, timeout=step, return_when=FIRST_COMPLETED)
+            if done or outer.cancelled or (until is not None and time.perf_counter() >= until):
+                return done, pending
+
+    def _cancel_losers(self, tokens: Dict[str, CancelToken], winner: Optional[str], reason: str) -> None:
+        for name, token in tokens.items():
+            if name != winner and not token.cancelled:
+                token.cancel(reason)
+                self._count("cancelled")
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        outer = kwargs.pop("cancel_token", None) or current_token()
+        self._count("calls")
+        delay = self.hedge_delay()
+        if delay is None:
+            started = time.perf_counter()
+            text = self.adapter.generate(prompt, **kwargs)
+            self.latencies.record(time.perf_counter() - started)
+            return text
+        return self._race(prompt, kwargs, delay, outer)
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Stream a completion; once hedging is armed the winning response is one chunk."""
+        outer = kwargs.pop("cancel_token", None) or current_token()
+        self._count("calls")
+        delay = self.hedge_delay()
+        if delay is not None:
+            yield self._race(prompt, kwargs, delay, outer)
+            return
+        started = time.perf_counter()
+        stream = getattr(self.adapter, "stream", None)
+        if stream is None:
+            yield self.adapter.generate(prompt, **kwargs)
+        else:
+            yield from stream(prompt, **kwargs)
+        self.latencies.record(time.perf_counter() - started)
+
+    def _race(self, prompt: str, kwargs: Dict[str, Any], delay: float, outer: Optional[CancelToken]) -> str:
+        if outer is not None:
+            outer.raise_if_cancelled()
+        started = time.perf_counter()
+        tokens = {"primary": CancelToken()}
+        futures = {self._submit(self.adapter, prompt, kwargs, tokens["primary"], outer): "primary"}
+        done, _ = self._wait(list(futures), delay, outer)
+        if not done and not (outer is not None and outer.cancelled):
+            self._count("hedged")
+            tokens["hedge"] = CancelToken()
+            hedge_kwargs = self._remaining_kwargs(kwargs, time.perf_counter() - started)
+            futures[self._submit(self.alternate or self.adapter, prompt, hedge_kwargs, tokens["hedge"], outer)] = "hedge"
+
+        pending = set(futures)
+        first_error: Optional[BaseException] = None
+        while pending:
+            if outer is not None and outer.cancelled:
+                self._cancel_losers(tokens, None, outer.reason or "cancelled")
+                outer.raise_if_cancelled()
+            done, pending = self._wait(pending, None, outer)
+            for fut in done:
+                try:
+                    text = fut.result()
+                except Exception as e:
+                    first_error = first_error or e
+                    continue
+                winner = futures[fut]
+                self._cancel_losers(tokens, winner, "hedge lost")
+                if winner == "hedge":
+                    self._count("hedge_wins")
+                # end-to-end: a winning hedge's own run time would drag the quantile down
+                self.latencies.record(time.perf_counter() - started)
+                return text
+        raise first_error
+
+    async def _aattempt(self, adapter, prompt: str, kwargs: Dict[str, Any]) -> str:
+        agenerate = getattr(adapter, "agenerate", None)
+        if agenerate is not None:
+            return await agenerate(prompt, **kwargs)
+        return await asyncio.to_thread(adapter.generate, prompt, **kwargs)
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        self._count("calls")
+        delay = self.hedge_delay()
+        started = time.perf_counter()
+        tasks = {asyncio.ensure_future(self._aattempt(self.adapter, prompt, kwargs)): "primary"}
+        if delay is not None:
+            done, _ = await asyncio.wait(list(tasks), timeout=delay)
+            if not done:
+                self._count("hedged")
+                hedge_kwargs = self._remaining_kwargs(kwargs, time.perf_counter() - started)
+                tasks[asyncio.ensure_future(self._aattempt(self.alternate or self.adapter, prompt, hedge_kwargs))] = "hedge"
+
+        pending = set(tasks)
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        text = task.result()
+                    except Exception as e:
+                        first_error = first_error or e
+                        continue
+                    if tasks[task] == "hedge":
+                        self._count("hedge_wins")
+                    self.latencies.record(time.perf_counter() - started)
+                    return text
+        finally:
+            for task in pending:
+                task.cancel()
+                self._count("cancelled")
+        raise first_error
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counts)
+        out["hedge_delay_s"] = self.hedge_delay()
+        return out
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,10 +1,57 @@
 # src/agentic_report_swarm/adapters/openai_adapter.py
+import asyncio
+import json
 import os
+import re
+import threading
+import weakref
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Protocol, runtime_checkable
+from ..utils.logging import annotate
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_POOL_SIZE = 20
+DEFAULT_TIMEOUT = 60.0
+
+
+@runtime_checkable
+class LLMAdapter(Protocol):
+    """Synchronous adapter protocol: anything exposing `generate(prompt, **kwargs) -> str`."""
+    def generate(self, prompt: str, **kwargs) -> str: ...
+
+
+@runtime_checkable
+class AsyncLLMAdapter(Protocol):
+    """
+    Async adapter protocol. Adapters implementing `agenerate` are awaited directly
+    by `LLMClient.agenerate`; sync-only adapters are run on a worker thread instead.
+    """
+    async def agenerate(self, prompt: str, **kwargs) -> str: ...
+
+
+@runtime_checkable
+class StreamingLLMAdapter(Protocol):
+    """
+    Streaming adapter protocol: `stream` yields text chunks whose concatenation is
+    the full completion. Adapters may also offer `astream` (async iterator).
+    """
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]: ...
+
 
 class MockOpenAIAdapter:
     def generate(self, prompt: str, **kwargs) -> str:
         return f"[MOCK-ADAPTER] Generated for: {prompt}"
 
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        return self.generate(prompt, **kwargs)
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        # word-sized chunks (whitespace kept) so "".join(chunks) == generate()
+        yield from re.findall(r"\S+\s*|\s+", self.generate(prompt, **kwargs))
+
+    async def astream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        for chunk in self.stream(prompt, **kwargs):
+            yield chunk
+
 class RealOpenAIAdapter:
     """
     Minimal wrapper around openai python package.
@@ -24,11 +71,211 @@ class RealOpenAIAdapter:
         self.openai.api_key = self.api_key
         self.model = model
 
+    @staticmethod
+    def _call_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # the legacy client names the per-request timeout `request_timeout`
+        if "timeout" in kwargs:
+            kwargs = dict(kwargs)
+            kwargs["request_timeout"] = kwargs.pop("timeout")
+        return kwargs
+
     def generate(self, prompt: str, **kwargs) -> str:
         # synchronous completion call (simple). You can replace with streaming.
-        resp = self.openai.Completion.create(engine=self.model, prompt=prompt, max_tokens=512, **kwargs)
+        resp = self.openai.Completion.create(engine=self.model, prompt=prompt, max_tokens=512, **self._call_kwargs(kwargs))
+        _annotate_usage(resp)
         # adapt depending on response shape (this is a minimal example)
         choices = resp.get("choices") or []
         if choices:
             return choices[0].get("text", "").strip()
         return ""
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        # the legacy completions endpoint accepts a list of prompts; choices carry their prompt index
+        resp = self.openai.Completion.create(engine=self.model, prompt=list(prompts), max_tokens=512, **self._call_kwargs(kwargs))
+        out = [""] * len(prompts)
+        for i, choice in enumerate(resp.get("choices") or []):
+            idx = choice.get("index", i)
+            if 0 <= idx < len(out):
+                out[idx] = choice.get("text", "").strip()
+        return out
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        for event in self.openai.Completion.create(engine=self.model, prompt=prompt, max_tokens=512, stream=True, **self._call_kwargs(kwargs)):
+            choices = event.get("choices") or []
+            if choices and choices[0].get("text"):
+                yield choices[0]["text"]
+
+
+def _iter_sse_deltas(lines: Iterable[str]) -> Iterator[str]:
+    """Yield text deltas from an OpenAI server-sent-events stream (chat or legacy completions)."""
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        try:
+            event = json.loads(data)
+        except ValueError:
+            continue
+        choices = event.get("choices") or []
+        if not choices:
+            continue
+        delta = choices[0].get("delta") or {}
+        text: Optional[str] = delta.get("content") or choices[0].get("text")
+        if text:
+            yield text
+
+
+def _annotate_usage(resp) -> None:
+    """Report provider token usage to the active instrumentation span."""
+    usage = resp.get("usage") if hasattr(resp, "get") else None
+    if usage:
+        annotate(prompt_tokens=usage.get("prompt_tokens"), completion_tokens=usage.get("completion_tokens"))
+
+
+# --- pooled HTTP clients -------------------------------------------------------
+
+def _import_httpx():
+    try:
+        import httpx  # type: ignore
+    except Exception as e:
+        raise RuntimeError("httpx package not installed. Install `httpx` to use HTTPOpenAIAdapter.") from e
+    return httpx
+
+def _limits(httpx, pool_size: int):
+    return httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+
+_shared_lock = threading.Lock()
+_shared_sync_clients: Dict[tuple, Any] = {}
+# httpx.AsyncClient connections are bound to the event loop that opened them,
+# so async clients are shared per running loop.
+_shared_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+def shared_http_client(pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+    """Return the process-wide keep-alive `httpx.Client` for (pool_size, timeout)."""
+    httpx = _import_httpx()
+    key = (pool_size, timeout)
+    with _shared_lock:
+        client = _shared_sync_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(limits=_limits(httpx, pool_size), timeout=timeout)
+            _shared_sync_clients[key] = client
+        return client
+
+def shared_async_http_client(pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+    """Return the keep-alive `httpx.AsyncClient` shared by everything on the running event loop."""
+    httpx = _import_httpx()
+    loop = asyncio.get_running_loop()
+    key = (pool_size, timeout)
+    with _shared_lock:
+        clients = _shared_async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_limits(httpx, pool_size), timeout=timeout)
+            clients[key] = client
+        return client
+
+def close_shared_clients() -> None:
+    """Close pooled sync clients (e.g. at process shutdown)."""
+    with _shared_lock:
+        clients = list(_shared_sync_clients.values())
+        _shared_sync_clients.clear()
+    for c in clients:
+        c.close()
+
+async def aclose_shared_clients() -> None:
+    """Close the pooled async clients owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _shared_lock:
+        clients = list(_shared_async_clients.pop(loop, {}).values())
+    for c in clients:
+        await c.aclose()
+
+
+class HTTPOpenAIAdapter:
+    """
+    OpenAI chat-completions adapter talking HTTP directly through pooled httpx clients.
+
+    Implements `generate` / `agenerate` and the streaming `stream` / `astream`. All instances with the same
+    (pool_size, timeout) share one keep-alive connection pool, so many concurrent
+    subtasks reuse a handful of sockets. `timeout` may also be passed per call.
+    Pass `client` / `async_client` to inject your own httpx clients (e.g. tests).
+    """
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4o-mini",
+        base_url: str = DEFAULT_BASE_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_tokens: int = 512,
+        client=None,
+        async_client=None,
+    ):
+        _import_httpx()
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if not self.api_key:
+            raise RuntimeError("OPENAI_API_KEY not set. Provide api_key to HTTPOpenAIAdapter or set env var.")
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_tokens = max_tokens
+        self._client = client
+        self._async_client = async_client
+
+    def _request(self, prompt: str, kwargs: Dict[str, Any]):
+        timeout = kwargs.pop("timeout", None) or self.timeout
+        body = {
+            "model": kwargs.pop("model", self.model),
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": kwargs.pop("max_tokens", self.max_tokens),
+        }
+        body.update(kwargs)
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        return f"{self.base_url}/chat/completions", body, headers, timeout
+
+    @staticmethod
+    def _extract_text(data: Dict[str, Any]) -> str:
+        choices = data.get("choices") or []
+        if not choices:
+            return ""
+        message = choices[0].get("message") or {}
+        return (message.get("content") or choices[0].get("text") or "").strip()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        url, body, headers, timeout = self._request(prompt, dict(kwargs))
+        client = self._client or shared_http_client(self.pool_size, self.timeout)
+        resp = client.post(url, json=body, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        _annotate_usage(data)
+        return self._extract_text(data)
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        url, body, headers, timeout = self._request(prompt, dict(kwargs))
+        client = self._async_client or shared_async_http_client(self.pool_size, self.timeout)
+        resp = await client.post(url, json=body, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        _annotate_usage(data)
+        return self._extract_text(data)
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        url, body, headers, timeout = self._request(prompt, dict(kwargs))
+        body["stream"] = True
+        client = self._client or shared_http_client(self.pool_size, self.timeout)
+        with client.stream("POST", url, json=body, headers=headers, timeout=timeout) as resp:
+            resp.raise_for_status()
+            yield from _iter_sse_deltas(resp.iter_lines())
+
+    async def astream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        url, body, headers, timeout = self._request(prompt, dict(kwargs))
+        body["stream"] = True
+        client = self._async_client or shared_async_http_client(self.pool_size, self.timeout)
+        async with client.stream("POST", url, json=body, headers=headers, timeout=timeout) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                for text in _iter_sse_deltas((line,)):
+                    yield text
@@ -1,45 +1,127 @@
 # src/agentic_report_swarm/agents/generic_agent.py
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Iterator, AsyncIterator, Callable
 from ..core.base_agent import BaseAgent
 from ..utils import prompt_loader
 from ..utils import llm_json
+from ..utils.logging import span
+from .tools.search_tool import format_sources
+
+DEFAULT_PROMPT = "Perform {{ task.type }} on topic {{ task.payload.topic }} (task id {{ task.id }})"
 
 class GenericAgent(BaseAgent):
     """
     Template-driven LLM-backed agent which will attempt to parse JSON responses.
+
+    The template is resolved (a path string is loaded from YAML once) and its prompt
+    compiled at construction time. Agents hold no per-run state, so one instance can
+    be shared across threads (see AgentFactory pooling).
+    `config["llm_kwargs"]` (e.g. {"temperature": 0.9}) is passed to every LLM call.
+    `config["search_tool"]` (a SearchTool) grounds prompts in the local corpus: the
+    task payload's `query` (else `topic`) is searched and the hits exposed to the
+    template as `task.sources` ({query, results, context}).
     """
 
     def __init__(self, name: str, llm_client=None, template: Optional[Dict[str, Any]] = None, config: Dict[str, Any] = None):
         super().__init__(name, config=config)
         self.llm = llm_client
         self.template = template
+        self.llm_kwargs = dict(self.config.get("llm_kwargs") or {})
+        self.search_tool = self.config.get("search_tool")
+        self._template_dict = self._resolve_template(template)
+        self._compiled = prompt_loader.get_compiled(self._template_dict)
+        # whether the prompt can depend on upstream outputs (speculative execution needs False)
+        self.uses_upstream = "upstream" in prompt_loader.template_source(self._template_dict)
 
-    def _get_template_dict(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        if isinstance(self.template, dict):
-            return self.template
-        if isinstance(self.template, str):
+    @staticmethod
+    def _resolve_template(template) -> Dict[str, Any]:
+        if isinstance(template, dict):
+            return template
+        if isinstance(template, str):
             try:
-                return prompt_loader.load_yaml_template(self.template)
+                return prompt_loader.load_yaml_template(template)
             except Exception:
-                return {"prompt": self.template}
-        return {"prompt": "Perform {{ task.type }} on topic {{ task.payload.topic }} (task id {{ task.id }})"}
+                return {"prompt": template}
+        return {"prompt": DEFAULT_PROMPT}
+
+    def _get_template_dict(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        return self._template_dict
+
+    def _with_sources(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.search_tool is None:
+            return tasks
+        pending = [i for i, t in enumerate(tasks) if "sources" not in t]
+        queries = []
+        for i in pending:
+            payload = tasks[i].get("payload") or {}
+            queries.append(str(payload.get("query") or payload.get("topic") or ""))
+        if not pending:
+            return tasks
+        with span("search", queries=len(queries)) as sp:
+            hits = self.search_tool.batch(queries)
+            sp.set(results=sum(len(h) for h in hits))
+        tasks = list(tasks)
+        for i, query, results in zip(pending, queries, hits):
+            sources = {"query": query, "results": results, "context": format_sources(results, self.search_tool.max_snippet_chars)}
+            tasks[i] = dict(tasks[i], sources=sources)
+        return tasks
 
     def _render_prompt(self, task: Dict[str, Any]) -> str:
-        tpl = self._get_template_dict(task)
-        context = {"task": task}
-        return prompt_loader.render_template(tpl, context)
+        task = self._with_sources([task])[0]
+        with span("render") as sp:
+            prompt = self._compiled.render(task=task)
+            sp.set(prompt_chars=len(prompt))
+        return prompt
 
-    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        prompt = self._render_prompt(task)
-        if not self.llm:
-            raise RuntimeError("No llm client provided to GenericAgent")
-        text = self.llm.generate(prompt)
+    def render_prompts(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """Render prompts for many tasks sharing this agent's template (batch paths)."""
+        return [self._compiled.render(task=t) for t in self._with_sources(tasks)]
 
+    def _build_result(self, task: Dict[str, Any], text: str) -> Dict[str, Any]:
         # Try to parse JSON (returns dict/list) else returns original text
-        parsed = llm_json.parse_maybe_json(text)
+        with span("parse", response_chars=len(text)) as sp:
+            parsed = llm_json.parse_maybe_json(text)
+            sp.set(structured=isinstance(parsed, (dict, list)))
 
         result: Dict[str, Any] = {"text": text, "meta": {"agent": self.name, "task_id": task.get("id")}}
         # If parsed is structured, include as `json` key for consumers
         if isinstance(parsed, (dict, list)):
             result["json"] = parsed
         return result
+
+    def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        prompt = self._render_prompt(task)
+        if not self.llm:
+            raise RuntimeError("No llm client provided to GenericAgent")
+        text = self.llm.generate(prompt, **self.llm_kwargs)
+        return self._build_result(task, text)
+
+    def stream(self, task: Dict[str, Any]) -> Iterator[str]:
+        """Yield partial text chunks as the LLM produces them (single chunk if the client cannot stream)."""
+        prompt = self._render_prompt(task)
+        if not self.llm:
+            raise RuntimeError("No llm client provided to GenericAgent")
+        stream = getattr(self.llm, "stream", None)
+        if stream is None:
+            yield self.llm.generate(prompt, **self.llm_kwargs)
+            return
+        yield from stream(prompt, **self.llm_kwargs)
+
+    async def astream(self, task: Dict[str, Any]) -> AsyncIterator[str]:
+        """Async variant of `stream`."""
+        prompt = self._render_prompt(task)
+        if not self.llm:
+            raise RuntimeError("No llm client provided to GenericAgent")
+        astream = getattr(self.llm, "astream", None)
+        if astream is None:
+            yield self.llm.generate(prompt, **self.llm_kwargs)
+            return
+        async for chunk in astream(prompt, **self.llm_kwargs):
+            yield chunk
+
+    def run_streaming(self, task: Dict[str, Any], on_chunk: Callable[[str], None]) -> Dict[str, Any]:
+        """Like `run`, but forwards every chunk to `on_chunk` while the completion streams in."""
+        chunks = []
+        for chunk in self.stream(task):
+            chunks.append(chunk)
+            on_chunk(chunk)
+        return self._build_result(task, "".join(chunks))
@@ -0,0 +1,451 @@
+# src/agentic_report_swarm/agents/tools/search_tool.py
+"""
+Offline document search for agents: an on-disk BM25 inverted index (stdlib only).
+
+Documents come from a directory of .txt / .md files (one document per file, title =
+first heading or file name) and .jsonl files (one document per line with "text" and
+optional "id" / "title"). `SearchIndex.index_directory` is incremental: unchanged
+files are skipped, changed or removed files have their old documents tombstoned.
+
+Index layout (`index_dir`):
+    meta.json            segment list, document count, live total length, purged count
+    docs.jsonl           one JSON line per document (id, title, source, snippet)
+    docs.off / doclens   uint64 line offsets / uint32 token counts, by doc number
+    files.json           indexed files -> mtime, size, doc numbers
+    deleted.json         tombstoned doc numbers (still present in some segment)
+    seg-NNNNNN.lex       term -> [offset, count] into the postings file
+    seg-NNNNNN.post      uint32 (doc, tf) pairs, memory-mapped for queries
+
+Each commit writes new segments (nothing is rewritten); `compact()` merges them,
+drops tombstoned postings and forgets the tombstones. BM25 statistics (document
+count, average length) only count live documents. Queries are BM25-ranked; `search_batch` reads each
+distinct term's postings once for the whole batch, and results are cached (LRU)
+until the next commit.
+
+Usage:
+    index = SearchIndex(".cache/search_index")
+    index.index_directory("docs/corpus")
+    tool = SearchTool(index, k=5)
+    tool("EV battery supply chain")      # -> [{"id", "title", "source", "score", "snippet"}, ...]
+    AgentFactory(llm_client=client, search_tool=tool)   # research prompts get task.sources
+"""
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFAULT_SEGMENT_DOCS = 50_000
+DEFAULT_CACHE_SIZE = 1024
+SNIPPET_CHARS = 400
+DOC_SUFFIXES = (".txt", ".md", ".markdown", ".jsonl")
+
+SEARCH_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "its",
+    "of", "on", "or", "that", "the", "this", "to", "was", "were", "with",
+})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric terms, minus stopwords and single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in SEARCH_STOPWORDS]
+
+
+def _title_of(text: str, fallback: str) -> str:
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            return line.lstrip("#").strip()[:200] or fallback
+    return fallback
+
+
+def iter_file_documents(path: Path) -> Iterator[Dict[str, str]]:
+    """Documents in one corpus file: {"id", "title", "text"}."""
+    if path.suffix == ".jsonl":
+        with open(path, "r", encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(obj, dict) or not obj.get("text"):
+                    continue
+                text = str(obj["text"])
+                doc_id = str(obj.get("id", f"{path.name}:{lineno}"))
+                yield {"id": doc_id, "title": str(obj.get("title") or _title_of(text, doc_id)), "text": text}
+    else:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        if text.strip():
+            yield {"id": path.name, "title": _title_of(text, path.stem), "text": text}
+
+
+def _read_array(path: Path, typecode: str) -> array:
+    arr = array(typecode)
+    if path.exists():
+        arr.frombytes(path.read_bytes())
+    return arr
+
+
+class _Segment:
+    """One immutable segment: lexicon in memory, postings memory-mapped."""
+
+    __slots__ = ("name", "lexicon", "_fh", "_mm", "postings")
+
+    def __init__(self, root: Path, name: str):
+        self.name = name
+        with open(root / f"{name}.lex", "r", encoding="utf-8") as fh:
+            self.lexicon: Dict[str, List[int]] = json.load(fh)
+        self._fh = open(root / f"{name}.post", "rb")
+        if os.fstat(self._fh.fileno()).st_size:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+            self.postings = memoryview(self._mm).cast("I")
+        else:
+            self._mm = None
+            self.postings = memoryview(array("I"))
+
+    def get(self, term: str) -> Optional[memoryview]:
+        entry = self.lexicon.get(term)
+        if entry is None:
+            return None
+        offset, count = entry
+        return self.postings[offset:offset + 2 * count]
+
+    def close(self) -> None:
+        self.postings.release()
+        if self._mm is not None:
+            self._mm.close()
+        self._fh.close()
+
+
+def _write_segment(root: Path, name: str, postings: Dict[str, array]) -> None:
+    lexicon = {}
+    out = array("I")
+    for term in sorted(postings):
+        plist = postings[term]
+        lexicon[term] = [len(out), len(plist) // 2]
+        out.extend(plist)
+    with open(root / f"{name}.post", "wb") as fh:
+        out.tofile(fh)
+    # json.dumps (C encoder) is much faster than json.dump for large lexicons
+    (root / f"{name}.lex").write_text(json.dumps(lexicon, separators=(",", ":")), encoding="utf-8")
+
+
+class SearchIndex:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        segment_docs: int = DEFAULT_SEGMENT_DOCS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self.segment_docs = segment_docs
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._counts = {"queries": 0, "cache_hits": 0}
+        self._pending: Dict[str, array] = {}
+        self._pending_docs = 0
+
+        meta_path = self.path / "meta.json"
+        meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+        self._segment_names: List[str] = meta.get("segments", [])
+        self._next_segment = meta.get("next_segment", 1)
+        self.total_len = meta.get("total_len", 0)  # tokens in live documents
+        self._purged = meta.get("purged", 0)  # doc numbers dropped by compact()
+        self._doc_offsets = _read_array(self.path / "docs.off", "Q")
+        self._doclens = _read_array(self.path / "doclens", "I")
+        # anything appended after the last commit is discarded
+        del self._doc_offsets[meta.get("docs", 0):]
+        del self._doclens[meta.get("docs", 0):]
+        self._deleted = set(json.loads((self.path / "deleted.json").read_text()) if (self.path / "deleted.json").exists() else [])
+        self._files: Dict[str, Dict[str, Any]] = (
+            json.loads((self.path / "files.json").read_text(encoding="utf-8")) if (self.path / "files.json").exists() else {}
+        )
+        self._segments = [_Segment(self.path, name) for name in self._segment_names]
+        self._docs_fh = open(self.path / "docs.jsonl", "a+b")
+        self._docs_fh.truncate(self._doc_offsets[-1] + self._line_len(-1) if self._doc_offsets else 0)
+
+    def _line_len(self, doc: int) -> int:
+        self._docs_fh.seek(self._doc_offsets[doc])
+        return len(self._docs_fh.readline())
+
+    # -- stats ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Live (not deleted) documents, committed or not."""
+        with self._lock:
+            return len(self._doclens) - len(self._deleted) - self._purged
+
+    @property
+    def avgdl(self) -> float:
+        with self._lock:
+            n = len(self)
+            return self.total_len / n if n else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counts)
+            out.update(docs=len(self), deleted=len(self._deleted), segments=len(self._segments),
+                       files=len(self._files), cached=len(self._cache), avgdl=round(self.avgdl, 3))
+        return out
+
+    # -- indexing ------------------------------------------------------------
+
+    def add_documents(self, docs: Iterable[Dict[str, Any]], source: Optional[str] = None) -> List[int]:
+        """Index documents ({"text", optional "id"/"title"}); returns their doc numbers. Visible after commit()."""
+        added = []
+        with self._lock:
+            for doc in docs:
+                text = str(doc.get("text") or "")
+                terms = Counter(tokenize(text))
+                num = len(self._doclens)
+                ext_id = str(doc.get("id", num))
+                record = {"id": ext_id, "title": str(doc.get("title") or _title_of(text, ext_id)),
+                          "source": source, "snippet": text[:SNIPPET_CHARS]}
+                self._docs_fh.seek(0, os.SEEK_END)
+                self._doc_offsets.append(self._docs_fh.tell())
+                self._docs_fh.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                length = sum(terms.values())
+                self._doclens.append(length)
+                self.total_len += length
+                for term, tf in terms.items():
+                    plist = self._pending.get(term)
+                    if plist is None:
+                        plist = self._pending[term] = array("I")
+                    plist.append(num)
+                    plist.append(tf)
+                self._pending_docs += 1
+                if self._pending_docs >= self.segment_docs:
+                    self._flush_segment()
+                added.append(num)
+        return added
+
+    def delete_documents(self, nums: Iterable[int]) -> None:
+        with self._lock:
+            for num in nums:
+                if num not in self._deleted and 0 <= num < len(self._doclens):
+                    self._deleted.add(num)
+                    self.total_len -= self._doclens[num]
+
+    def _flush_segment(self) -> None:
+        if not self._pending:
+            self._pending_docs = 0
+            return
+        name = f"seg-{self._next_segment:06d}"
+        self._next_segment += 1
+        _write_segment(self.path, name, self._pending)
+        self._segment_names.append(name)
+        self._segments.append(_Segment(self.path, name))
+        self._pending = {}
+        self._pending_docs = 0
+
+    def commit(self) -> None:
+        """Flush pending documents to a new segment and publish them to queries."""
+        with self._lock:
+            self._flush_segment()
+            self._docs_fh.flush()
+            with open(self.path / "docs.off", "wb") as fh:
+                self._doc_offsets.tofile(fh)
+            with open(self.path / "doclens", "wb") as fh:
+                self._doclens.tofile(fh)
+            (self.path / "deleted.json").write_text(json.dumps(sorted(self._deleted)))
+            (self.path / "files.json").write_text(json.dumps(self._files), encoding="utf-8")
+            meta = {"version": 1, "segments": self._segment_names, "next_segment": self._next_segment,
+                    "docs": len(self._doclens), "total_len": self.total_len, "purged": self._purged}
+            tmp = self.path / "meta.json.tmp"
+            tmp.write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp, self.path / "meta.json")
+            self._cache.clear()
+
+    def index_directory(self, root: Union[str, Path], suffixes: Sequence[str] = DOC_SUFFIXES) -> Dict[str, int]:
+        """Incrementally index a corpus directory; returns {"indexed", "skipped", "removed"} file counts."""
+        root = Path(root)
+        counts = {"indexed": 0, "skipped": 0, "removed": 0}
+        seen = set()
+        for path in sorted(root.rglob("*")):
+            if path.suffix.lower() not in suffixes or not path.is_file():
+                continue
+            key = str(path.resolve())
+            seen.add(key)
+            st = path.stat()
+            known = self._files.get(key)
+            if known is not None and known["mtime_ns"] == st.st_mtime_ns and known["size"] == st.st_size:
+                counts["skipped"] += 1
+                continue
+            if known is not None:
+                self.delete_documents(known["docs"])
+            nums = self.add_documents(iter_file_documents(path), source=str(path.relative_to(root)))
+            self._files[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "docs": nums}
+            counts["indexed"] += 1
+        root_key = str(root.resolve())
+        for key in [k for k in self._files if k.startswith(root_key + os.sep) and k not in seen]:
+            self.delete_documents(self._files.pop(key)["docs"])
+            counts["removed"] += 1
+        self.commit()
+        return counts
+
+    def compact(self) -> None:
+        """Merge all segments into one, dropping postings of deleted documents."""
+        with self._lock:
+            self.commit()
+            merged: Dict[str, array] = {}
+            deleted = self._deleted
+            for seg in self._segments:
+                for term in seg.lexicon:
+                    plist = merged.get(term)
+                    if plist is None:
+                        plist = merged[term] = array("I")
+                    it = iter(seg.get(term))
+                    for doc, tf in zip(it, it):
+                        if doc not in deleted:
+                            plist.append(doc)
+                            plist.append(tf)
+            old = self._segments
+            self._segments, self._segment_names = [], []
+            self._pending = {t: p for t, p in merged.items() if p}
+            self._flush_segment()
+            # no segment references the tombstoned docs any more
+            self._purged += len(deleted)
+            self._deleted = set()
+            self.commit()
+            for seg in old:
+                seg.close()
+                for ext in (".lex", ".post"):
+                    (self.path / f"{seg.name}{ext}").unlink(missing_ok=True)
+
+    # -- querying ------------------------------------------------------------
+
+    def _postings(self, term: str) -> List[Tuple[int, int]]:
+        out: List[Tuple[int, int]] = []
+        for seg in self._segments:
+            plist = seg.get(term)
+            if plist is not None:
+                it = iter(plist)
+                out.extend(zip(it, it))
+        return out
+
+    def _score(self, terms: Sequence[str], postings: Dict[str, List[Tuple[int, int]]], k: int) -> List[Tuple[int, float]]:
+        n = len(self)
+        avgdl = self.avgdl or 1.0
+        k1, b = self.k1, self.b
+        doclens, deleted = self._doclens, self._deleted
+        scores: Dict[int, float] = {}
+        for term, qtf in Counter(terms).items():
+            plist = postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1.0 + (n - len(plist) + 0.5) / (len(plist) + 0.5)) * qtf
+            for doc, tf in plist:
+                norm = tf + k1 * (1.0 - b + b * doclens[doc] / avgdl)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1.0) / norm
+        if deleted:
+            for doc in deleted.intersection(scores):
+                del scores[doc]
+        return heapq.nlargest(k, scores.items(), key=lambda kv: kv[1])
+
+    def document(self, num: int) -> Dict[str, Any]:
+        with self._lock:
+            self._docs_fh.seek(self._doc_offsets[num])
+            line = self._docs_fh.readline()
+        return json.loads(line)
+
+    def _results(self, ranked: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        out = []
+        for num, score in ranked:
+            doc = self.document(num)
+            doc.update(doc=num, score=round(score, 4))
+            out.append(doc)
+        return out
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Top-k documents for `query`: [{"id", "title", "source", "snippet", "doc", "score"}, ...]."""
+        return self.search_batch([query], k=k)[0]
+
+    def search_batch(self, queries: Sequence[str], k: int = 10) -> List[List[Dict[str, Any]]]:
+        """Top-k results per query; postings of terms shared between queries are read once."""
+        keyed = [(tuple(tokenize(q)), k) for q in queries]
+        out: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        todo = []
+        with self._lock:
+            self._counts["queries"] += len(queries)
+            for i, key in enumerate(keyed):
+                hit = self._cache.get(key)
+                if hit is not None:
+                    self._cache.move_to_end(key)
+                    self._counts["cache_hits"] += 1
+                    out[i] = hit
+                else:
+                    todo.append(i)
+            if todo:
+                terms = {t for i in todo for t in keyed[i][0]}
+                postings = {t: self._postings(t) for t in terms}
+                for i in todo:
+                    results = self._results(self._score(keyed[i][0], postings, k)) if keyed[i][0] else []
+                    out[i] = results
+                    self._cache[keyed[i]] = results
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        # callers get their own copies; the cache keeps the originals
+        return [[dict(r) for r in res] for res in out]
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            for seg in self._segments:
+                seg.close()
+            self._segments = []
+            self._docs_fh.close()
+
+
+def format_sources(results: List[Dict[str, Any]], max_chars: int = 300) -> str:
+    """Search results as a numbered markdown list for prompts."""
+    lines = []
+    for i, r in enumerate(results, 1):
+        snippet = " ".join(r.get("snippet", "").split())
+        if len(snippet) > max_chars:
+            snippet = snippet[:max_chars].rsplit(" ", 1)[0] + " …"
+        source = f" ({r['source']})" if r.get("source") else ""
+        lines.append(f"[{i}] {r.get('title')}{source}: {snippet}")
+    return "\n".join(lines)
+
+
+class SearchTool:
+    """Agent-facing wrapper: `tool(query)` returns top-k results, `tool.sources(query)` prompt-ready context."""
+
+    name = "search"
+
+    def __init__(self, index: Union[SearchIndex, str, Path], k: int = 5, max_snippet_chars: int = 300):
+        self.index = index if isinstance(index, SearchIndex) else SearchIndex(index)
+        self.k = k
+        self.max_snippet_chars = max_snippet_chars
+
+    def __call__(self, query: str, k: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.index.search(query, k=k or self.k)
+
+    def batch(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        return self.index.search_batch(queries, k=k or self.k)
+
+    def sources(self, query: str, k: Optional[int] = None) -> Dict[str, Any]:
+        """{"query", "results", "context"} for `task["sources"]`."""
+        results = self(query, k)
+        return {"query": query, "results": results, "context": format_sources(results, self.max_snippet_chars)}
@@ -1,37 +1,118 @@
-# src/app.py
+# src/agentic_report_swarm/cli.py
 """
-Simple CLI to run SuperAgent in mock mode.
+Simple CLI to run the report swarm (mock LLM by default).
 
 Usage:
-    python -m src.app --topic "e-commerce fashion Indonesia Q4" --length short --mock
+    python -m agentic_report_swarm.cli run --topic "e-commerce fashion Indonesia Q4"
+    python -m agentic_report_swarm.cli batch --input topics.jsonl --out-dir reports/ --concurrency 16
+    python -m agentic_report_swarm.cli batch --input topics.txt --jsonl reports.jsonl --real
+    python -m agentic_report_swarm.cli batch --input topics.txt --jsonl reports.jsonl --processes 8
+    python -m agentic_report_swarm.cli serve --port 8000 --jobs 4 --queue-size 64
 """
 
 import argparse
-import os
-from agentic_report_swarm.orchestrator.super_agent import SuperAgent
-from agentic_report_swarm.adapters.openai_adapter import MockOpenAIAdapter, OpenAIAdapter
-
-def build_adapters(mock: bool):
-    if mock:
-        return {"openai": MockOpenAIAdapter(canned={})}
-    # real adapter (not used by default)
-    return {"openai": OpenAIAdapter()}
-
-def main():
-    parser = argparse.ArgumentParser(description="Run Agentic Report Swarm (MVP) - mock mode")
-    parser.add_argument("--topic", required=True, help="Topic for the report")
-    parser.add_argument("--length", default="short", choices=["short", "detailed"], help="Length of report")
-    parser.add_argument("--mock", action="store_true", help="Use mock adapters (no OpenAI calls)")
-    args = parser.parse_args()
-
-    adapters = build_adapters(mock=args.mock)
-    sa = SuperAgent(adapters=adapters, max_workers=3)
-    command = {"topic": args.topic, "length": args.length}
-    print(f"Starting SuperAgent for topic: {args.topic} (mock={args.mock})")
-    out = sa.run(command, save=True)
-    print(f"Report saved to: {out['report_path']}")
+import functools
+import sys
+from agentic_report_swarm.orchestrator.super_agent import run_topic
+from agentic_report_swarm.orchestrator.batch_runner import run_batch, DirectorySink, JSONLSink, DEFAULT_MAX_CONCURRENCY
+from agentic_report_swarm.orchestrator.job_queue import DEFAULT_JOB_WORKERS, DEFAULT_MAX_QUEUED, JobQueue
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.swarm.result_store import ResultStore
+from agentic_report_swarm.core.planner import LLMPlanner
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+def build_llm_client(real: bool) -> LLMClient:
+    return LLMClient.from_env(prefer_real=real)
+
+def build_planner(args, af: AgentFactory):
+    return planner_for(args.planner, af)
+
+def planner_for(name: str, af: AgentFactory):
+    return LLMPlanner(af.llm_client) if name == "llm" else None
+
+def build_worker_factory(real: bool, template_dir=None) -> AgentFactory:
+    """AgentFactory for one batch worker process (module-level so it pickles)."""
+    return AgentFactory(llm_client=build_llm_client(real), template_dir=template_dir)
+
+def cmd_run(args) -> int:
+    af = AgentFactory(llm_client=build_llm_client(args.real), template_dir=args.template_dir)
+    print(f"Starting report for topic: {args.topic} (real={args.real})")
+    store = ResultStore(args.resume_db) if args.resume_db else None
+    md = run_topic(args.topic, agent_factory=af, max_workers=args.workers, result_store=store,
+                   planner=build_planner(args, af))
+    if store is not None:
+        stats = store.stats()
+        print(f"Subtasks reused: {stats['hits']}, recomputed: {stats['misses']}")
+        store.close()
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            fh.write(md)
+        print(f"Report saved to: {args.out}")
     print("--- Report preview ---")
-    print(out['markdown'][:1000])  # print first 1000 chars
+    print(md[:1000])  # print first 1000 chars
+    return 0
+
+def cmd_batch(args) -> int:
+    if not args.out_dir and not args.jsonl:
+        print("batch: one of --out-dir or --jsonl is required", file=sys.stderr)
+        return 2
+    sink = DirectorySink(args.out_dir) if args.out_dir else JSONLSink(args.jsonl)
+    if args.processes > 0:
+        mode = dict(processes=args.processes,
+                    factory_builder=functools.partial(build_worker_factory, args.real, args.template_dir),
+                    planner_builder=functools.partial(planner_for, args.planner))
+    else:
+        af = AgentFactory(llm_client=build_llm_client(args.real), template_dir=args.template_dir)
+        mode = dict(agent_factory=af, planner=build_planner(args, af))
+    summary = run_batch(args.input, sink=sink, max_concurrency=args.concurrency, max_workers=args.workers, **mode)
+    print(f"Batch done: {summary['succeeded']}/{summary['total']} succeeded in {summary['elapsed_s']}s")
+    return 0 if summary["failed"] == 0 else 1
+
+def cmd_serve(args) -> int:
+    try:
+        import uvicorn  # type: ignore
+    except Exception as e:
+        raise RuntimeError("uvicorn package not installed. Install `uvicorn` to run the service.") from e
+    from agentic_report_swarm.server import create_app
+    af = AgentFactory(llm_client=build_llm_client(args.real), template_dir=args.template_dir)
+    jobs = JobQueue(af, workers=args.jobs, max_queued=args.queue_size, max_workers=args.workers, planner=build_planner(args, af))
+    app = create_app(jobs=jobs)
+    uvicorn.run(app, host=args.host, port=args.port)
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run Agentic Report Swarm (mock LLM unless --real)")
+    parser.add_argument("--real", action="store_true", help="Use the real OpenAI adapter (needs OPENAI_API_KEY)")
+    parser.add_argument("--template-dir", default=None, help="Agent template directory (default: config/agent_templates)")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent subtasks per report")
+    parser.add_argument("--planner", choices=("rule", "llm"), default="rule",
+                        help="rule: fixed 4-step chain; llm: LLM-decomposed wide DAG (memoized per topic)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Generate a single report")
+    p_run.add_argument("--topic", required=True, help="Topic for the report")
+    p_run.add_argument("--out", default=None, help="Write the markdown report to this path")
+    p_run.add_argument("--resume-db", default=None, help="SQLite result store; reruns skip unchanged subtasks")
+    p_run.set_defaults(func=cmd_run)
+
+    p_batch = sub.add_parser("batch", help="Generate reports for many topics")
+    p_batch.add_argument("--input", required=True, help="Topics file: one topic per line (plain text or JSONL)")
+    p_batch.add_argument("--out-dir", default=None, help="Write one markdown file per topic into this directory")
+    p_batch.add_argument("--jsonl", default=None, help="Append one JSON line per finished topic to this file")
+    p_batch.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY, help="Topics in flight at once (per process with --processes)")
+    p_batch.add_argument("--processes", type=int, default=0,
+                         help="Shard the batch across this many worker processes (0: single process)")
+    p_batch.set_defaults(func=cmd_batch)
+
+    p_serve = sub.add_parser("serve", help="Run the HTTP report service")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8000)
+    p_serve.add_argument("--jobs", type=int, default=DEFAULT_JOB_WORKERS, help="Reports generated concurrently")
+    p_serve.add_argument("--queue-size", type=int, default=DEFAULT_MAX_QUEUED, help="Queued reports before 429")
+    p_serve.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,35 +1,141 @@
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
+"""
+Plan / SubTask / SubtaskResult schema types.
+
+All three declare __slots__ (no per-instance __dict__), which keeps large in-memory
+batches of plans small. `to_dict()` returns deep copies, like the dataclass
+`asdict` it replaces.
+
+`to_bytes()` / `from_bytes()` give a compact binary form for callers that store or
+ship plans and results themselves (the process-pool batch runner does not use it;
+it pickles report dicts). The body is compact JSON by default, so the bytes do not
+depend on what is installed; pass `codec=CODEC_MSGPACK` to use msgpack (optional
+dependency, not in requirements). A 4-byte header records the codec.
+
+SubtaskResult.from_bytes defers decoding the output until `.output` is read, and
+re-serializing an untouched result copies the raw bytes instead of decoding and
+re-encoding them. Agent outputs whose `json` is just the parsed `text` are stored
+once, which makes the bytes smaller but costs a re-parse of `text` on decode.
+"""
+from typing import Any, Dict, List, Optional, Union
+import copy
+import itertools
+import json
+import struct
 import uuid
 
-@dataclass
+from ..utils.llm_json import parse_maybe_json
+
+# process-unique prefix + counter: cheap unique SubTask ids (no uuid4 per task)
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_id_counter = itertools.count(1)
+
+MAGIC = b"AR"
+FORMAT_VERSION = 1
+CODEC_JSON = ord("j")
+CODEC_MSGPACK = ord("m")
+_HEADER = struct.Struct("<2sBB")            # magic, version, codec
+_RESULT_HEAD = struct.Struct("<BIII")       # flags, len(id), len(error), len(output)
+_FLAG_SUCCESS = 1
+_FLAG_HAS_ERROR = 2
+_FLAG_HAS_OUTPUT = 4
+_FLAG_JSON_FROM_TEXT = 8
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _msgpack():
+    try:
+        import msgpack  # type: ignore
+    except Exception:
+        return None
+    return msgpack
+
+
+def _encode(obj: Any, codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise RuntimeError("msgpack package not installed. Install `msgpack` or use the JSON codec.")
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _decode(buf: Buffer, codec: int) -> Any:
+    if codec == CODEC_MSGPACK:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise RuntimeError("msgpack package not installed. Install `msgpack` to read these bytes.")
+        return msgpack.unpackb(buf, raw=False)
+    return json.loads(bytes(buf) if not isinstance(buf, bytes) else buf)
+
+
+def _header(codec: Optional[int]) -> tuple:
+    codec = CODEC_JSON if codec is None else codec
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, codec), codec
+
+
+def _read_header(view: memoryview) -> int:
+    magic, version, codec = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("not an agentic-report-swarm schema buffer (bad magic/version)")
+    return codec
+
+
 class SubTask:
-    id: str
-    type: str
-    payload: Dict[str, Any]
-    depends_on: List[str] = field(default_factory=list)
+    __slots__ = ("id", "type", "payload", "depends_on")
+
+    def __init__(self, id: str, type: str, payload: Dict[str, Any], depends_on: Optional[List[str]] = None):
+        self.id = id
+        self.type = type
+        self.payload = payload
+        self.depends_on: List[str] = depends_on if depends_on is not None else []
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SubTask):
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()
+
+    def __repr__(self) -> str:
+        return f"SubTask(id={self.id!r}, type={self.type!r}, payload={self.payload!r}, depends_on={self.depends_on!r})"
 
     @staticmethod
     def make(type: str, payload: Dict[str, Any], depends_on: Optional[List[str]] = None, id: Optional[str] = None):
         return SubTask(
-            id=id or str(uuid.uuid4()),
+            id=id or f"st-{_ID_PREFIX}-{next(_id_counter)}",
             type=type,
             payload=payload,
             depends_on=depends_on or []
         )
 
     def to_dict(self):
-        return asdict(self)
+        return {"id": self.id, "type": self.type, "payload": copy.deepcopy(self.payload), "depends_on": list(self.depends_on)}
+
+    def to_tuple(self) -> list:
+        return [self.id, self.type, self.payload, self.depends_on]
+
+    @staticmethod
+    def from_tuple(t) -> "SubTask":
+        return SubTask(id=t[0], type=t[1], payload=t[2], depends_on=list(t[3]))
+
 
-@dataclass
 class Plan:
-    plan_id: str
-    topic: str
-    subtasks: List[SubTask] = field(default_factory=list)
+    __slots__ = ("plan_id", "topic", "subtasks")
+
+    def __init__(self, plan_id: str, topic: str, subtasks: Optional[List[SubTask]] = None):
+        self.plan_id = plan_id
+        self.topic = topic
+        self.subtasks: List[SubTask] = subtasks if subtasks is not None else []
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Plan):
+            return NotImplemented
+        return (self.plan_id, self.topic, self.subtasks) == (other.plan_id, other.topic, other.subtasks)
+
+    def __repr__(self) -> str:
+        return f"Plan(plan_id={self.plan_id!r}, topic={self.topic!r}, subtasks={self.subtasks!r})"
 
     @staticmethod
     def create_for_topic(topic: str):
-        import uuid
         return Plan(plan_id=str(uuid.uuid4()), topic=topic, subtasks=[])
 
     def to_dict(self):
@@ -39,12 +145,107 @@ class Plan:
             "subtasks": [st.to_dict() for st in self.subtasks],
         }
 
-@dataclass
+    def to_bytes(self, codec: Optional[int] = None) -> bytes:
+        """Compact binary form: header + [plan_id, topic, [[id, type, payload, depends_on], ...]]."""
+        header, codec = _header(codec)
+        return header + _encode([self.plan_id, self.topic, [st.to_tuple() for st in self.subtasks]], codec)
+
+    @staticmethod
+    def from_bytes(buf: Buffer) -> "Plan":
+        view = memoryview(buf)
+        codec = _read_header(view)
+        plan_id, topic, subtasks = _decode(view[_HEADER.size:], codec)
+        return Plan(plan_id=plan_id, topic=topic, subtasks=[SubTask.from_tuple(t) for t in subtasks])
+
+
+def _compact_output(output: Any) -> tuple:
+    """(output to store, json_from_text): drop `json` when it is exactly the parsed `text`."""
+    if isinstance(output, dict) and "json" in output and isinstance(output.get("text"), str):
+        if parse_maybe_json(output["text"]) == output["json"]:
+            return {k: v for k, v in output.items() if k != "json"}, True
+    return output, False
+
+
 class SubtaskResult:
-    id: str
-    success: bool
-    output: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+    """Result of one subtask; `output` may be decoded lazily from a serialized buffer."""
+
+    __slots__ = ("id", "success", "error", "_output", "_raw", "_codec", "_json_from_text")
+
+    def __init__(self, id: str, success: bool, output: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        self.id = id
+        self.success = success
+        self.error = error
+        self._output = output
+        self._raw: Optional[memoryview] = None
+        self._codec = CODEC_JSON
+        self._json_from_text = False
+
+    @property
+    def output(self) -> Optional[Dict[str, Any]]:
+        if self._raw is not None:
+            out = _decode(self._raw, self._codec)
+            if self._json_from_text:
+                out["json"] = parse_maybe_json(out["text"])
+            self._output, self._raw = out, None
+        return self._output
+
+    @output.setter
+    def output(self, value: Optional[Dict[str, Any]]) -> None:
+        self._output, self._raw = value, None
+
+    @property
+    def decoded(self) -> bool:
+        return self._raw is None
+
+    @staticmethod
+    def from_dict(d: Dict[str, Any]) -> "SubtaskResult":
+        return SubtaskResult(id=d["id"], success=bool(d.get("success")), output=d.get("output"), error=d.get("error"))
 
     def to_dict(self):
-        return asdict(self)
+        return {"id": self.id, "success": self.success, "output": copy.deepcopy(self.output), "error": self.error}
+
+    def to_bytes(self, codec: Optional[int] = None) -> bytes:
+        header, codec = _header(codec)
+        if self._raw is not None and self._codec == codec:
+            blob, from_text = self._raw, self._json_from_text   # untouched: pass the bytes through
+        elif self._output is not None:
+            stored, from_text = _compact_output(self._output)
+            blob = _encode(stored, codec)
+        else:
+            blob, from_text = b"", False
+        id_b = self.id.encode("utf-8")
+        err_b = self.error.encode("utf-8") if self.error is not None else b""
+        flags = (
+            (_FLAG_SUCCESS if self.success else 0)
+            | (_FLAG_HAS_ERROR if self.error is not None else 0)
+            | (_FLAG_HAS_OUTPUT if len(blob) else 0)
+            | (_FLAG_JSON_FROM_TEXT if from_text else 0)
+        )
+        return b"".join((header, _RESULT_HEAD.pack(flags, len(id_b), len(err_b), len(blob)), id_b, err_b, blob))
+
+    @staticmethod
+    def from_bytes(buf: Buffer) -> "SubtaskResult":
+        """Decode a result; the output stays a view into `buf` until first accessed."""
+        view = memoryview(buf)
+        codec = _read_header(view)
+        pos = _HEADER.size
+        flags, n_id, n_err, n_out = _RESULT_HEAD.unpack_from(view, pos)
+        pos += _RESULT_HEAD.size
+        rid = str(view[pos:pos + n_id], "utf-8")
+        pos += n_id
+        error = str(view[pos:pos + n_err], "utf-8") if flags & _FLAG_HAS_ERROR else None
+        pos += n_err
+        res = SubtaskResult(id=rid, success=bool(flags & _FLAG_SUCCESS), error=error)
+        if flags & _FLAG_HAS_OUTPUT:
+            res._raw = view[pos:pos + n_out]
+            res._codec = codec
+            res._json_from_text = bool(flags & _FLAG_JSON_FROM_TEXT)
+        return res
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SubtaskResult):
+            return NotImplemented
+        return (self.id, self.success, self.error, self.output) == (other.id, other.success, other.error, other.output)
+
+    def __repr__(self) -> str:
+        return f"SubtaskResult(id={self.id!r}, success={self.success!r}, error={self.error!r}, decoded={self.decoded})"
@@ -1,16 +1,39 @@
 from .plan_schema import Plan, SubTask
+from ..utils import llm_json
+from ..utils import prompt_loader
+from ..utils.logging import get_logger
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+import re
+import threading
 import uuid
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 
-def simple_planner(topic: str) -> Plan:
+logger = get_logger(__name__)
+
+DEFAULT_PLAN_CACHE_SIZE = 256
+DEFAULT_MAX_SUBTASKS = 12
+PLANNABLE_TYPES = ("research", "trends", "insights", "writer")
+
+def stable_plan_id(topic: str) -> str:
+    """Deterministic plan id for a topic, so reruns can resume from stored results."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"agentic-report-swarm:{topic}"))
+
+def normalize_topic(topic: str) -> str:
+    """Case/whitespace/punctuation-insensitive form of a topic (plan memo key)."""
+    return " ".join(re.sub(r"[^\w\s-]", " ", topic.lower()).split())
+
+def simple_planner(topic: str, plan_id: Optional[str] = None) -> Plan:
     """
     Rule-based planner that emits 4 subtasks in dependency order:
       - research
       - trends (depends on research)
       - insights (depends on research + trends)
       - writer (depends on insights)
+    `plan_id` defaults to a fresh uuid4.
     """
-    plan_id = str(uuid.uuid4())
+    plan_id = plan_id or str(uuid.uuid4())
     subtasks: List[SubTask] = [
         SubTask.make(type="research", payload={"topic": topic}, id="t1"),
         SubTask.make(type="trends", payload={"topic": topic}, depends_on=["t1"], id="t2"),
@@ -18,3 +41,236 @@ def simple_planner(topic: str) -> Plan:
         SubTask.make(type="writer", payload={"topic": topic}, depends_on=["t3"], id="t4"),
     ]
     return Plan(plan_id=plan_id, topic=topic, subtasks=subtasks)
+
+
+class PlanValidationError(ValueError):
+    """A plan is not a well-formed DAG; `errors` lists every problem found."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("invalid plan: " + "; ".join(errors))
+        self.errors = errors
+
+
+def validate_plan(plan: Plan, allowed_types: Optional[Iterable[str]] = None, max_subtasks: Optional[int] = None) -> Plan:
+    """
+    Check ids are unique, dependencies exist (and are not self-references), types are
+    known and the dependency graph is acyclic. Returns the plan; raises PlanValidationError.
+    """
+    errors: List[str] = []
+    if not plan.subtasks:
+        errors.append("plan has no subtasks")
+    if max_subtasks is not None and len(plan.subtasks) > max_subtasks:
+        errors.append(f"{len(plan.subtasks)} subtasks exceed the limit of {max_subtasks}")
+    allowed = set(allowed_types) if allowed_types is not None else None
+    ids = set()
+    for st in plan.subtasks:
+        if not st.id:
+            errors.append("subtask without id")
+        elif st.id in ids:
+            errors.append(f"duplicate subtask id {st.id!r}")
+        ids.add(st.id)
+        if not st.type or (allowed is not None and st.type not in allowed):
+            errors.append(f"subtask {st.id!r} has unknown type {st.type!r}")
+    for st in plan.subtasks:
+        for dep in st.depends_on:
+            if dep == st.id:
+                errors.append(f"subtask {st.id!r} depends on itself")
+            elif dep not in ids:
+                errors.append(f"subtask {st.id!r} depends on missing id {dep!r}")
+    if not errors:
+        # Kahn's algorithm: whatever cannot be ordered sits on a cycle
+        indegree = {st.id: len(set(st.depends_on)) for st in plan.subtasks}
+        dependents: Dict[str, List[str]] = {st.id: [] for st in plan.subtasks}
+        for st in plan.subtasks:
+            for dep in set(st.depends_on):
+                dependents[dep].append(st.id)
+        ready = [tid for tid, n in indegree.items() if n == 0]
+        while ready:
+            tid = ready.pop()
+            for child in dependents[tid]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        cyclic = sorted(tid for tid, n in indegree.items() if n > 0)
+        if cyclic:
+            errors.append(f"dependency cycle through {cyclic}")
+    if errors:
+        raise PlanValidationError(errors)
+    return plan
+
+
+class Planner(ABC):
+    """
+    Planner interface: `plan(topic, plan_id=None) -> Plan` (validated).
+
+    Subclasses implement `_subtasks(topic)`. With `memoize=True` the subtask
+    layout is cached per normalized topic (LRU, `cache_size` entries), so repeated
+    topics skip planning; every call still returns a fresh Plan for the given topic.
+    Concurrent misses on the same topic are single-flighted: one caller plans, the
+    others wait for its layout (or its error).
+    """
+
+    def __init__(self, memoize: bool = True, cache_size: int = DEFAULT_PLAN_CACHE_SIZE):
+        self.memoize = memoize
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._counts = {"hits": 0, "misses": 0}
+
+    @abstractmethod
+    def _subtasks(self, topic: str) -> List[SubTask]:
+        """Subtasks for `topic` (ids, types, payloads, dependencies); validated by `plan`."""
+
+    def _layout(self, topic: str) -> List[Dict[str, Any]]:
+        plan = validate_plan(Plan(plan_id="", topic=topic, subtasks=self._subtasks(topic)))
+        return [st.to_dict() for st in plan.subtasks]
+
+    def _memoized_layout(self, topic: str) -> List[Dict[str, Any]]:
+        key = normalize_topic(topic)
+        with self._lock:
+            layout = self._cache.get(key)
+            if layout is not None:
+                self._cache.move_to_end(key)
+                self._counts["hits"] += 1
+                return layout
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                self._inflight[key] = leader = Future()
+            else:
+                self._counts["hits"] += 1
+        if waiting is not None:
+            return waiting.result()
+        try:
+            layout = self._layout(topic)
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            leader.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._counts["misses"] += 1
+            self._cache[key] = layout
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        leader.set_result(layout)
+        return layout
+
+    def plan(self, topic: str, plan_id: Optional[str] = None) -> Plan:
+        layout = self._memoized_layout(topic) if self.memoize else self._layout(topic)
+        subtasks = [
+            SubTask(id=d["id"], type=d["type"], payload=dict(d["payload"], topic=topic), depends_on=list(d["depends_on"]))
+            for d in layout
+        ]
+        return Plan(plan_id=plan_id or str(uuid.uuid4()), topic=topic, subtasks=subtasks)
+
+    __call__ = plan
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts, cached=len(self._cache))
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class RulePlanner(Planner):
+    """The fixed research -> trends -> insights -> writer chain of `simple_planner`."""
+
+    def _subtasks(self, topic: str) -> List[SubTask]:
+        return simple_planner(topic).subtasks
+
+
+LLM_PLANNER_PROMPT = """You are planning a market research report on the topic:
+"{{ topic }}"
+
+Decompose it into at most {{ max_subtasks }} subtasks forming a dependency graph.
+Make independent work parallel: e.g. one research subtask per region, segment or
+angle, each with its own trends subtask, all fanning into insights, then one writer.
+
+Allowed types: {{ types | join(", ") }}.
+Reply with JSON only:
+{"subtasks": [{"id": "r1", "type": "research", "focus": "<what this subtask covers>", "depends_on": []}, ...]}
+"""
+
+
+class LLMPlanner(Planner):
+    """
+    Ask the LLM for a wide DAG of subtasks ({id, type, focus, depends_on}); each
+    subtask's payload is {"topic", "focus"}. Plans are validated (types, ids,
+    cycles, `max_subtasks`) before use; an unusable answer falls back to
+    `fallback` (RulePlanner) unless `strict=True`, which raises PlanValidationError.
+    A failing LLM call (adapter error, timeout) is logged and falls back the same way;
+    with `strict=True` the error propagates.
+    """
+
+    def __init__(
+        self,
+        llm_client,
+        prompt: str = LLM_PLANNER_PROMPT,
+        max_subtasks: int = DEFAULT_MAX_SUBTASKS,
+        allowed_types: Iterable[str] = PLANNABLE_TYPES,
+        fallback: Optional[Planner] = None,
+        strict: bool = False,
+        llm_kwargs: Optional[Dict[str, Any]] = None,
+        memoize: bool = True,
+        cache_size: int = DEFAULT_PLAN_CACHE_SIZE,
+    ):
+        super().__init__(memoize=memoize, cache_size=cache_size)
+        self.llm = llm_client
+        self.prompt = prompt
+        self.max_subtasks = max_subtasks
+        self.allowed_types = tuple(allowed_types)
+        self.fallback = fallback if fallback is not None else RulePlanner(memoize=False)
+        self.strict = strict
+        self.llm_kwargs = dict(llm_kwargs or {})
+        self._counts["fallbacks"] = 0
+
+    def _parse(self, topic: str, text: str) -> List[SubTask]:
+        parsed = llm_json.parse_maybe_json(text)
+        if isinstance(parsed, dict):
+            parsed = parsed.get("subtasks")
+        if not isinstance(parsed, list):
+            raise PlanValidationError(["planner reply has no subtask list"])
+        subtasks = []
+        for i, item in enumerate(parsed, 1):
+            if not isinstance(item, dict):
+                raise PlanValidationError([f"subtask #{i} is not an object"])
+            deps = item.get("depends_on") or []
+            if isinstance(deps, str):
+                deps = [deps]
+            tid, stype = item.get("id") or f"t{i}", item.get("type") or ""
+            if not isinstance(tid, (str, int)) or not isinstance(stype, str):
+                raise PlanValidationError([f"subtask #{i} has a non-string id or type"])
+            if not isinstance(deps, list) or not all(isinstance(d, (str, int)) for d in deps):
+                raise PlanValidationError([f"subtask #{i} has malformed depends_on {deps!r}"])
+            payload = {"topic": topic}
+            if item.get("focus"):
+                payload["focus"] = str(item["focus"])
+            subtasks.append(SubTask(id=str(tid), type=stype, payload=payload, depends_on=[str(d) for d in deps]))
+        validate_plan(Plan(plan_id="", topic=topic, subtasks=subtasks),
+                      allowed_types=self.allowed_types, max_subtasks=self.max_subtasks)
+        return subtasks
+
+    def _subtasks(self, topic: str) -> List[SubTask]:
+        prompt = prompt_loader.get_compiled(self.prompt).render(
+            topic=topic, max_subtasks=self.max_subtasks, types=self.allowed_types
+        )
+        return self._parse(topic, self.llm.generate(prompt, **self.llm_kwargs))
+
+    def plan(self, topic: str, plan_id: Optional[str] = None) -> Plan:
+        try:
+            return super().plan(topic, plan_id=plan_id)
+        except Exception as e:
+            if self.strict:
+                raise
+            if not isinstance(e, PlanValidationError):
+                logger.warning("LLM planner call failed for %r, using fallback plan: %s", topic, e)
+            # fallback plans are not memoized: the next call asks the LLM again
+            with self._lock:
+                self._counts["fallbacks"] += 1
+            return self.fallback.plan(topic, plan_id=plan_id)
+
+    __call__ = plan
@@ -1,5 +1,7 @@
 # src/agentic_report_swarm/factory/agent_factory.py
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Iterable, Mapping, Optional
+import threading
 from ..agents.generic_agent import GenericAgent
 from ..utils.llm_client import LLMClient
 from ..utils.template_registry import TemplateRegistry
@@ -10,22 +12,77 @@ class AgentFactory:
 
     Behavior:
     - If `templates` dict passed explicitly, use it.
-    - Else auto-load templates from config/agent_templates (via TemplateRegistry).
+    - Else use the process-wide TemplateRegistry for template_dir
+      (default config/agent_templates); every build sees its current snapshot,
+      so hot-reloaded templates are picked up without a new factory.
+    - Agents are pooled per agent type and reused while their template is the same
+      object (or, for path templates, the same file mtime). GenericAgent is stateless
+      per run, so pooled agents are shared across threads. `pool_agents=False`
+      restores one fresh agent per build.
+    - build(agent_type, template=..., config=...) overrides the template and/or agent
+      config (e.g. {"llm_kwargs": {"temperature": 1.0}}) and is never pooled.
+    - A `search_tool` (SearchTool) is given to the `search_types` agents (default:
+      research) so their prompts can cite the local document corpus.
     """
-    def __init__(self, llm_client: Optional[LLMClient] = None, templates: Optional[Dict[str, Dict]] = None, template_dir: Optional[str] = None):
+    def __init__(self, llm_client: Optional[LLMClient] = None, templates: Optional[Dict[str, Dict]] = None, template_dir: Optional[str] = None, pool_agents: bool = True,
+                 search_tool=None, search_types: Iterable[str] = ("research",)):
         self.llm_client = llm_client or LLMClient.from_env(prefer_real=False)
-        if templates is not None:
-            self.templates = templates
-        else:
-            registry = TemplateRegistry(template_dir)
-            self.templates = registry.templates
+        self._templates = templates
+        self.registry = TemplateRegistry.shared(template_dir) if templates is None else None
+        self.pool_agents = pool_agents
+        self.search_tool = search_tool
+        self.search_types = frozenset(search_types)
+        # agent_type -> (template object, template mtime, agent)
+        self._pool: Dict[str, tuple] = {}
+        self._pool_lock = threading.Lock()
 
-    def build(self, agent_type: str):
+    @property
+    def templates(self) -> Mapping[str, Dict]:
+        if self.registry is not None:
+            return self.registry.templates
+        return self._templates
+
+    @staticmethod
+    def _template_mtime(tpl: Any) -> Optional[int]:
+        if isinstance(tpl, str):
+            try:
+                return Path(tpl).stat().st_mtime_ns
+            except (OSError, ValueError):
+                return None
+        return None
+
+    def _new_agent(self, agent_type: str, tpl: Any, config: Optional[Dict[str, Any]] = None) -> GenericAgent:
+        name = f"{agent_type}_agent"
+        if self.search_tool is not None and agent_type in self.search_types:
+            config = dict(config or {})
+            config.setdefault("search_tool", self.search_tool)
+        # If tpl is a dict, pass it directly. If tpl is a path (string), GenericAgent can handle path strings.
+        return GenericAgent(name=name, llm_client=self.llm_client, template=tpl, config=config)
+
+    def build(self, agent_type: str, template: Any = None, config: Optional[Dict[str, Any]] = None):
         """
         Build GenericAgent with template if available.
         agent_type -> template key expected to match filename in config/agent_templates/
         """
+        if template is not None or config is not None:
+            tpl = template if template is not None else self.templates.get(agent_type)
+            return self._new_agent(agent_type, tpl, config)
         tpl = self.templates.get(agent_type)
-        name = f"{agent_type}_agent"
-        # If tpl is a dict, pass it directly. If tpl is a path (string), GenericAgent can handle path strings.
-        return GenericAgent(name=name, llm_client=self.llm_client, template=tpl)
+        if not self.pool_agents:
+            return self._new_agent(agent_type, tpl)
+        mtime = self._template_mtime(tpl)
+        with self._pool_lock:
+            entry = self._pool.get(agent_type)
+            if entry is not None:
+                pooled_tpl, pooled_mtime, agent = entry
+                same = pooled_tpl is tpl or (isinstance(tpl, str) and pooled_tpl == tpl)
+                if same and pooled_mtime == mtime:
+                    return agent
+        agent = self._new_agent(agent_type, tpl)
+        with self._pool_lock:
+            self._pool[agent_type] = (tpl, mtime, agent)
+        return agent
+
+    def clear_pool(self) -> None:
+        with self._pool_lock:
+            self._pool.clear()
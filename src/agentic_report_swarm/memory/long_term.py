@@ -0,0 +1,160 @@
+# src/agentic_report_swarm/memory/long_term.py
+"""
+Long-term report memory: finished reports, their subtask outputs and topic embeddings.
+
+Before planning, `run_topic(..., report_memory=mem)` asks `mem.lookup(topic)` for the
+most similar prior report at or above `similarity_threshold`:
+- younger than `max_age_s`            -> "reuse": every subtask output is reused
+                                          (no LLM calls, header uses the new topic)
+- younger than `refresh_age_s`        -> "refresh": only `stable_types` outputs
+                                          (background research) are reused; the
+                                          rest of the plan is recomputed from them
+- otherwise                           -> run from scratch
+`max_age_s` defaults to DEFAULT_MAX_AGE_S (one day); pass None to reuse forever.
+
+Storage is SQLite (reports + subtask outputs) plus a VectorStore of topic
+embeddings (numpy required). The default HashingEmbedder is lexical and order-free
+(bag of words minus TOPIC_STOPWORDS): it matches reworded topics sharing key terms;
+plug in a model embedder for semantic matches.
+
+Usage:
+    mem = ReportMemory(".cache/report_memory", similarity_threshold=0.8, max_age_s=7 * 86400)
+    md = run_topic("healthcare AI trends 2026", report_memory=mem)
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .vectorstore import HashingEmbedder, VectorStore
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+DEFAULT_MAX_AGE_S = 86400.0
+# generic report words that should not make topics look different (or alike)
+TOPIC_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "of", "in", "on", "for", "to", "with", "about",
+    "trends", "trend", "report", "analysis", "overview", "outlook", "market",
+})
+
+
+class ReportMemory:
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        embedder=None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_age_s: Optional[float] = DEFAULT_MAX_AGE_S,
+        refresh_age_s: Optional[float] = None,
+        stable_types: Iterable[str] = ("research",),
+    ):
+        self.path = Path(path) if path is not None else None
+        self.embedder = embedder or HashingEmbedder(dim=512, bigrams=False, stopwords=TOPIC_STOPWORDS)
+        self.similarity_threshold = similarity_threshold
+        self.max_age_s = max_age_s
+        self.refresh_age_s = refresh_age_s
+        self.stable_types = frozenset(stable_types)
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+        db = str(self.path / "reports.sqlite") if self.path is not None else ":memory:"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db, check_same_thread=False)
+        self.topics = VectorStore(path=self.path / "topics" if self.path is not None else None, embedder=self.embedder)
+        self._counts = {"lookups": 0, "reused": 0, "refreshed": 0, "stored": 0}
+        with self._lock:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                " report_id TEXT PRIMARY KEY, topic TEXT NOT NULL, plan_id TEXT, markdown TEXT NOT NULL, created REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS report_outputs ("
+                " report_id TEXT NOT NULL, subtask_id TEXT NOT NULL, subtask_type TEXT NOT NULL, output TEXT NOT NULL,"
+                " PRIMARY KEY (report_id, subtask_id));"
+            )
+            self._conn.commit()
+
+    def remember(self, topic: str, markdown: str, plan=None, results: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+        """Persist a finished report (and its successful subtask outputs); returns its id."""
+        report_id = uuid.uuid4().hex
+        rows = []
+        if plan is not None and results:
+            for st in plan.subtasks:
+                r = results.get(st.id)
+                if r and r.get("success"):
+                    rows.append((report_id, st.id, st.type, json.dumps(r.get("output"), default=str)))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO reports (report_id, topic, plan_id, markdown, created) VALUES (?, ?, ?, ?, ?)",
+                (report_id, topic, getattr(plan, "plan_id", None), markdown, time.time()),
+            )
+            self._conn.executemany(
+                "INSERT INTO report_outputs (report_id, subtask_id, subtask_type, output) VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+            self._counts["stored"] += 1
+        self.topics.add_texts([topic], ids=[report_id], metadata=[{"topic": topic}])
+        return report_id
+
+    def _load(self, report_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT topic, markdown, created FROM reports WHERE report_id = ?", (report_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            outputs = self._conn.execute(
+                "SELECT subtask_id, subtask_type, output FROM report_outputs WHERE report_id = ?", (report_id,)
+            ).fetchall()
+        return {
+            "topic": row[0], "markdown": row[1], "created": row[2],
+            "outputs": {sid: {"type": stype, "output": json.loads(out)} for sid, stype, out in outputs},
+        }
+
+    def lookup(self, topic: str, k: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Best prior report usable for `topic`, else None.
+        Returns {report_id, topic, similarity, age_s, mode, markdown, created, outputs}.
+        """
+        with self._lock:
+            self._counts["lookups"] += 1
+        if len(self.topics) == 0:
+            return None
+        now = time.time()
+        for report_id, similarity in self.topics.search_text(topic, k=k):
+            if similarity < self.similarity_threshold:
+                break
+            prior = self._load(report_id)
+            if prior is None:
+                continue
+            age = now - prior["created"]
+            if self.max_age_s is None or age <= self.max_age_s:
+                mode = "reuse"
+            elif self.refresh_age_s is not None and age <= self.refresh_age_s:
+                mode = "refresh"
+            else:
+                continue
+            with self._lock:
+                self._counts["reused" if mode == "reuse" else "refreshed"] += 1
+            prior.update(report_id=report_id, similarity=similarity, age_s=age, mode=mode)
+            return prior
+        return None
+
+    def seed_outputs(self, prior: Dict[str, Any], plan) -> Dict[str, Dict[str, Any]]:
+        """Prior outputs to reuse for `plan`'s subtasks (matched by id and type)."""
+        seeded = {}
+        for st in plan.subtasks:
+            stored = prior["outputs"].get(st.id)
+            if stored is None or stored["type"] != st.type:
+                continue
+            if prior["mode"] == "reuse" or st.type in self.stable_types:
+                seeded[st.id] = stored["output"]
+        return seeded
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self) -> None:
+        self.topics.close()
+        with self._lock:
+            self._conn.close()
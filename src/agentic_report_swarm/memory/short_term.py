@@ -0,0 +1,130 @@
+# src/agentic_report_swarm/memory/short_term.py
+"""
+Per-plan short-term memory: lets dependent subtasks read upstream results.
+
+SwarmManager records every successful subtask output in a ShortTermMemory and
+hands each dependent subtask `task["upstream"]`, an UpstreamView over its
+dependencies. The view holds references to the stored outputs (no copies);
+`view.context` renders them as prompt text under a token budget shared fairly
+between dependencies (short outputs give their unused share to long ones), so
+prompt size stays bounded however deep the plan gets.
+
+In a template:
+    {% if task.upstream is defined %}{{ task.upstream.context }}{% endif %}
+    {{ task.upstream.t1.text }}      # one raw upstream output
+"""
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..utils.retry import estimate_tokens
+
+DEFAULT_UPSTREAM_TOKEN_BUDGET = 1024
+TRUNCATION_MARKER = " …[truncated]"
+
+# summarizer(text, max_tokens) -> text of at most ~max_tokens
+Summarizer = Callable[[str, int], str]
+
+
+def output_text(output: Any) -> str:
+    """Prompt text for one subtask output (its `text` field, else JSON/str)."""
+    if isinstance(output, dict):
+        text = output.get("text")
+        if isinstance(text, str):
+            return text
+        return json.dumps(output, default=str, ensure_ascii=False)
+    return "" if output is None else str(output)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` to roughly `max_tokens` (~4 chars/token), preferring a word boundary."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max(0, max_tokens * 4 - len(TRUNCATION_MARKER))
+    cut = text[:limit]
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+    return cut.rstrip() + TRUNCATION_MARKER
+
+
+def allocate_budget(sizes: List[int], budget: int) -> List[int]:
+    """Split `budget` across items of the given token sizes; nobody gets more than they need."""
+    alloc = [0] * len(sizes)
+    remaining = budget
+    order = sorted(range(len(sizes)), key=sizes.__getitem__)
+    for n, i in enumerate(order):
+        share = remaining // (len(sizes) - n)
+        alloc[i] = min(sizes[i], share)
+        remaining -= alloc[i]
+    return alloc
+
+
+class ShortTermMemory:
+    """Outputs of finished subtasks of one plan, keyed by subtask id."""
+
+    def __init__(self, plan_id: Optional[str] = None, token_budget: int = DEFAULT_UPSTREAM_TOKEN_BUDGET, summarizer: Optional[Summarizer] = None):
+        self.plan_id = plan_id
+        self.token_budget = token_budget
+        self.summarizer = summarizer
+        self._outputs: Dict[str, Any] = {}
+        self._types: Dict[str, str] = {}
+
+    def put(self, subtask_id: str, output: Any, subtask_type: Optional[str] = None) -> None:
+        self._outputs[subtask_id] = output
+        if subtask_type is not None:
+            self._types[subtask_id] = subtask_type
+
+    def get(self, subtask_id: str, default: Any = None) -> Any:
+        return self._outputs.get(subtask_id, default)
+
+    def type_of(self, subtask_id: str) -> Optional[str]:
+        return self._types.get(subtask_id)
+
+    def __contains__(self, subtask_id: object) -> bool:
+        return subtask_id in self._outputs
+
+    def view(self, subtask_ids: Iterable[str], token_budget: Optional[int] = None) -> "UpstreamView":
+        return UpstreamView(self, subtask_ids, self.token_budget if token_budget is None else token_budget)
+
+
+class UpstreamView(Mapping):
+    """Read-only mapping subtask_id -> output over a subtask's dependencies."""
+
+    __slots__ = ("_memory", "_ids", "token_budget", "_context")
+
+    def __init__(self, memory: ShortTermMemory, subtask_ids: Iterable[str], token_budget: int):
+        self._memory = memory
+        self._ids = [sid for sid in dict.fromkeys(subtask_ids) if sid in memory]
+        self.token_budget = token_budget
+        self._context: Optional[str] = None
+
+    def __getitem__(self, subtask_id: str) -> Any:
+        if subtask_id not in self._ids:
+            raise KeyError(subtask_id)
+        return self._memory.get(subtask_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def context(self) -> str:
+        """Upstream outputs as markdown sections, fitted to `token_budget` (computed once)."""
+        if self._context is None:
+            texts = [output_text(self._memory.get(sid)) for sid in self._ids]
+            alloc = allocate_budget([estimate_tokens(t) for t in texts], self.token_budget)
+            summarize = self._memory.summarizer
+            parts = []
+            for sid, text, max_tokens in zip(self._ids, texts, alloc):
+                if estimate_tokens(text) > max_tokens:
+                    text = summarize(text, max_tokens) if summarize is not None else truncate_to_tokens(text, max_tokens)
+                label = self._memory.type_of(sid) or sid
+                parts.append(f"### {label} ({sid})\n{text}")
+            self._context = "\n\n".join(parts)
+        return self._context
+
+    def __str__(self) -> str:
+        return self.context
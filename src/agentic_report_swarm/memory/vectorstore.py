@@ -0,0 +1,323 @@
+# src/agentic_report_swarm/memory/vectorstore.py
+"""
+Embedded vector store for retrieving past research (NumPy).
+
+- VectorStore: float32 matrix of L2-normalised vectors, in memory or memory-mapped
+  on disk (`path` directory: vectors.f32 + ids.jsonl), with incremental inserts and
+  batched cosine top-k search (exact, blocked matrix products).
+- IVFIndex: approximate inverted-file index (spherical k-means coarse quantizer);
+  queries scan only the `n_probe` closest lists. Built with `store.build_index()`,
+  kept up to date by later inserts. The index lives in memory only: it is not
+  written to `path`, so a reopened store searches exactly until `build_index()` is
+  called again (training cost grows with n_lists * iters * min(n, sample_size)).
+- HashingEmbedder: deterministic local embedder (signed feature hashing of words and
+  word bigrams) for offline use and tests. Any object with `dim` and
+  `embed(texts) -> (n, dim) array` can be plugged in instead.
+
+Usage:
+    store = VectorStore(dim=256, path=".cache/research_vectors", embedder=HashingEmbedder(256))
+    store.add_texts(["EV battery supply chain ..."], metadata=[{"topic": "EV"}])
+    store.search_text("battery suppliers", k=5)  # [(id, score), ...]
+"""
+import hashlib
+import json
+import re
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple, Union
+
+DEFAULT_BLOCK_ROWS = 65536
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _import_numpy():
+    try:
+        import numpy  # type: ignore
+    except Exception as e:
+        raise RuntimeError("numpy package not installed. Install `numpy` to use the vector store.") from e
+    return numpy
+
+
+def _normalize(np, vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _topk(np, scores, k: int):
+    """Indices of the k largest scores per row, best first."""
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+class Embedder(Protocol):
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> Any: ...
+
+
+class HashingEmbedder:
+    """Deterministic signed feature-hashing embedder (stable across processes)."""
+
+    def __init__(self, dim: int = 256, bigrams: bool = True, stopwords: Optional[Iterable[str]] = None):
+        self.dim = dim
+        self.bigrams = bigrams
+        self.stopwords = frozenset(stopwords or ())
+
+    def _features(self, text: str) -> List[str]:
+        words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in self.stopwords]
+        feats = list(words)
+        if self.bigrams:
+            feats.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return feats
+
+    def embed(self, texts: Sequence[str]):
+        np = _import_numpy()
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feat in self._features(text):
+                h = int.from_bytes(hashlib.blake2b(feat.encode("utf-8"), digest_size=8).digest(), "little")
+                out[row, h % self.dim] += 1.0 if (h >> 63) & 1 else -1.0
+        return _normalize(np, out)
+
+
+class IVFIndex:
+    """Inverted-file ANN index over a VectorStore's rows (cosine similarity)."""
+
+    def __init__(self, n_lists: int = 256, n_probe: int = 8, iters: int = 10, seed: int = 0):
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.iters = iters
+        self.seed = seed
+        self.centroids = None
+        self._lists: List[Any] = []
+
+    def train(self, vectors, sample_size: int = 50_000) -> None:
+        """Spherical k-means on (a sample of) the normalised vectors."""
+        np = _import_numpy()
+        rng = np.random.default_rng(self.seed)
+        n = vectors.shape[0]
+        self.n_lists = max(1, min(self.n_lists, n))
+        sample = vectors[np.sort(rng.choice(n, size=min(n, sample_size), replace=False))]
+        centroids = sample[rng.choice(sample.shape[0], size=self.n_lists, replace=False)].copy()
+        for _ in range(self.iters):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = _normalize(np, sums)
+        self.centroids = centroids
+        self._lists = [np.empty(0, dtype=np.int64) for _ in range(self.n_lists)]
+
+    def assign(self, vectors, block_rows: int = DEFAULT_BLOCK_ROWS):
+        np = _import_numpy()
+        labels = np.empty(vectors.shape[0], dtype=np.int64)
+        for start in range(0, vectors.shape[0], block_rows):
+            block = vectors[start:start + block_rows]
+            labels[start:start + block.shape[0]] = np.argmax(block @ self.centroids.T, axis=1)
+        return labels
+
+    def add(self, vectors, first_row: int) -> None:
+        """Index rows first_row .. first_row + len(vectors) - 1."""
+        np = _import_numpy()
+        labels = self.assign(vectors)
+        rows = np.arange(first_row, first_row + vectors.shape[0], dtype=np.int64)
+        order = np.argsort(labels, kind="stable")
+        labels, rows = labels[order], rows[order]
+        bounds = np.flatnonzero(np.diff(labels)) + 1
+        for chunk_labels, chunk_rows in zip(np.split(labels, bounds), np.split(rows, bounds)):
+            if chunk_rows.size:
+                lst = int(chunk_labels[0])
+                self._lists[lst] = np.concatenate([self._lists[lst], chunk_rows])
+
+    def search(self, matrix, queries, k: int, n_probe: Optional[int] = None):
+        """Per query: (row indices, scores) of the approximate top-k, best first."""
+        np = _import_numpy()
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        probes = _topk(np, queries @ self.centroids.T, n_probe)
+        out = []
+        for q, lists in zip(queries, probes):
+            cand = np.concatenate([self._lists[i] for i in lists])
+            if cand.size == 0:
+                out.append((cand, np.empty(0, dtype=np.float32)))
+                continue
+            scores = matrix[cand] @ q
+            best = _topk(np, scores[None, :], k)[0]
+            out.append((cand[best], scores[best]))
+        return out
+
+
+class VectorStore:
+    """
+    Append-only cosine-similarity store. With `path`, vectors live in a growable
+    memory-mapped file and ids/metadata in a JSONL file, so the store reopens as-is.
+    """
+
+    def __init__(self, dim: Optional[int] = None, path: Optional[Union[str, Path]] = None, embedder: Optional[Embedder] = None, initial_capacity: int = 1024):
+        np = _import_numpy()
+        self.embedder = embedder
+        self.dim = dim or getattr(embedder, "dim", None)
+        if not self.dim:
+            raise ValueError("VectorStore needs `dim` or an embedder exposing `dim`")
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+        self._row_of: Dict[str, int] = {}
+        self.index: Optional[IVFIndex] = None
+        if self.path is None:
+            self._matrix = np.zeros((initial_capacity, self.dim), dtype=np.float32)
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._vec_file = self.path / "vectors.f32"
+        self._ids_file = self.path / "ids.jsonl"
+        if self._ids_file.exists():
+            with open(self._ids_file, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        rec = json.loads(line)
+                        self._row_of[rec["id"]] = len(self._ids)
+                        self._ids.append(rec["id"])
+                        self._metadata.append(rec.get("metadata"))
+        row_bytes = self.dim * 4
+        existing_rows = self._vec_file.stat().st_size // row_bytes if self._vec_file.exists() else 0
+        self._open_memmap(max(initial_capacity, existing_rows, len(self._ids)))
+        self._ids_fh = open(self._ids_file, "a", encoding="utf-8")
+
+    def _open_memmap(self, capacity: int) -> None:
+        np = _import_numpy()
+        size = capacity * self.dim * 4
+        with open(self._vec_file, "ab") as fh:
+            if fh.tell() < size:
+                fh.truncate(size)
+        self._matrix = np.memmap(self._vec_file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        if self.path is None:
+            np = _import_numpy()
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+            self._matrix = grown
+        else:
+            self._matrix.flush()
+            del self._matrix
+            self._open_memmap(capacity)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def vectors(self):
+        """Read-only view of the stored (normalised) vectors."""
+        return self._matrix[: len(self._ids)]
+
+    def add(self, vectors, ids: Optional[Sequence[str]] = None, metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> List[str]:
+        """Insert vectors (normalised on the way in); returns their ids."""
+        np = _import_numpy()
+        vectors = _normalize(np, vectors)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"expected vectors of dim {self.dim}, got {vectors.shape[1]}")
+        count = vectors.shape[0]
+        ids = [str(i) for i in ids] if ids is not None else [uuid.uuid4().hex for _ in range(count)]
+        metadata = list(metadata) if metadata is not None else [None] * count
+        if len(ids) != count or len(metadata) != count:
+            raise ValueError("ids/metadata must match the number of vectors")
+        with self._lock:
+            dup = [i for i in ids if i in self._row_of]
+            if dup:
+                raise ValueError(f"duplicate ids: {dup[:5]}")
+            start = len(self._ids)
+            self._ensure_capacity(start + count)
+            self._matrix[start:start + count] = vectors
+            if self.path is not None:
+                self._matrix.flush()
+                for vid, meta in zip(ids, metadata):
+                    self._ids_fh.write(json.dumps({"id": vid, "metadata": meta}, default=str) + "\n")
+                self._ids_fh.flush()
+            for offset, vid in enumerate(ids):
+                self._row_of[vid] = start + offset
+            self._ids.extend(ids)
+            self._metadata.extend(metadata)
+            if self.index is not None:
+                self.index.add(vectors, start)
+        return ids
+
+    def add_texts(self, texts: Sequence[str], metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None, ids: Optional[Sequence[str]] = None) -> List[str]:
+        if self.embedder is None:
+            raise RuntimeError("VectorStore has no embedder; pass vectors to add() instead")
+        return self.add(self.embedder.embed(list(texts)), ids=ids, metadata=metadata)
+
+    def get(self, vid: str) -> Optional[Dict[str, Any]]:
+        row = self._row_of.get(vid)
+        return None if row is None else self._metadata[row]
+
+    def build_index(self, n_lists: Optional[int] = None, n_probe: int = 8, iters: int = 10, seed: int = 0) -> IVFIndex:
+        """Train an IVF index over the current vectors (n_lists defaults to ~sqrt(n))."""
+        with self._lock:
+            n = len(self._ids)
+            if n == 0:
+                raise ValueError("cannot build an index over an empty store")
+            index = IVFIndex(n_lists=n_lists or max(1, int(n ** 0.5)), n_probe=n_probe, iters=iters, seed=seed)
+            index.train(self.vectors)
+            for start in range(0, n, DEFAULT_BLOCK_ROWS):
+                index.add(self.vectors[start:start + DEFAULT_BLOCK_ROWS], start)
+            self.index = index
+        return index
+
+    def search(self, queries, k: int = 10, exact: bool = False, n_probe: Optional[int] = None, block_rows: int = DEFAULT_BLOCK_ROWS) -> List[List[Tuple[str, float]]]:
+        """
+        Cosine top-k for a batch of query vectors (or one vector). Uses the IVF index
+        when built unless `exact=True`; exact search is a blocked matrix product.
+        """
+        np = _import_numpy()
+        queries = _normalize(np, queries)
+        with self._lock:
+            n = len(self._ids)
+            if n == 0:
+                return [[] for _ in range(queries.shape[0])]
+            matrix = self.vectors
+            if self.index is not None and not exact:
+                hits = self.index.search(matrix, queries, k, n_probe=n_probe)
+                return [[(self._ids[r], float(s)) for r, s in zip(rows, scores)] for rows, scores in hits]
+            best_rows = np.empty((queries.shape[0], 0), dtype=np.int64)
+            best_scores = np.empty((queries.shape[0], 0), dtype=np.float32)
+            for start in range(0, n, block_rows):
+                scores = queries @ matrix[start:start + block_rows].T
+                top = _topk(np, scores, k)
+                best_rows = np.concatenate([best_rows, top + start], axis=1)
+                best_scores = np.concatenate([best_scores, np.take_along_axis(scores, top, axis=1)], axis=1)
+                keep = _topk(np, best_scores, k)
+                best_rows = np.take_along_axis(best_rows, keep, axis=1)
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+            return [[(self._ids[r], float(s)) for r, s in zip(rows, scores)] for rows, scores in zip(best_rows, best_scores)]
+
+    def search_text(self, text: str, k: int = 10, **kwargs) -> List[Tuple[str, float]]:
+        if self.embedder is None:
+            raise RuntimeError("VectorStore has no embedder; pass vectors to search() instead")
+        return self.search(self.embedder.embed([text]), k=k, **kwargs)[0]
+
+    def flush(self) -> None:
+        with self._lock:
+            if self.path is not None:
+                self._matrix.flush()
+                self._ids_fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.path is not None:
+                self._matrix.flush()
+                self._ids_fh.close()
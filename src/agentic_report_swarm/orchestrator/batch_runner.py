@@ -0,0 +1,337 @@
+# src/agentic_report_swarm/orchestrator/batch_runner.py
+"""
+Multi-topic batch runner on top of `run_topic`.
+
+All topics share one AgentFactory (and therefore one LLM client and template set).
+Up to `max_concurrency` topics are in flight at any time; topics are pulled lazily
+from the input iterable and each finished report is handed to a sink immediately,
+so memory stays flat regardless of batch size.
+
+Input: any iterable of topic strings, or a path to a file with one topic per line
+(plain text, a JSON string, or a JSON object with a "topic" key).
+
+With `processes > 0` the batch is sharded across worker processes instead (see
+`iter_batch_processes`): rendering, JSON parsing and aggregation then run on as
+many cores as there are workers rather than under one GIL.
+"""
+import contextvars
+import itertools
+import json
+import multiprocessing
+from multiprocessing import connection as mp_connection
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from ..factory.agent_factory import AgentFactory
+from .super_agent import run_topic
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def read_topics(source: Union[str, Path, Iterable[str]]) -> Iterator[str]:
+    """Yield topics from a file path (txt/JSONL) or pass through an iterable of strings."""
+    if not isinstance(source, (str, Path)):
+        yield from source
+        return
+    with open(source, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] in '{"':
+                try:
+                    obj = json.loads(line)
+                except ValueError:
+                    yield line
+                    continue
+                if isinstance(obj, dict):
+                    obj = obj.get("topic")
+                if obj:
+                    yield str(obj)
+            else:
+                yield line
+
+
+def _slug(topic: str, max_len: int = 60) -> str:
+    slug = re.sub(r"[^a-zA-Z0-9]+", "-", topic).strip("-").lower()
+    return slug[:max_len] or "topic"
+
+
+class DirectorySink:
+    """Write each successful report to `<out_dir>/<index>-<slug>.md`."""
+
+    def __init__(self, out_dir: Union[str, Path]):
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        if not item["success"]:
+            return
+        path = self.out_dir / f"{item['index']:06d}-{_slug(item['topic'])}.md"
+        path.write_text(item["markdown"], encoding="utf-8")
+
+    def close(self) -> None:
+        pass
+
+
+class JSONLSink:
+    """Append one JSON line per finished topic (successes and failures)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, item: Dict[str, Any]) -> None:
+        line = json.dumps(item, ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def _run_one(index: int, topic: str, agent_factory: AgentFactory, max_workers: int, report_memory=None, planner=None) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        md = run_topic(topic, agent_factory=agent_factory, max_workers=max_workers, report_memory=report_memory,
+                       planner=planner)
+        item = {"index": index, "topic": topic, "success": True, "markdown": md}
+    except Exception as e:
+        item = {"index": index, "topic": topic, "success": False, "error": str(e)}
+    item["elapsed_s"] = round(time.perf_counter() - started, 4)
+    return item
+
+
+def iter_batch(
+    topics: Iterable[str],
+    agent_factory: AgentFactory,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_workers: int = 1,
+    report_memory=None,
+    planner=None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run topics concurrently and yield {index, topic, success, markdown|error, elapsed_s}
+    in completion order. At most `max_concurrency` topics are in flight; `max_workers`
+    is the per-plan subtask concurrency passed to SwarmManager. A shared
+    `report_memory` (ReportMemory) lets near-duplicate topics reuse earlier reports,
+    and a shared memoizing `planner` plans each distinct topic once.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    yield from _iter_indexed(enumerate(topics), agent_factory, max_concurrency, max_workers, report_memory, planner)
+
+
+def _iter_indexed(
+    jobs: Iterable[Tuple[int, str]],
+    agent_factory: AgentFactory,
+    max_concurrency: int,
+    max_workers: int,
+    report_memory=None,
+    planner=None,
+) -> Iterator[Dict[str, Any]]:
+    it = iter(jobs)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        running = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < max_concurrency:
+                nxt = next(it, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                index, topic = nxt
+                running.add(pool.submit(contextvars.copy_context().run, _run_one, index, topic, agent_factory,
+                                        max_workers, report_memory, planner))
+            if not running:
+                return
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+
+
+def _worker_main(worker_id, in_q, conn, factory_builder, planner_builder, max_concurrency, max_workers) -> None:
+    """Worker process: build a warm AgentFactory once, then run topics from `in_q` until a None arrives."""
+    # results go over a per-worker pipe: send() is synchronous, so nothing finished is
+    # lost if the process dies later, and the parent sees EOF when it does
+    try:
+        af = factory_builder()
+        planner = planner_builder(af) if planner_builder is not None else None
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    def jobs():
+        while True:
+            job = in_q.get()
+            if job is None:
+                return
+            yield job
+
+    for item in _iter_indexed(jobs(), af, max_concurrency, max_workers, planner=planner):
+        conn.send(("item", item))
+    conn.close()
+
+
+def iter_batch_processes(
+    topics: Iterable[str],
+    factory_builder: Callable[[], AgentFactory],
+    processes: Optional[int] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_workers: int = 1,
+    planner_builder: Optional[Callable[[AgentFactory], Any]] = None,
+    start_method: str = "spawn",
+) -> Iterator[Dict[str, Any]]:
+    """
+    Like `iter_batch`, sharded across `processes` worker processes (default: one per CPU).
+
+    Each worker calls `factory_builder()` once (and `planner_builder(factory)`, if
+    given) so it has its own LLM client, template cache and planner memo, then runs
+    up to `max_concurrency` topics at a time, pulling them from a shared bounded
+    queue; finished items stream back as they complete. Both builders must be
+    picklable (module-level functions or functools.partial of them).
+
+    A worker that fails to build raises RuntimeError here; topics held by a worker
+    that dies mid-batch (and, if every worker died, the undispatched rest) are
+    yielded as failures.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    processes = processes or os.cpu_count() or 1
+    ctx = multiprocessing.get_context(start_method)
+    in_q = ctx.Queue(maxsize=processes * max_concurrency)
+    procs, readers = [], {}
+    for i in range(processes):
+        reader, writer = ctx.Pipe(duplex=False)
+        p = ctx.Process(target=_worker_main, name=f"report-batch-{i}", daemon=True,
+                        args=(i, in_q, writer, factory_builder, planner_builder, max_concurrency, max_workers))
+        p.start()
+        writer.close()  # the worker holds the only write end: EOF once it exits
+        procs.append(p)
+        readers[reader] = i
+
+    pending: Dict[int, str] = {}  # dispatched, not yet reported
+    lock = threading.Lock()
+    stop = threading.Event()
+    feed_error = []
+    jobs = enumerate(topics)
+
+    def put(obj) -> bool:
+        while not stop.is_set():
+            try:
+                in_q.put(obj, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def feed():
+        try:
+            for index, topic in jobs:
+                with lock:
+                    pending[index] = topic
+                if not put((index, topic)):
+                    return
+            for _ in procs:
+                if not put(None):
+                    return
+        except Exception as e:
+            feed_error.append(e)
+            stop.set()
+
+    feeder = threading.Thread(target=feed, name="report-batch-feeder", daemon=True)
+    feeder.start()
+    try:
+        while readers and not feed_error:
+            for reader in mp_connection.wait(list(readers), timeout=0.2):
+                try:
+                    kind, item = reader.recv()
+                except EOFError:
+                    # finished (or crashed); a crashed worker's unreported topics fail below
+                    del readers[reader]
+                    reader.close()
+                    continue
+                if kind == "error":
+                    raise RuntimeError(f"batch worker {readers[reader]} failed to start: {item}")
+                with lock:
+                    pending.pop(item["index"], None)
+                yield item
+        if feed_error:
+            raise feed_error[0]
+        stop.set()
+        feeder.join()
+        with lock:
+            lost = sorted(pending.items())
+        for index, topic in itertools.chain(lost, jobs):
+            yield {"index": index, "topic": topic, "success": False, "error": "worker process exited", "elapsed_s": 0.0}
+    finally:
+        stop.set()
+        for p in procs:
+            p.join(timeout=1.0)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        for reader in readers:
+            reader.close()
+        in_q.close()
+
+
+def run_batch(
+    topics: Union[str, Path, Iterable[str]],
+    sink=None,
+    llm_client=None,
+    templates: Optional[dict] = None,
+    template_dir: Optional[str] = None,
+    agent_factory: Optional[AgentFactory] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_workers: int = 1,
+    report_memory=None,
+    planner=None,
+    processes: int = 0,
+    factory_builder: Optional[Callable[[], AgentFactory]] = None,
+    planner_builder: Optional[Callable[[AgentFactory], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate reports for many topics and stream each one to `sink` as it finishes.
+
+    `processes > 0` shards the batch across that many worker processes, each
+    building its own AgentFactory with `factory_builder` (required, since LLM clients
+    do not pickle) and planner with `planner_builder`; `max_concurrency` then applies
+    per process. `report_memory` and `planner` are in-process objects and are not
+    used in that mode.
+
+    Returns a summary {total, succeeded, failed, elapsed_s}.
+    """
+    if processes > 0:
+        if factory_builder is None:
+            raise ValueError("processes > 0 requires a picklable factory_builder")
+        items = iter_batch_processes(read_topics(topics), factory_builder, processes=processes,
+                                     max_concurrency=max_concurrency, max_workers=max_workers,
+                                     planner_builder=planner_builder)
+    else:
+        af = agent_factory or AgentFactory(llm_client=llm_client, templates=templates, template_dir=template_dir)
+        items = iter_batch(read_topics(topics), af, max_concurrency=max_concurrency, max_workers=max_workers,
+                           report_memory=report_memory, planner=planner)
+    summary = {"total": 0, "succeeded": 0, "failed": 0}
+    started = time.perf_counter()
+    try:
+        for item in items:
+            summary["total"] += 1
+            summary["succeeded" if item["success"] else "failed"] += 1
+            if sink is not None:
+                sink.write(item)
+    finally:
+        if sink is not None:
+            sink.close()
+    summary["elapsed_s"] = round(time.perf_counter() - started, 4)
+    return summary
@@ -0,0 +1,225 @@
+# src/agentic_report_swarm/orchestrator/job_queue.py
+"""
+In-process report job queue (the engine behind the HTTP service).
+
+A fixed pool of worker threads pulls topics from a bounded queue and runs the
+`stream_topic` pipeline on one shared AgentFactory, so the LLM client (connection
+pool, rate limiter, caches) and compiled templates / pooled agents stay warm across
+jobs. `submit` raises QueueFull instead of blocking when `max_queued` jobs are
+waiting; callers turn that into backpressure (HTTP 429).
+
+Each ReportJob collects its report sections as they finish; `wait_sections` blocks
+until there is something new. Listeners (`add_listener`) are called from the worker
+thread on every change, which lets asyncio code (the SSE endpoint) wake up without
+parking a thread per subscriber.
+
+Usage:
+    jobs = JobQueue(AgentFactory(llm_client=client), workers=4, max_queued=64)
+    job = jobs.submit("AI in healthcare")
+    for section in job.iter_sections():
+        ...
+    jobs.close()
+"""
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..factory.agent_factory import AgentFactory
+from ..swarm.swarm_manager import DEFAULT_MAX_WORKERS
+from .super_agent import stream_topic
+
+DEFAULT_JOB_WORKERS = 4
+DEFAULT_MAX_QUEUED = 64
+DEFAULT_RETAIN_JOBS = 1000
+
+
+class QueueFull(RuntimeError):
+    """The job queue is at capacity; retry later."""
+
+
+class ReportJob:
+    """One report request and its progress (sections are appended as they finish)."""
+
+    def __init__(self, topic: str):
+        self.id = uuid.uuid4().hex
+        self.topic = topic
+        self.status = "queued"  # queued -> running -> done | failed
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.sections: List[str] = []
+        self._cond = threading.Condition()
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed")
+
+    @property
+    def markdown(self) -> str:
+        with self._cond:
+            return "".join(self.sections)
+
+    def add_listener(self, fn: Callable[[], None]) -> None:
+        """Call `fn()` (from the worker thread) whenever a section is added or the status changes."""
+        with self._cond:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[], None]) -> None:
+        with self._cond:
+            if fn in self._listeners:
+                self._listeners.remove(fn)
+
+    def _notify(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+            listeners = list(self._listeners)
+        for fn in listeners:
+            try:
+                fn()
+            except Exception:
+                pass  # a broken subscriber must not fail the job
+
+    def _append(self, section: str) -> None:
+        with self._cond:
+            self.sections.append(section)
+        self._notify()
+
+    def _set_status(self, status: str, error: Optional[str] = None) -> None:
+        with self._cond:
+            self.status = status
+            if status == "running":
+                self.started = time.time()
+            elif status in ("done", "failed"):
+                self.finished = time.time()
+                self.error = error
+        self._notify()
+
+    def wait_sections(self, start: int, timeout: Optional[float] = None) -> Tuple[List[str], bool]:
+        """Sections from index `start` on (waits up to `timeout` for new ones) and whether the job is done."""
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.sections) > start or self.done, timeout=timeout)
+            return self.sections[start:], self.done
+
+    def iter_sections(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """Yield sections as they finish until the job is done."""
+        idx = 0
+        while True:
+            new, done = self.wait_sections(idx, timeout)
+            yield from new
+            idx += len(new)
+            if done and not new:
+                return
+
+    def to_dict(self, include_markdown: bool = True) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = {
+                "job_id": self.id, "topic": self.topic, "status": self.status,
+                "sections": len(self.sections), "created": self.created,
+                "started": self.started, "finished": self.finished,
+            }
+            if self.error is not None:
+                out["error"] = self.error
+            if include_markdown and self.status == "done":
+                out["markdown"] = "".join(self.sections)
+        return out
+
+
+_STOP_POLL_S = 0.2  # how often idle workers check for close()
+
+
+class JobQueue:
+    def __init__(
+        self,
+        agent_factory: AgentFactory,
+        workers: int = DEFAULT_JOB_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        retain: int = DEFAULT_RETAIN_JOBS,
+        planner=None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.agent_factory = agent_factory
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.retain = retain
+        self.planner = planner
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queued)
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"submitted": 0, "rejected": 0, "done": 0, "failed": 0}
+        self._closed = False
+        self._stopping = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"report-job-{i}", daemon=True) for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, topic: str) -> ReportJob:
+        """Enqueue a report; raises QueueFull when `max_queued` jobs are already waiting."""
+        job = ReportJob(topic)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("job queue is closed")
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._counts["rejected"] += 1
+                raise QueueFull(f"{self.max_queued} jobs already queued") from None
+            self._jobs[job.id] = job
+            self._counts["submitted"] += 1
+            self._evict()
+        return job
+
+    def _evict(self) -> None:
+        # forget the oldest finished jobs beyond `retain` (unfinished ones are kept)
+        excess = len(self._jobs) - self.retain
+        for job_id in [jid for jid, j in self._jobs.items() if j.done][:max(0, excess)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                job = self._queue.get(timeout=_STOP_POLL_S)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return  # closed and drained
+                continue
+            job._set_status("running")
+            try:
+                for section in stream_topic(job.topic, agent_factory=self.agent_factory, max_workers=self.max_workers,
+                                            planner=self.planner):
+                    job._append(section)
+                job._set_status("done")
+            except Exception as e:
+                job._set_status("failed", str(e))
+            with self._lock:
+                self._counts[job.status] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counts)
+            out["running"] = sum(1 for j in self._jobs.values() if j.status == "running")
+        out.update(queued=self._queue.qsize(), max_queued=self.max_queued, workers=len(self._threads))
+        return out
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting jobs; workers finish what is queued, then exit. Never blocks unless `wait`."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stopping.set()
+        if wait:
+            for t in self._threads:
+                t.join()
@@ -1,47 +1,169 @@
 # src/agentic_report_swarm/orchestrator/super_agent.py
-from ..core.planner import simple_planner
+from ..core.planner import Planner, simple_planner, stable_plan_id, validate_plan
 from ..factory.agent_factory import AgentFactory
-from ..swarm.swarm_manager import SwarmManager
-from typing import Optional
+from ..swarm.swarm_manager import SwarmManager, DEFAULT_MAX_WORKERS
+from ..swarm.result_store import ResultStore
+from ..memory.long_term import ReportMemory
+from ..utils.logging import span
+from typing import Callable, Iterator, Optional
+import queue
+import threading
+
+def render_report_header(plan) -> str:
+    return f"# Research Report — {plan.topic}\n"
+
+def render_section(st, r: Optional[dict]) -> str:
+    """Markdown for one subtask section (heading + body)."""
+    heading = f"---\n### {st.type} (task {st.id})\n"
+    if not r:
+        return heading + "\n_No result_\n"
+    if r.get("success"):
+        out = r.get("output") or {}
+        text = out.get("text") if isinstance(out, dict) else str(out)
+        # fallback: convert whole output to string if no text field
+        if not text:
+            text = str(out)
+        return heading + f"\n{text}\n"
+    return heading + f"\n**FAILED**: {r.get('error')}\n"
 
 def aggregate_to_markdown(plan, results: dict) -> str:
     """Build a simple markdown report from plan + results (order preserved)."""
-    parts = [f"# Research Report — {plan.topic}\n"]
+    parts = [render_report_header(plan)]
     for st in plan.subtasks:
-        parts.append(f"---\n### {st.type} (task {st.id})\n")
-        r = results.get(st.id)
-        if not r:
-            parts.append("_No result_\n")
-            continue
-        if r.get("success"):
-            out = r.get("output") or {}
-            text = out.get("text") if isinstance(out, dict) else str(out)
-            # fallback: convert whole output to string if no text field
-            if not text:
-                text = str(out)
-            parts.append(f"{text}\n")
-        else:
-            parts.append(f"**FAILED**: {r.get('error')}\n")
+        parts.append(render_section(st, results.get(st.id)))
     return "\n".join(parts)
 
-def run_topic(topic: str, templates: Optional[dict] = None, llm_client=None) -> str:
+def _make_plan(topic: str, plan_id: Optional[str], planner: Optional[Planner]):
+    if planner is None:
+        return validate_plan(simple_planner(topic, plan_id=plan_id))
+    return planner.plan(topic, plan_id=plan_id)
+
+def run_topic(
+    topic: str,
+    templates: Optional[dict] = None,
+    llm_client=None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    agent_factory: Optional[AgentFactory] = None,
+    result_store: Optional[ResultStore] = None,
+    plan_id: Optional[str] = None,
+    report_memory: Optional[ReportMemory] = None,
+    fanout: Optional[dict] = None,
+    speculative: bool = False,
+    subtask_timeout: Optional[float] = None,
+    plan_timeout: Optional[float] = None,
+    planner: Optional[Planner] = None,
+) -> str:
     """
     Top-level pipeline:
       - plan
-      - create factory (llm_client + templates)
+      - create factory (llm_client + templates), unless a shared one is passed
       - swarm execute
       - aggregate -> markdown string
+
+    With a `result_store` the plan id defaults to a stable per-topic id, so rerunning
+    after a partial failure only recomputes the failed/invalidated subtasks.
+
+    With a `report_memory`, a semantically close prior report is looked up before
+    planning and reused (or its research reused and the rest refreshed); newly
+    computed reports are remembered. `fanout` ({agent_type: ParallelRunner}) runs
+    those subtasks as scored parallel candidates; `speculative` starts dependents
+    whose prompts ignore upstream output before their dependencies finish.
+    `subtask_timeout` / `plan_timeout` (seconds) bound every LLM call they cover;
+    subtasks that run out of time fail with `deadline_exceeded`.
+    `planner` (e.g. a memoizing LLMPlanner) replaces `simple_planner`; the plan is
+    validated before anything runs (PlanValidationError).
     """
-    # 1. plan
-    plan = simple_planner(topic)
+    if plan_id is None and result_store is not None:
+        plan_id = stable_plan_id(topic)
+    with span("report", topic=topic) as report_span:
+        # 1. plan
+        with span("plan", topic=topic) as sp:
+            plan = _make_plan(topic, plan_id, planner)
+            sp.set(plan_id=plan.plan_id, subtasks=len(plan.subtasks))
+        report_span.set(plan_id=plan.plan_id)
+
+        prior = None
+        seed = None
+        if report_memory is not None:
+            with span("memory_lookup") as sp:
+                prior = report_memory.lookup(topic)
+                if prior is not None:
+                    seed = report_memory.seed_outputs(prior, plan)
+                    sp.set(reused_from=prior["report_id"], similarity=round(prior["similarity"], 4), mode=prior["mode"])
 
-    # 2. setup factory (allow injecting llm_client / templates)
-    af = AgentFactory(llm_client=llm_client, templates=templates or {})
+        # 2. setup factory (allow injecting llm_client / templates)
+        af = agent_factory or AgentFactory(llm_client=llm_client, templates=templates or {})
 
-    # 3. execute via swarm manager
-    swarm = SwarmManager(agent_factory=af)
-    results = swarm.execute_plan(plan)
+        # 3. execute via swarm manager
+        swarm = SwarmManager(agent_factory=af, max_workers=max_workers, result_store=result_store, fanout=fanout,
+                             speculative=speculative, subtask_timeout=subtask_timeout, plan_timeout=plan_timeout)
+        results = swarm.execute_plan(plan, seed_outputs=seed)
+        report_span.set(**swarm.last_run_stats)
 
-    # 4. aggregate
-    md = aggregate_to_markdown(plan, results)
+        # 4. aggregate
+        with span("aggregate") as sp:
+            md = aggregate_to_markdown(plan, results)
+            sp.set(report_chars=len(md))
+
+        if report_memory is not None and swarm.last_run_stats["recomputed"] and all(r.get("success") for r in results.values()):
+            report_memory.remember(topic, md, plan, results)
     return md
+
+_DONE = object()
+
+def stream_topic(
+    topic: str,
+    templates: Optional[dict] = None,
+    llm_client=None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    agent_factory: Optional[AgentFactory] = None,
+    on_chunk: Optional[Callable[[str, str], None]] = None,
+    result_store: Optional[ResultStore] = None,
+    plan_id: Optional[str] = None,
+    planner: Optional[Planner] = None,
+) -> Iterator[str]:
+    """
+    Streaming variant of `run_topic`: yields the report header immediately, then each
+    section as soon as it and every section before it (plan order) have finished.
+    "".join(stream_topic(...)) equals the `run_topic` markdown.
+    `on_chunk(task_id, text)` additionally receives partial LLM output as it streams.
+    """
+    if plan_id is None and result_store is not None:
+        plan_id = stable_plan_id(topic)
+    with span("plan", topic=topic) as sp:
+        plan = _make_plan(topic, plan_id, planner)
+        sp.set(plan_id=plan.plan_id, subtasks=len(plan.subtasks))
+    af = agent_factory or AgentFactory(llm_client=llm_client, templates=templates or {})
+    swarm = SwarmManager(agent_factory=af, max_workers=max_workers, result_store=result_store)
+
+    finished: "queue.Queue" = queue.Queue()
+    failure = []
+
+    def _execute():
+        try:
+            swarm.execute_plan(plan, on_result=finished.put, on_chunk=on_chunk)
+        except BaseException as e:  # surfaced to the consumer below
+            failure.append(e)
+        finally:
+            finished.put(_DONE)
+
+    worker = threading.Thread(target=_execute, name=f"stream_topic:{plan.plan_id}", daemon=True)
+    worker.start()
+
+    yield render_report_header(plan)
+    results: dict = {}
+    next_idx = 0
+    while True:
+        item = finished.get()
+        if item is _DONE:
+            break
+        results[item["id"]] = item
+        while next_idx < len(plan.subtasks) and plan.subtasks[next_idx].id in results:
+            st = plan.subtasks[next_idx]
+            yield "\n" + render_section(st, results[st.id])
+            next_idx += 1
+    worker.join()
+    if failure:
+        raise failure[0]
+    for st in plan.subtasks[next_idx:]:
+        yield "\n" + render_section(st, results.get(st.id))
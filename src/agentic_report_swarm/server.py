@@ -0,0 +1,144 @@
+# src/agentic_report_swarm/server.py
+"""
+HTTP report service (FastAPI): one long-lived process, warm LLM client and templates.
+
+Endpoints:
+    POST /reports {"topic": "..."}     -> 202 {job_id, status, ...}; 429 when the queue is full
+    GET  /reports/{job_id}             -> job status (markdown once done)
+    GET  /reports/{job_id}/events      -> server-sent events: one `section` event per
+                                          finished section, then `done` (or `failed`)
+    GET  /healthz                      -> queue stats
+
+Usage:
+    python -m agentic_report_swarm.cli serve --port 8000 --jobs 4 --queue-size 64
+    uvicorn "agentic_report_swarm.server:create_app" --factory
+"""
+import asyncio
+import contextlib
+import json
+from typing import Optional
+
+from .factory.agent_factory import AgentFactory
+from .orchestrator.job_queue import DEFAULT_JOB_WORKERS, DEFAULT_MAX_QUEUED, JobQueue, QueueFull
+from .swarm.swarm_manager import DEFAULT_MAX_WORKERS
+from .utils.llm_client import LLMClient
+
+SSE_KEEPALIVE_S = 15.0
+SSE_DISCONNECT_POLL_S = 1.0
+QUEUE_FULL_RETRY_AFTER_S = 5
+
+
+def _import_fastapi():
+    try:
+        import fastapi  # type: ignore
+        import pydantic  # type: ignore
+    except Exception as e:
+        raise RuntimeError("fastapi package not installed. Install `fastapi` and `uvicorn` to run the service.") from e
+    return fastapi, pydantic
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def create_app(
+    agent_factory: Optional[AgentFactory] = None,
+    jobs: Optional[JobQueue] = None,
+    workers: int = DEFAULT_JOB_WORKERS,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    prefer_real: bool = False,
+):
+    """
+    Build the FastAPI app. All jobs share `agent_factory` (default: one from
+    `LLMClient.from_env`); pass `jobs` to supply a preconfigured JobQueue.
+    """
+    fastapi, pydantic = _import_fastapi()
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    if jobs is None:
+        af = agent_factory or AgentFactory(llm_client=LLMClient.from_env(prefer_real=prefer_real))
+        jobs = JobQueue(af, workers=workers, max_queued=max_queued, max_workers=max_workers)
+
+    class ReportRequest(pydantic.BaseModel):
+        topic: str = pydantic.Field(min_length=1, max_length=500)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        jobs.close(wait=False)
+
+    app = fastapi.FastAPI(title="Agentic Report Swarm", lifespan=lifespan)
+    app.state.jobs = jobs
+
+    def _job_or_404(job_id: str):
+        job = jobs.get(job_id)
+        if job is None:
+            raise fastapi.HTTPException(status_code=404, detail="unknown job")
+        return job
+
+    @app.post("/reports", status_code=202)
+    def submit_report(req: ReportRequest):
+        try:
+            job = jobs.submit(req.topic.strip())
+        except QueueFull as e:
+            return JSONResponse({"detail": str(e)}, status_code=429,
+                                headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER_S)})
+        out = job.to_dict(include_markdown=False)
+        out["links"] = {"status": f"/reports/{job.id}", "events": f"/reports/{job.id}/events"}
+        return out
+
+    @app.get("/reports/{job_id}")
+    def report_status(job_id: str):
+        return _job_or_404(job_id).to_dict()
+
+    @app.get("/reports/{job_id}/events")
+    async def report_events(job_id: str, request: fastapi.Request):
+        job = _job_or_404(job_id)
+
+        async def events():
+            # the job wakes this coroutine through the event loop: no thread is held per subscriber
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+
+            def notify():
+                with contextlib.suppress(RuntimeError):  # loop already closed
+                    loop.call_soon_threadsafe(changed.set)
+
+            job.add_listener(notify)
+            try:
+                idx = 0
+                quiet_since = loop.time()
+                while True:
+                    changed.clear()
+                    new, done = job.wait_sections(idx, timeout=0)
+                    for section in new:
+                        yield _sse("section", {"index": idx, "markdown": section})
+                        idx += 1
+                    if done and not new:
+                        break
+                    if new:
+                        quiet_since = loop.time()
+                        continue
+                    if await request.is_disconnected():
+                        return
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(changed.wait(), SSE_DISCONNECT_POLL_S)
+                    if not changed.is_set() and loop.time() - quiet_since >= SSE_KEEPALIVE_S:
+                        quiet_since = loop.time()
+                        yield ": keepalive\n\n"
+                if job.status == "failed":
+                    yield _sse("failed", {"error": job.error})
+                else:
+                    yield _sse("done", {"sections": idx})
+            finally:
+                job.remove_listener(notify)
+
+        return StreamingResponse(events(), media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    @app.get("/healthz")
+    def healthz():
+        return {"status": "ok", **jobs.stats()}
+
+    return app
@@ -0,0 +1,114 @@
+# src/agentic_report_swarm/swarm/parallel_runner.py
+"""
+Fan-out execution of one subtask: run N candidate variants concurrently, score
+them and reduce to a single output.
+
+A variant is {"llm_kwargs": {...}, "template": {...}} (both optional); the default
+variants spread temperature. With `threshold`, the first candidate scoring at or
+above it wins immediately: queued variants are cancelled, in-flight ones are
+cancelled through the LLM client (CancelToken) and the runner returns without
+waiting for them. `max_parallel` < n staggers the launches, so the
+extra spend is bounded when an early candidate is already good enough.
+
+Usage:
+    runner = ParallelRunner(n=3, scorer=default_scorer(), threshold=0.9)
+    swarm = SwarmManager(agent_factory=af, fanout={"writer": runner})
+"""
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.cancellation import CancelToken, cancel_scope
+from ..utils.logging import span
+from .reducer import Reducer, pick_best
+from .scoring import Scorer, default_scorer
+
+
+def temperature_variants(n: int, low: float = 0.2, high: float = 1.0) -> List[Dict[str, Any]]:
+    if n == 1:
+        return [{"llm_kwargs": {"temperature": low}}]
+    step = (high - low) / (n - 1)
+    return [{"llm_kwargs": {"temperature": round(low + i * step, 3)}} for i in range(n)]
+
+
+class ParallelRunner:
+    def __init__(
+        self,
+        n: int = 3,
+        variants: Optional[List[Dict[str, Any]]] = None,
+        scorer: Optional[Scorer] = None,
+        reducer: Reducer = pick_best,
+        threshold: Optional[float] = None,
+        max_parallel: Optional[int] = None,
+    ):
+        self.variants = list(variants) if variants is not None else temperature_variants(n)
+        if not self.variants:
+            raise ValueError("ParallelRunner needs at least one variant")
+        self.scorer = scorer or default_scorer()
+        self.reducer = reducer
+        self.threshold = threshold
+        self.max_parallel = max_parallel or len(self.variants)
+
+    def _candidate(self, index: int, build_agent: Callable[[Dict[str, Any]], Any], task: Dict[str, Any], token: CancelToken) -> Dict[str, Any]:
+        variant = self.variants[index]
+        started = time.perf_counter()
+        with span("candidate", variant=index), cancel_scope(token):
+            output = build_agent(variant).run(task)
+        return {"index": index, "variant": variant, "output": output, "score": 0.0,
+                "elapsed_s": round(time.perf_counter() - started, 4)}
+
+    def run(self, build_agent: Callable[[Dict[str, Any]], Any], task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the variants of `task`; `build_agent(variant)` returns the agent for one
+        variant. Returns the reduced output with `meta.fanout` describing the candidates.
+        Raises the first error if every candidate fails.
+        """
+        candidates: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        pending = list(range(len(self.variants)))
+        winner_early = False
+        tokens = [CancelToken() for _ in self.variants]
+        pool = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="fanout")
+        try:
+            running = set()
+            while pending or running:
+                while pending and len(running) < self.max_parallel:
+                    index = pending.pop(0)
+                    # copy the caller's context: trace span and deadline carry into the candidate
+                    ctx = contextvars.copy_context()
+                    running.add(pool.submit(ctx.run, self._candidate, index, build_agent, task, tokens[index]))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    try:
+                        cand = fut.result()
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    cand["score"] = float(self.scorer(cand["output"], task))
+                    candidates.append(cand)
+                    if self.threshold is not None and cand["score"] >= self.threshold:
+                        winner_early = True
+                if winner_early:
+                    break
+        finally:
+            # never wait for stragglers: latency follows the first good-enough answer
+            for token in tokens:
+                token.cancel("fan-out finished")
+            pool.shutdown(wait=False, cancel_futures=True)
+        if not candidates:
+            raise errors[0] if errors else RuntimeError("no fan-out candidates completed")
+
+        output = self.reducer(candidates)
+        if isinstance(output, dict):
+            output = dict(output)
+            meta = dict(output.get("meta") or {})
+            meta["fanout"] = {
+                "completed": len(candidates),
+                "failed": len(errors),
+                "abandoned": len(self.variants) - len(candidates) - len(errors),
+                "early_stop": winner_early,
+                "scores": {c["index"]: round(c["score"], 4) for c in candidates},
+            }
+            output["meta"] = meta
+        return output
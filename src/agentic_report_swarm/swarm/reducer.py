@@ -0,0 +1,51 @@
+# src/agentic_report_swarm/swarm/reducer.py
+"""
+Reducers turn scored fan-out candidates into one subtask output.
+
+A candidate is {"index", "variant", "output", "score", "elapsed_s"}; a reducer is
+`reducer(candidates) -> output` and only ever sees successful candidates.
+"""
+import copy
+from typing import Any, Callable, Dict, List
+
+Reducer = Callable[[List[Dict[str, Any]]], Dict[str, Any]]
+
+
+def rank(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Best score first; ties go to the earlier variant."""
+    return sorted(candidates, key=lambda c: (-c["score"], c["index"]))
+
+
+def pick_best(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not candidates:
+        raise ValueError("no candidates to reduce")
+    return rank(candidates)[0]["output"]
+
+
+def _merge(into: Any, other: Any) -> Any:
+    if isinstance(into, dict) and isinstance(other, dict):
+        for k, v in other.items():
+            into[k] = _merge(into[k], v) if k in into else copy.deepcopy(v)
+        return into
+    if isinstance(into, list) and isinstance(other, list):
+        for item in other:
+            if item not in into:
+                into.append(copy.deepcopy(item))
+        return into
+    return into
+
+
+def merge_json(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Winner's output, with its parsed `json` extended by the other candidates':
+    missing keys are filled in and list items unioned, in rank order.
+    """
+    ranked = rank(candidates)
+    winner = copy.deepcopy(pick_best(ranked))
+    if not isinstance(winner, dict) or "json" not in winner:
+        return winner
+    for cand in ranked[1:]:
+        other = cand["output"]
+        if isinstance(other, dict) and "json" in other:
+            winner["json"] = _merge(winner["json"], other["json"])
+    return winner
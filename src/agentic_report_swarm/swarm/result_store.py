@@ -0,0 +1,112 @@
+# src/agentic_report_swarm/swarm/result_store.py
+"""
+Durable per-subtask result store for incremental plan re-execution.
+
+Results are keyed by (plan_id, subtask_id) and tagged with a fingerprint:
+sha256 over the subtask type, payload, agent template and the outputs of its
+upstream subtasks. SwarmManager reuses a stored result when the fingerprint
+still matches, so rerunning a half-failed plan only recomputes the failed part
+of the DAG and whatever depends on changed outputs (like a build system).
+Only successful results are stored.
+
+Usage:
+    store = ResultStore(".cache/results.sqlite")
+    md = run_topic("EV market Indonesia", result_store=store)   # stable plan id per topic
+    store.stats()  # {"hits": ..., "misses": ..., "writes": ...}
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def template_fingerprint(template: Any) -> Any:
+    """JSON-able identity of an agent template (a path template hashes the file contents)."""
+    if isinstance(template, str):
+        try:
+            return {"path": template, "sha256": hashlib.sha256(Path(template).read_bytes()).hexdigest()}
+        except (OSError, ValueError):
+            return template
+    return template
+
+
+def subtask_fingerprint(st, template: Any = None, upstream: Optional[Dict[str, Any]] = None) -> str:
+    raw = json.dumps(
+        {
+            "type": st.type,
+            "payload": st.payload,
+            "template": template_fingerprint(template),
+            "upstream": upstream or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResultStore:
+    """SQLite-backed (stdlib sqlite3) store of successful subtask results; thread-safe."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._counts = {"hits": 0, "misses": 0, "writes": 0}
+        with self._lock:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS subtask_results ("
+                " plan_id TEXT NOT NULL, subtask_id TEXT NOT NULL, fingerprint TEXT NOT NULL,"
+                " result TEXT NOT NULL, created REAL NOT NULL, PRIMARY KEY (plan_id, subtask_id))"
+            )
+            self._conn.commit()
+
+    def get(self, plan_id: str, subtask_id: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Stored result for the subtask, or None when missing or its inputs changed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, result FROM subtask_results WHERE plan_id = ? AND subtask_id = ?",
+                (plan_id, subtask_id),
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self._counts["misses"] += 1
+                return None
+            self._counts["hits"] += 1
+        return json.loads(row[1])
+
+    def put(self, plan_id: str, subtask_id: str, fingerprint: str, result: Dict[str, Any]) -> None:
+        raw = json.dumps(result, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO subtask_results (plan_id, subtask_id, fingerprint, result, created)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (plan_id, subtask_id, fingerprint, raw, time.time()),
+            )
+            self._conn.commit()
+            self._counts["writes"] += 1
+
+    def invalidate(self, plan_id: str, subtask_id: Optional[str] = None) -> int:
+        """Drop stored results of a plan (or one subtask); returns the number removed."""
+        with self._lock:
+            if subtask_id is None:
+                cur = self._conn.execute("DELETE FROM subtask_results WHERE plan_id = ?", (plan_id,))
+            else:
+                cur = self._conn.execute(
+                    "DELETE FROM subtask_results WHERE plan_id = ? AND subtask_id = ?", (plan_id, subtask_id)
+                )
+            self._conn.commit()
+            return cur.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
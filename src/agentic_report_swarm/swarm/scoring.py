@@ -0,0 +1,79 @@
+# src/agentic_report_swarm/swarm/scoring.py
+"""
+Cheap heuristic scorers for ranking fan-out candidates (no LLM calls).
+
+A scorer is `scorer(output, task) -> float` in [0, 1], where `output` is an agent
+result ({"text", "meta", "json"?}) and `task` the subtask dict. WeightedScorer
+combines several into a weighted mean; `default_scorer()` mixes length, JSON
+validity and keyword coverage of the topic.
+"""
+import re
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from ..memory.short_term import output_text
+from ..utils import llm_json
+
+Scorer = Callable[[Dict[str, Any], Dict[str, Any]], float]
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def length_score(min_chars: int = 200, max_chars: int = 4000) -> Scorer:
+    """1.0 inside [min_chars, max_chars]; ramps up below and decays above."""
+    def score(output: Dict[str, Any], task: Dict[str, Any]) -> float:
+        n = len(output_text(output))
+        if n < min_chars:
+            return n / min_chars if min_chars else 1.0
+        if n > max_chars:
+            return max(0.0, 1.0 - (n - max_chars) / max_chars)
+        return 1.0
+    return score
+
+
+def json_validity_score(output: Dict[str, Any], task: Dict[str, Any]) -> float:
+    """1.0 when the completion holds a JSON object/array, else 0.0."""
+    if isinstance(output, dict) and "json" in output:
+        return 1.0
+    return 1.0 if isinstance(llm_json.parse_maybe_json(output_text(output)), (dict, list)) else 0.0
+
+
+def keyword_coverage_score(keywords: Optional[Iterable[str]] = None, min_len: int = 3) -> Scorer:
+    """Fraction of keywords (default: words of task.payload.topic) present in the text."""
+    fixed = [k.lower() for k in keywords] if keywords is not None else None
+
+    def score(output: Dict[str, Any], task: Dict[str, Any]) -> float:
+        words = fixed
+        if words is None:
+            topic = str((task.get("payload") or {}).get("topic", ""))
+            words = [w for w in _WORD_RE.findall(topic.lower()) if len(w) >= min_len]
+        if not words:
+            return 1.0
+        present = set(_WORD_RE.findall(output_text(output).lower()))
+        return sum(1 for w in words if w in present) / len(words)
+    return score
+
+
+class WeightedScorer:
+    """Weighted mean of named scorers; `details()` exposes the per-scorer values."""
+
+    def __init__(self, scorers: Dict[str, Tuple[Scorer, float]]):
+        if not scorers:
+            raise ValueError("WeightedScorer needs at least one scorer")
+        self.scorers = scorers
+        self._total = sum(w for _, w in scorers.values()) or 1.0
+
+    def details(self, output: Dict[str, Any], task: Dict[str, Any]) -> Dict[str, float]:
+        return {name: float(fn(output, task)) for name, (fn, _) in self.scorers.items()}
+
+    def __call__(self, output: Dict[str, Any], task: Dict[str, Any]) -> float:
+        values = self.details(output, task)
+        return sum(values[name] * w for name, (_, w) in self.scorers.items()) / self._total
+
+
+def default_scorer(expect_json: bool = False) -> WeightedScorer:
+    scorers: Dict[str, Tuple[Scorer, float]] = {
+        "length": (length_score(), 1.0),
+        "keywords": (keyword_coverage_score(), 1.0),
+    }
+    if expect_json:
+        scorers["json"] = (json_validity_score, 2.0)
+    return WeightedScorer(scorers)
@@ -1,58 +1,368 @@
 # src/agentic_report_swarm/swarm/swarm_manager.py
-from typing import Dict, Any
-from ..core.plan_schema import SubtaskResult
+from collections import deque
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Callable, Optional
 from ..factory.agent_factory import AgentFactory
+from ..memory.short_term import ShortTermMemory, UpstreamView, DEFAULT_UPSTREAM_TOKEN_BUDGET, output_text
+from ..utils.cancellation import CancelToken, Deadline, cancel_scope, deadline_scope, earliest
+from ..utils.logging import span
+from ..utils.retry import RetryPolicy, estimate_tokens
+from .result_store import ResultStore, subtask_fingerprint
+from .parallel_runner import ParallelRunner
+
+DEFAULT_MAX_WORKERS = 4
 
 class SwarmManager:
     """
-    Simple synchronous SwarmManager.
+    DAG-scheduling SwarmManager.
 
     - Accepts an AgentFactory instance (or object exposing .build(agent_type))
-    - Executes subtasks when dependencies are met.
+    - Tracks in-degree per subtask and keeps a ready queue; every ready subtask
+      is dispatched concurrently on a thread pool of `max_workers` threads.
     - Returns mapping task_id -> SubtaskResult-like dict.
+
+    `max_workers=1` runs subtasks inline on the calling thread (no pool).
+    With a `retry_policy`, a subtask failing with a retryable (transient) error is
+    re-run with backoff before it and its dependents are marked failed; prefer
+    setting the policy on the shared LLMClient when all failures come from the LLM.
+
+    Streaming hooks for execute_plan (optional):
+    - on_result(result_dict): called on the scheduling thread as each subtask finishes.
+    - on_chunk(task_id, text): partial LLM output from worker threads, for agents
+      exposing `run_streaming`.
+
+    With a `result_store`, successful results are persisted per (plan_id, subtask_id)
+    with a fingerprint of type, payload, template and upstream outputs; rerunning the
+    same plan reuses unchanged subtasks (result carries `cached: True`) and only
+    recomputes the invalidated part of the DAG. Counts are in `last_run_stats`.
+
+    Subtasks with dependencies receive `task["upstream"]`: a view over the plan's
+    ShortTermMemory holding their dependencies' outputs, whose `.context` renders
+    them within `upstream_token_budget` tokens.
+
+    `fanout` maps agent types to a ParallelRunner: those subtasks run as several
+    scored candidate variants reduced to one output (see swarm/parallel_runner.py).
+
+    `speculative=True` (pool mode) starts a dependent subtask as soon as all of its
+    dependencies have started, when its agent's prompt does not use upstream output
+    (`agent.uses_upstream` is False). Once the dependencies succeed the rendered
+    prompt is re-checked: an unchanged prompt commits the speculative result, a
+    changed one cancels it (through the LLM client's CancelToken) and re-runs; a
+    failed dependency cancels it. `last_run_stats` then adds speculated /
+    spec_committed / spec_discarded / spec_wasted_tokens; tokens of calls aborted
+    mid-flight are in `LLMClient.usage()["wasted_tokens"]`.
+
+    Deadlines: `subtask_timeout` bounds each subtask from its start and
+    `plan_timeout` the whole plan. Both propagate to LLM calls (adapter `timeout`)
+    through the active deadline scope; subtasks not finished when the plan deadline
+    passes fail with `deadline_exceeded` and are not waited for.
     """
-    def __init__(self, agent_factory: AgentFactory, logger=None):
+    def __init__(
+        self,
+        agent_factory: AgentFactory,
+        logger=None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        retry_policy: Optional[RetryPolicy] = None,
+        result_store: Optional[ResultStore] = None,
+        upstream_token_budget: int = DEFAULT_UPSTREAM_TOKEN_BUDGET,
+        fanout: Optional[Dict[str, ParallelRunner]] = None,
+        speculative: bool = False,
+        subtask_timeout: Optional[float] = None,
+        plan_timeout: Optional[float] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
         self.agent_factory = agent_factory
         self.logger = logger
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy
+        self.result_store = result_store
+        self.upstream_token_budget = upstream_token_budget
+        self.fanout = fanout or {}
+        self.speculative = speculative
+        self.subtask_timeout = subtask_timeout
+        self.plan_timeout = plan_timeout
+        self.last_run_stats: Dict[str, int] = {"skipped": 0, "recomputed": 0}
+
+    def _template_for(self, agent_type: str):
+        templates = getattr(self.agent_factory, "templates", None)
+        return templates.get(agent_type) if templates else None
+
+    def _run_subtask(
+        self,
+        st,
+        on_chunk: Optional[Callable[[str, str], None]] = None,
+        plan_id: Optional[str] = None,
+        upstream: Optional[UpstreamView] = None,
+        plan_deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        deadline = earliest(plan_deadline, Deadline.after(self.subtask_timeout))
+        with span("subtask", plan_id=plan_id, subtask_id=st.id, subtask_type=st.type) as sp, deadline_scope(deadline):
+            fingerprint = None
+            if self.result_store is not None and plan_id is not None:
+                fingerprint = subtask_fingerprint(st, self._template_for(st.type), dict(upstream) if upstream else None)
+                stored = self.result_store.get(plan_id, st.id, fingerprint)
+                if stored is not None:
+                    sp.set(success=True, cached=True)
+                    return {"id": st.id, "success": True, "output": stored.get("output"), "cached": True}
+            res = self._execute_subtask(st, on_chunk, upstream)
+            if fingerprint is not None and res["success"]:
+                self.result_store.put(plan_id, st.id, fingerprint, res)
+            sp.set(success=res["success"])
+        return res
+
+    def _build_variant(self, agent_type: str, variant: Dict[str, Any]):
+        if not variant:
+            return self.agent_factory.build(agent_type)
+        config = {"llm_kwargs": variant["llm_kwargs"]} if variant.get("llm_kwargs") else None
+        return self.agent_factory.build(agent_type, template=variant.get("template"), config=config)
+
+    @staticmethod
+    def _task_for(st, upstream: Optional[UpstreamView]) -> Dict[str, Any]:
+        # agent.run contract expects dict with id/type/payload (+ upstream for dependent subtasks)
+        task = {"id": st.id, "type": st.type, "payload": st.payload}
+        if upstream is not None:
+            task["upstream"] = upstream
+        return task
+
+    def _prompt_for(self, st, upstream: Optional[UpstreamView]) -> Optional[str]:
+        agent = self.agent_factory.build(st.type)
+        render = getattr(agent, "render_prompts", None)
+        return render([self._task_for(st, upstream)])[0] if render is not None else None
+
+    def _can_speculate(self, st) -> bool:
+        if self.result_store is not None or st.type in self.fanout:
+            return False
+        try:
+            return getattr(self.agent_factory.build(st.type), "uses_upstream", True) is False
+        except Exception:
+            return False
+
+    def _run_speculative(self, st, plan_id: Optional[str], upstream: Optional[UpstreamView], token: CancelToken, plan_deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        with cancel_scope(token):
+            return self._run_subtask(st, None, plan_id, upstream, plan_deadline)
+
+    def _execute_subtask(self, st, on_chunk: Optional[Callable[[str, str], None]] = None, upstream: Optional[UpstreamView] = None) -> Dict[str, Any]:
+        try:
+            task = self._task_for(st, upstream)
+            runner = self.fanout.get(st.type)
+            if runner is not None:
+                out = runner.run(lambda variant: self._build_variant(st.type, variant), task)
+                return {"id": st.id, "success": True, "output": out}
+            agent = self.agent_factory.build(st.type)
+            if on_chunk is not None and hasattr(agent, "run_streaming"):
+                out = agent.run_streaming(task, lambda chunk: on_chunk(st.id, chunk))
+            elif self.retry_policy is not None:
+                out = self.retry_policy.call(agent.run, task)
+            else:
+                out = agent.run(task)
+            return {"id": st.id, "success": True, "output": out}
+        except Exception as e:
+            return {"id": st.id, "success": False, "error": str(e)}
 
-    def execute_plan(self, plan) -> Dict[str, Dict[str, Any]]:
+    def execute_plan(
+        self,
+        plan,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_chunk: Optional[Callable[[str, str], None]] = None,
+        seed_outputs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Execute the given plan (Plan dataclass) synchronously.
+        Execute the given plan (Plan dataclass), running independent subtasks concurrently.
+        `seed_outputs` (subtask id -> output, e.g. from long-term memory) are taken as
+        already computed: those subtasks complete as `cached` without running.
 
         Returns:
             results: dict keyed by subtask id with {id, success, output?, error?}
         """
-        # prepare state
+        # prepare state: in-degree per subtask and reverse edges (dep -> dependents)
         subtasks = {st.id: st for st in plan.subtasks}
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {tid: [] for tid in subtasks}
+        for st in plan.subtasks:
+            deps = set(st.depends_on)
+            indegree[st.id] = len(deps)
+            for d in deps:
+                # unknown deps are never satisfied -> reported as unmet below
+                if d in dependents:
+                    dependents[d].append(st.id)
+
         results: Dict[str, Dict[str, Any]] = {}
-        pending = set(subtasks.keys())
-        progress = True
-
-        while pending and progress:
-            progress = False
-            for tid in list(pending):
-                st = subtasks[tid]
-                # check dependencies
-                unmet = [d for d in st.depends_on if d not in results or not results[d].get("success")]
-                if unmet:
-                    # can't run yet
-                    continue
-                # execute
-                progress = True
-                try:
-                    agent = self.agent_factory.build(st.type)
-                    # agent.run contract expects dict with id/type/payload
-                    out = agent.run({"id": st.id, "type": st.type, "payload": st.payload})
-                    results[st.id] = {"id": st.id, "success": True, "output": out}
-                except Exception as e:
-                    results[st.id] = {"id": st.id, "success": False, "error": str(e)}
-                pending.remove(tid)
-
-        # if there are still pending tasks -> unmet deps / cycle
-        if pending:
-            for tid in pending:
-                st = subtasks[tid]
-                unmet = [d for d in st.depends_on if d not in results or not results[d].get("success")]
-                results[tid] = {"id": tid, "success": False, "error": f"unmet_dependencies:{unmet}"}
+        ready = deque(st.id for st in plan.subtasks if indegree[st.id] == 0)
+
+        stats = {"skipped": 0, "recomputed": 0}
+        memory = ShortTermMemory(plan.plan_id, token_budget=self.upstream_token_budget)
+
+        def upstream_of(tid: str) -> Optional[UpstreamView]:
+            deps = subtasks[tid].depends_on
+            return memory.view(sorted(set(deps))) if deps else None
+
+        speculate = self.speculative and self.max_workers > 1 and on_chunk is None
+        # tid -> (future, cancel token, prompt rendered at speculation time)
+        spec: Dict[str, tuple] = {}
+        if speculate:
+            stats.update(speculated=0, spec_committed=0, spec_discarded=0, spec_wasted_tokens=0)
+
+        def discard_spec(tid: str, reason: str) -> None:
+            fut, token, prompt = spec.pop(tid)
+            token.cancel(reason)
+            stats["spec_discarded"] += 1
+            if fut.done() and not fut.cancelled():
+                res = fut.result()
+                stats["spec_wasted_tokens"] += estimate_tokens(prompt or "") + estimate_tokens(output_text(res.get("output")))
+
+        def cancel_spec_below(tid: str) -> None:
+            stack = list(dependents[tid])
+            while stack:
+                child = stack.pop()
+                if child in spec:
+                    discard_spec(child, "upstream failed")
+                stack.extend(dependents[child])
+
+        def complete(res: Dict[str, Any]) -> None:
+            results[res["id"]] = res
+            stats["skipped" if res.get("cached") else "recomputed"] += 1
+            if res.get("success"):
+                memory.put(res["id"], res.get("output"), subtasks[res["id"]].type)
+            if on_result is not None:
+                on_result(res)
+            if not res.get("success"):
+                # dependents of a failed subtask never become ready
+                if spec:
+                    cancel_spec_below(res["id"])
+                return
+            for child in dependents[res["id"]]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+        seed_outputs = seed_outputs or {}
+        plan_deadline = Deadline.after(self.plan_timeout)
+
+        def take_ready() -> Optional[str]:
+            # completes seeded (and, past the plan deadline, expired) subtasks in place;
+            # returns the next one that must run
+            while ready:
+                tid = ready.popleft()
+                if tid in seed_outputs:
+                    complete({"id": tid, "success": True, "output": seed_outputs[tid], "cached": True})
+                elif plan_deadline is not None and plan_deadline.expired:
+                    complete({"id": tid, "success": False, "error": "deadline_exceeded"})
+                else:
+                    return tid
+            return None
+
+        if self.max_workers == 1:
+            while True:
+                tid = take_ready()
+                if tid is None:
+                    break
+                complete(self._run_subtask(subtasks[tid], on_chunk, plan.plan_id, upstream_of(tid), plan_deadline))
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            abandoned = False
+            try:
+                # future -> (tid, speculative); a committed speculative future turns normal
+                running: Dict[Any, tuple] = {}
+                started = set()
+                no_spec = set()
+
+                def submit(tid: str) -> None:
+                    started.add(tid)
+                    # each worker runs in a copy of the caller's context so spans nest under it
+                    fut = pool.submit(contextvars.copy_context().run, self._run_subtask, subtasks[tid], on_chunk,
+                                      plan.plan_id, upstream_of(tid), plan_deadline)
+                    running[fut] = (tid, False)
+
+                def promote(tid: str) -> None:
+                    # all dependencies succeeded: commit the speculative run if its prompt still holds
+                    fut, token, prompt = spec[tid]
+                    try:
+                        same = prompt == self._prompt_for(subtasks[tid], upstream_of(tid))
+                    except Exception:
+                        same = False
+                    if not same or (fut.done() and not fut.result()["success"]):
+                        discard_spec(tid, "upstream changed")
+                        running.pop(fut, None)
+                        submit(tid)
+                        return
+                    del spec[tid]
+                    stats["spec_committed"] += 1
+                    if fut in running:
+                        running[fut] = (tid, False)
+                    else:
+                        complete(fut.result())
+
+                def try_speculate() -> None:
+                    for st in plan.subtasks:
+                        tid = st.id
+                        if tid in started or tid in seed_outputs or tid in no_spec or indegree[tid] == 0:
+                            continue
+                        if not all(d in started for d in st.depends_on):
+                            continue
+                        if any(d in results and not results[d].get("success") for d in st.depends_on):
+                            continue
+                        upstream = upstream_of(tid)
+                        try:
+                            prompt = self._prompt_for(st, upstream) if self._can_speculate(st) else None
+                        except Exception:
+                            prompt = None
+                        if prompt is None:
+                            no_spec.add(tid)
+                            continue
+                        token = CancelToken()
+                        fut = pool.submit(contextvars.copy_context().run, self._run_speculative, st, plan.plan_id,
+                                          upstream, token, plan_deadline)
+                        spec[tid] = (fut, token, prompt)
+                        running[fut] = (tid, True)
+                        started.add(tid)
+                        stats["speculated"] += 1
+
+                while True:
+                    tid = take_ready()
+                    while tid is not None:
+                        if tid in spec:
+                            promote(tid)
+                        else:
+                            submit(tid)
+                        tid = take_ready()
+                    if speculate and not (plan_deadline is not None and plan_deadline.expired):
+                        try_speculate()
+                    if not running:
+                        break
+                    timeout = plan_deadline.remaining() if plan_deadline is not None else None
+                    done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                    if not done:
+                        # plan deadline passed: fail what is still running and stop waiting
+                        abandoned = True
+                        # discard speculation first: failing a normal subtask also discards
+                        # the speculative runs below it (cancel_spec_below)
+                        for tid in list(spec):
+                            discard_spec(tid, "deadline exceeded")
+                        for fut, (tid, speculative) in list(running.items()):
+                            if not speculative:
+                                complete({"id": tid, "success": False, "error": "deadline_exceeded"})
+                        running.clear()
+                        continue
+                    for fut in done:
+                        tid, speculative = running.pop(fut)
+                        # speculative results wait in `spec` until their dependencies finish
+                        if not speculative:
+                            complete(fut.result())
+            finally:
+                pool.shutdown(wait=not abandoned, cancel_futures=abandoned)
+
+        # anything never scheduled -> unmet deps / cycle
+        for tid, st in subtasks.items():
+            if tid in results:
+                continue
+            unmet = [d for d in st.depends_on if d not in results or not results[d].get("success")]
+            results[tid] = {"id": tid, "success": False, "error": f"unmet_dependencies:{unmet}"}
+            if on_result is not None:
+                on_result(results[tid])
 
+        self.last_run_stats = stats
+        if self.logger is not None and self.result_store is not None:
+            self.logger.info("plan %s: %d subtasks reused, %d recomputed", plan.plan_id, stats["skipped"], stats["recomputed"])
         return results
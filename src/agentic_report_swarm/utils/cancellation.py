@@ -0,0 +1,124 @@
+# src/agentic_report_swarm/utils/cancellation.py
+"""
+Cooperative cancellation and deadlines for LLM calls.
+
+A CancelToken is installed for the current thread/task with `cancel_scope(token)`;
+LLMClient picks it up (or takes `cancel_token=` explicitly), streams the completion
+when the adapter can, and stops consuming as soon as the token is cancelled,
+raising LLMCancelled. Tokens spent on cancelled calls are reported by
+`LLMClient.usage()` as wasted.
+
+A Deadline is an absolute point in time installed with `deadline_scope(deadline)`;
+LLMClient turns the remaining time into the adapter's `timeout` kwarg and refuses
+to start (or retry) a call once it has passed (DeadlineExceeded). Nested scopes
+only ever tighten the deadline.
+
+Usage:
+    token = CancelToken()
+    with cancel_scope(token):
+        agent.run(task)          # another thread may call token.cancel()
+
+    with deadline_scope(Deadline.after(30)):
+        agent.run(task)          # every LLM call gets timeout <= remaining seconds
+"""
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Iterator, Optional
+
+_current_token: "contextvars.ContextVar[Optional[CancelToken]]" = contextvars.ContextVar("ars_cancel_token", default=None)
+_current_deadline: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar("ars_deadline", default=None)
+
+
+class LLMCancelled(RuntimeError):
+    """The call was cancelled through its CancelToken."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """The deadline passed before the call could start or finish (never retried)."""
+
+
+class CancelToken:
+    __slots__ = ("_event", "reason")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise LLMCancelled(self.reason or "cancelled")
+
+
+def current_token() -> Optional[CancelToken]:
+    return _current_token.get()
+
+
+class Deadline:
+    """Absolute deadline on the monotonic clock."""
+
+    __slots__ = ("at",)
+
+    def __init__(self, at: float):
+        self.at = at
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> Optional["Deadline"]:
+        return cls(time.monotonic() + seconds) if seconds is not None else None
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+    def tighten(self, seconds: Optional[float]) -> "Deadline":
+        """The earlier of this deadline and `seconds` from now."""
+        if seconds is None:
+            return self
+        return Deadline(min(self.at, time.monotonic() + seconds))
+
+
+def earliest(*deadlines: Optional[Deadline]) -> Optional[Deadline]:
+    present = [d for d in deadlines if d is not None]
+    return min(present, key=lambda d: d.at) if present else None
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make `deadline` (tightened by any enclosing one) active for LLM calls in this context."""
+    effective = earliest(deadline, _current_deadline.get())
+    reset = _current_deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _current_deadline.reset(reset)
+
+
+@contextlib.contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[Optional[CancelToken]]:
+    """Make `token` the active cancel token for LLM calls in this context."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
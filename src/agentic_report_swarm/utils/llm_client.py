@@ -1,13 +1,19 @@
 # src/agentic_report_swarm/utils/llm_client.py
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+import asyncio
 import os
+import threading
+from .cancellation import CancelToken, Deadline, cancel_scope, current_deadline, current_token
+from .logging import span
+from .retry import RetryPolicy, RateLimiter, estimate_tokens, is_rate_limit
 
 # Try to import a real adapter if provided by adapters package
 try:
-    from ..adapters.openai_adapter import RealOpenAIAdapter, MockOpenAIAdapter
+    from ..adapters.openai_adapter import RealOpenAIAdapter, HTTPOpenAIAdapter, MockOpenAIAdapter
 except Exception:
     # fallback minimal mock if adapters package missing
     RealOpenAIAdapter = None
+    HTTPOpenAIAdapter = None
     class MockOpenAIAdapter:
         def generate(self, prompt: str, **kwargs) -> str:
             return f"[MOCK-ADAPTER] Generated for: {prompt}"
@@ -16,26 +22,213 @@ class LLMClient:
     """
     High-level LLM client facade.
     Use `LLMClient.from_env()` to auto-select adapter (mock by default).
+
+    Optional `retry_policy` retries transient adapter errors with backoff, and an
+    optional shared `rate_limiter` is drawn from before every attempt (a 429 pauses
+    it for everyone sharing it).
+
+    `generate`/`agenerate` honour a CancelToken (`cancel_token=` or the active
+    `cancel_scope`): the completion is streamed when the adapter supports it and
+    abandoned as soon as the token is cancelled (LLMCancelled). `usage()` reports
+    estimated tokens, including those wasted on cancelled calls.
+
+    A Deadline (`deadline=` or the active `deadline_scope`) caps every attempt: the
+    remaining time is passed to the adapter as `timeout`, and no attempt or retry
+    starts after it has passed (DeadlineExceeded).
     """
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None):
         self.adapter = adapter
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self._usage = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cancelled_calls": 0, "wasted_tokens": 0}
+        self._usage_lock = threading.Lock()
+
+    def _account(self, prompt: str, text: str, cancelled: bool = False) -> None:
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(text) if text else 0
+        with self._usage_lock:
+            self._usage["calls"] += 1
+            self._usage["prompt_tokens"] += prompt_tokens
+            self._usage["completion_tokens"] += completion_tokens
+            if cancelled:
+                self._usage["cancelled_calls"] += 1
+                self._usage["wasted_tokens"] += prompt_tokens + completion_tokens
+
+    def usage(self) -> Dict[str, int]:
+        """Estimated token usage (~4 chars/token) across calls made through this client."""
+        with self._usage_lock:
+            return dict(self._usage)
+
+    def _collect(self, prompt: str, kwargs: Dict[str, Any], token: CancelToken) -> str:
+        # stream so a cancel stops consuming (and closes the response) mid-completion;
+        # the token is also made current for wrapping adapters (HedgedAdapter) to see
+        chunks = []
+        with cancel_scope(token):
+            gen = self.adapter.stream(prompt, **kwargs)
+            try:
+                for chunk in gen:
+                    chunks.append(chunk)
+                    if token.cancelled:
+                        break
+            finally:
+                close = getattr(gen, "close", None)
+                if close is not None:
+                    close()
+        text = "".join(chunks)
+        if token.cancelled:
+            self._account(prompt, text, cancelled=True)
+            token.raise_if_cancelled()
+        return text
+
+    def _on_retry(self, exc: BaseException, delay: float) -> None:
+        if self.rate_limiter is not None and is_rate_limit(exc):
+            self.rate_limiter.pause(delay)
+
+    @staticmethod
+    def _bounded(kwargs: Dict[str, Any], deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """kwargs with `timeout` capped by the deadline's remaining time."""
+        if deadline is None:
+            return kwargs
+        deadline.check()
+        remaining = deadline.remaining()
+        bounded = dict(kwargs)
+        bounded["timeout"] = min(kwargs.get("timeout") or remaining, remaining)
+        return bounded
+
+    def _call(self, fn, prompt: str, kwargs: Dict[str, Any], deadline: Optional[Deadline] = None):
+        def attempt():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(estimate_tokens(prompt, kwargs.get("max_tokens", 0)))
+            return fn(prompt, **self._bounded(kwargs, deadline))
+        if self.retry_policy is None:
+            return attempt()
+        return self.retry_policy.call(attempt, on_retry=self._on_retry)
+
+    async def _acall(self, fn, prompt: str, kwargs: Dict[str, Any], deadline: Optional[Deadline] = None):
+        async def attempt():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(estimate_tokens(prompt, kwargs.get("max_tokens", 0)))
+            return await fn(prompt, **self._bounded(kwargs, deadline))
+        if self.retry_policy is None:
+            return await attempt()
+        return await self.retry_policy.acall(attempt, on_retry=self._on_retry)
 
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Generate text from prompt. kwargs passed to adapter.
         """
-        return self.adapter.generate(prompt, **kwargs)
+        token = kwargs.pop("cancel_token", None) or current_token()
+        deadline = kwargs.pop("deadline", None) or current_deadline()
+        with span("llm", prompt_chars=len(prompt)) as sp:
+            if token is None:
+                text = self._call(self.adapter.generate, prompt, kwargs, deadline)
+            else:
+                token.raise_if_cancelled()
+                if callable(getattr(self.adapter, "stream", None)):
+                    text = self._call(lambda p, **kw: self._collect(p, kw, token), prompt, kwargs, deadline)
+                else:
+                    text = self._call(self.adapter.generate, prompt, kwargs, deadline)
+                    if token.cancelled:
+                        self._account(prompt, text, cancelled=True)
+                        sp.set(cancelled=True)
+                        token.raise_if_cancelled()
+            self._account(prompt, text)
+            sp.set(response_chars=len(text))
+        return text
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Async variant of `generate`. Awaits the adapter's `agenerate` when it has one,
+        otherwise runs the blocking `generate` on a worker thread.
+        """
+        token = kwargs.pop("cancel_token", None) or current_token()
+        deadline = kwargs.pop("deadline", None) or current_deadline()
+        if token is not None:
+            token.raise_if_cancelled()
+        with span("llm", prompt_chars=len(prompt)) as sp:
+            agenerate = getattr(self.adapter, "agenerate", None)
+            if agenerate is None:
+                async def agenerate(p, **kw):
+                    return await asyncio.to_thread(self.adapter.generate, p, **kw)
+            text = await self._acall(agenerate, prompt, kwargs, deadline)
+            if token is not None and token.cancelled:
+                self._account(prompt, text, cancelled=True)
+                sp.set(cancelled=True)
+                token.raise_if_cancelled()
+            self._account(prompt, text)
+            sp.set(response_chars=len(text))
+        return text
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Yield text chunks as the adapter produces them. Adapters without `stream`
+        yield their full `generate` result as a single chunk. Usage is accounted
+        and an `llm` span recorded like `generate`; a stream closed before the end
+        counts as cancelled.
+        """
+        deadline = kwargs.pop("deadline", None) or current_deadline()
+        stream = getattr(self.adapter, "stream", None)
+        chunks = []
+        with span("llm", prompt_chars=len(prompt), streamed=True) as sp:
+            try:
+                if stream is None:
+                    chunks.append(self._call(self.adapter.generate, prompt, kwargs, deadline))
+                    yield chunks[0]
+                else:
+                    # partially consumed streams are not retried; only the rate budget applies
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire(estimate_tokens(prompt, kwargs.get("max_tokens", 0)))
+                    for chunk in stream(prompt, **self._bounded(kwargs, deadline)):
+                        chunks.append(chunk)
+                        yield chunk
+            except GeneratorExit:
+                self._finish_stream(sp, prompt, chunks, cancelled=True)
+                raise
+            self._finish_stream(sp, prompt, chunks)
+
+    async def astream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Async variant of `stream` (falls back to a single `agenerate` chunk)."""
+        deadline = kwargs.pop("deadline", None) or current_deadline()
+        astream = getattr(self.adapter, "astream", None)
+        if astream is None:
+            # agenerate does its own accounting and span
+            yield await self.agenerate(prompt, deadline=deadline, **kwargs)
+            return
+        chunks = []
+        with span("llm", prompt_chars=len(prompt), streamed=True) as sp:
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire(estimate_tokens(prompt, kwargs.get("max_tokens", 0)))
+                async for chunk in astream(prompt, **self._bounded(kwargs, deadline)):
+                    chunks.append(chunk)
+                    yield chunk
+            except (GeneratorExit, asyncio.CancelledError):
+                self._finish_stream(sp, prompt, chunks, cancelled=True)
+                raise
+            self._finish_stream(sp, prompt, chunks)
+
+    def _finish_stream(self, sp, prompt: str, chunks, cancelled: bool = False) -> None:
+        text = "".join(chunks)
+        self._account(prompt, text, cancelled=cancelled)
+        if cancelled:
+            sp.set(cancelled=True)
+        sp.set(response_chars=len(text))
 
     @staticmethod
-    def from_env(api_key_env: Optional[str] = "OPENAI_API_KEY", prefer_real: bool = False):
+    def from_env(api_key_env: Optional[str] = "OPENAI_API_KEY", prefer_real: bool = False, pooled: bool = False, **adapter_kwargs):
         """
         Create LLMClient using environment / preference.
         prefer_real=True will attempt to create RealOpenAIAdapter and raise
-        helpful error if not possible.
+        helpful error if not possible. With pooled=True the httpx-backed
+        HTTPOpenAIAdapter is used instead (adapter_kwargs: pool_size, timeout, ...).
         """
         api_key = os.environ.get(api_key_env)
         if prefer_real:
+            if pooled:
+                if HTTPOpenAIAdapter is None:
+                    raise RuntimeError("HTTPOpenAIAdapter not available. Install adapters or implement HTTPOpenAIAdapter.")
+                return LLMClient(HTTPOpenAIAdapter(api_key=api_key, **adapter_kwargs))
             if RealOpenAIAdapter is None:
                 raise RuntimeError("RealOpenAIAdapter not available. Install adapters or implement RealOpenAIAdapter.")
             return LLMClient(RealOpenAIAdapter(api_key=api_key))
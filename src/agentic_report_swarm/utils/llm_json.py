@@ -5,6 +5,8 @@ Robust JSON extraction/parsing helpers for LLM outputs.
 Functions:
 - parse_maybe_json(text: str) -> Union[dict, list, str]
     Try to extract JSON from text; return parsed object if found, else original text.
+- iter_json_candidates(text: str)
+    Single-pass, string-aware scan yielding candidate JSON spans (fenced or bare).
 
 Notes:
 - Heuristics are intentionally conservative: prefer returning parsed JSON only when
@@ -14,7 +16,7 @@ Notes:
 """
 import json
 import re
-from typing import Any, Union, Optional
+from typing import Any, Iterator, Optional, Tuple, Union
 
 
 def safe_json_loads(s: str) -> Optional[Any]:
@@ -55,41 +57,157 @@ def extract_code_blocks(text: str) -> list:
     return [b.strip() for b in blocks if b and b.strip()]
 
 
+_decoder = json.JSONDecoder()
+_MISSING = object()
+_CLOSERS = {'{': '}', '[': ']'}
+# next fence or opening bracket outside any candidate span
+# (single-char classes are much faster than alternations; backticks are checked for ``` by hand)
+_OUTSIDE = re.compile(r"[`\[{]")
+# next structural token inside a bracketed span
+_IN_SPAN = re.compile(r'[`"\[\]{}]')
+# next quote or escape inside a string literal
+_IN_STRING = re.compile(r'["\\]')
+# optional language tag after an opening fence (```json, ```python, ...)
+_LANG_TAG = re.compile(r"[A-Za-z0-9_+\-]*")
+
+
+def _match_span(text: str, start: int) -> Tuple[int, bool]:
+    """
+    String-aware bracket matching for the span opening at text[start].
+
+    Returns (end, True) when text[start:end] is balanced. Otherwise returns
+    (pos, False) where pos is the mismatched closer or fence that stopped the
+    scan, or (-1, False) when the text ends before the span closes.
+    """
+    stack = [text[start]]
+    pos = start + 1
+    while True:
+        m = _IN_SPAN.search(text, pos)
+        if m is None:
+            return -1, False
+        tok = m.group()
+        pos = m.end()
+        if tok == "`":
+            if text.startswith("```", m.start()):
+                return m.start(), False
+            continue
+        if tok == '"':
+            # skip the string literal so braces inside it are ignored
+            while True:
+                sm = _IN_STRING.search(text, pos)
+                if sm is None:
+                    return -1, False
+                pos = sm.end()
+                if sm.group() == "\\":
+                    pos += 1
+                    continue
+                break
+        elif tok in "{[":
+            stack.append(tok)
+        elif _CLOSERS[stack[-1]] != tok:
+            return m.start(), False
+        else:
+            stack.pop()
+            if not stack:
+                return pos, True
+
+
+def iter_json_candidates(text: str) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Find candidate JSON spans in one linear pass over `text`.
+
+    Yields (start, end, value) tuples, ordered by likelihood: fenced blocks are
+    yielded as soon as their closing fence is seen, bare bracketed spans
+    ({...} / [...]) are yielded after the scan in order of appearance.
+    `value` is the already-decoded object when `json.JSONDecoder.raw_decode`
+    succeeded at the span offset, else the `_MISSING` sentinel.
+    """
+    deferred = []
+    n = len(text)
+    pos = 0
+    fence_content = -1  # start of the open fence's content, -1 outside fences
+    bare = True  # cleared once a bracket runs unterminated to the end of text
+    while pos < n:
+        if bare:
+            m = _OUTSIDE.search(text, pos)
+            if m is None:
+                break
+            tok, at, after = m.group(), m.start(), m.end()
+            if tok == "`":
+                if not text.startswith("```", at):
+                    pos = after
+                    continue
+                tok, after = "```", at + 3
+        else:
+            at = text.find("```", pos)
+            if at < 0:
+                break
+            tok, after = "```", at + 3
+
+        if tok == "```":
+            if fence_content < 0:
+                pos = _LANG_TAG.match(text, after).end()
+                fence_content = pos
+            else:
+                value = _MISSING
+                if deferred and deferred[-1][0] >= fence_content and deferred[-1][2] is not _MISSING:
+                    # the block holds exactly one already-decoded bare span: reuse it
+                    b_start, b_end, b_value = deferred[-1]
+                    if not text[fence_content:b_start].strip() and not text[b_end:at].strip():
+                        value = b_value
+                yield fence_content, at, value
+                fence_content = -1
+                pos = after
+            continue
+
+        # bare { or [ : fast path decodes valid JSON straight from the offset
+        try:
+            value, end = _decoder.raw_decode(text, at)
+        except ValueError:
+            pass
+        else:
+            deferred.append((at, end, value))
+            pos = end
+            continue
+        end, ok = _match_span(text, at)
+        if ok:
+            deferred.append((at, end, _MISSING))
+            pos = end
+        elif end < 0:
+            bare = False
+            pos = after
+        else:
+            pos = end
+    yield from deferred
+
+
+def _decode_span(text: str, start: int, end: int) -> Optional[Any]:
+    """Decode text[start:end], trying raw_decode in place before the repairing safe_json_loads."""
+    while start < end and text[start].isspace():
+        start += 1
+    if start >= end:
+        return None
+    try:
+        value, stop = _decoder.raw_decode(text, start)
+        if stop <= end and not text[stop:end].strip():
+            return value
+    except ValueError:
+        pass
+    return safe_json_loads(text[start:end])
+
+
 def find_brace_substring(text: str) -> Optional[str]:
     """
-    Naive search for the largest substring that starts with { or [ and ends with matching } or ].
-    This tries to find a JSON-like substring.
+    Return the first balanced substring that starts with { or [ (string-aware:
+    brackets inside JSON string literals are ignored), or None.
     """
     if not isinstance(text, str):
         return None
-    # Find first occurrence of { or [
-    start_idx = None
-    for i, ch in enumerate(text):
-        if ch in ('{', '['):
-            start_idx = i
-            break
-    if start_idx is None:
+    m = re.search(r"[\[{]", text)
+    if m is None:
         return None
-
-    # Try to find a matching closing brace by scanning forward counting nesting.
-    stack = []
-    pairs = {'{': '}', '[': ']'}
-    for j in range(start_idx, len(text)):
-        ch = text[j]
-        if ch in ('{', '['):
-            stack.append(ch)
-        elif ch in ('}', ']') and stack:
-            # if matches, pop
-            top = stack[-1]
-            if (top == '{' and ch == '}') or (top == '[' and ch == ']'):
-                stack.pop()
-                if not stack:
-                    # candidate substring
-                    return text[start_idx:j+1]
-            else:
-                # mismatched - continue
-                continue
-    return None
+    end, ok = _match_span(text, m.start())
+    return text[m.start():end] if ok else None
 
 
 def parse_maybe_json(text: str) -> Union[dict, list, str]:
@@ -107,24 +225,20 @@ def parse_maybe_json(text: str) -> Union[dict, list, str]:
     if not text:
         return text
 
-    # 1) direct parse
-    parsed = safe_json_loads(text)
-    if parsed is not None:
+    # 1) whole text is JSON (fails fast on prose); scalars ("null", "42") stay text
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, (dict, list)):
         return parsed
 
-    # 2) extract from triple-backtick blocks
-    blocks = extract_code_blocks(text)
-    for b in blocks:
-        p = safe_json_loads(b)
-        if p is not None:
-            return p
-
-    # 3) try to find brace-delimited substring
-    cand = find_brace_substring(text)
-    if cand:
-        p = safe_json_loads(cand)
-        if p is not None:
-            return p
-
-    # 4) give up -> return original text
+    # 2) fenced blocks, then bare bracketed spans, found in one scan
+    for start, end, value in iter_json_candidates(text):
+        if value is _MISSING:
+            value = _decode_span(text, start, end)
+        if isinstance(value, (dict, list)):
+            return value
+
+    # 3) give up -> return original text
     return text
@@ -0,0 +1,213 @@
+# src/agentic_report_swarm/utils/logging.py
+"""
+Logging + lightweight per-stage instrumentation.
+
+Spans time one pipeline stage (plan, subtask, render, llm, parse, aggregate, ...)
+and carry attributes such as subtask id/type, prompt/response sizes and token
+counts (when the adapter reports them via `annotate`). Nested spans inherit
+subtask_id / subtask_type / plan_id from their parent, so an `llm` span opened
+inside a subtask is attributed to it. Parent tracking uses contextvars: asyncio
+tasks inherit the context automatically, threads do not. Work handed to a thread
+pool must run in `contextvars.copy_context().run` to keep its parent (SwarmManager,
+the batch runner and HedgedAdapter do); otherwise its spans start a new tree.
+
+Disabled by default; when disabled `span()` returns a shared no-op object, so the
+instrumentation can stay in hot paths. Enable with `enable()` or ARS_TRACE=1.
+
+Usage:
+    from agentic_report_swarm.utils import logging as tracing
+    tracing.enable(jsonl_path="spans.jsonl")
+    ... run_topic(...) ...
+    tracing.get_tracer().summary()  # {"llm": {"count":..,"p50_ms":..,"p95_ms":..,"p99_ms":..}, ...}
+"""
+import contextvars
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, IO, List, Optional, Union
+
+INHERITED_ATTRS = ("plan_id", "subtask_id", "subtask_type")
+DEFAULT_MAX_SPANS = 100_000
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("ars_current_span", default=None)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Standard library logger configured from LOG_LEVEL (default INFO)."""
+    logger = logging.getLogger(name)
+    if not logging.getLogger().handlers and not logger.handlers:
+        logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+                            format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    return logger
+
+
+class Span:
+    __slots__ = ("tracer", "stage", "attrs", "start_ts", "_t0", "duration_ms", "_token")
+
+    def __init__(self, tracer: "Tracer", stage: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.stage = stage
+        self.attrs = attrs
+        self.duration_ms = None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None:
+            for k in INHERITED_ATTRS:
+                if k in parent.attrs and k not in self.attrs:
+                    self.attrs[k] = parent.attrs[k]
+        self._token = _current_span.set(self)
+        self.start_ts = time.time()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_ms = (time.perf_counter() - self._t0) * 1000.0
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._record(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {"stage": self.stage, "start_ts": self.start_ts, "duration_ms": round(self.duration_ms, 3)}
+        out.update(self.attrs)
+        return out
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    # nearest-rank percentile
+    if not sorted_vals:
+        return 0.0
+    idx = max(0, min(len(sorted_vals) - 1, math.ceil(q / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[idx]
+
+
+class Tracer:
+    def __init__(self, enabled: bool = False, max_spans: int = DEFAULT_MAX_SPANS, jsonl_path: Optional[str] = None):
+        self.enabled = enabled
+        self._spans: "deque[Span]" = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._sink: Optional[IO[str]] = open(jsonl_path, "a", encoding="utf-8") if jsonl_path else None
+
+    def span(self, stage: str, **attrs: Any):
+        if not self.enabled:
+            return _NOOP
+        return Span(self, stage, attrs)
+
+    def _record(self, sp: Span) -> None:
+        with self._lock:
+            self._spans.append(sp)
+            if self._sink is not None:
+                self._sink.write(json.dumps(sp.to_dict(), default=str) + "\n")
+                self._sink.flush()
+
+    def spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [sp.to_dict() for sp in self._spans]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count / mean / p50 / p95 / p99 / max (milliseconds) plus summed token counts."""
+        by_stage: Dict[str, List[float]] = {}
+        tokens: Dict[str, int] = {}
+        with self._lock:
+            for sp in self._spans:
+                by_stage.setdefault(sp.stage, []).append(sp.duration_ms)
+                for k in ("prompt_tokens", "completion_tokens"):
+                    if k in sp.attrs:
+                        tokens[f"{sp.stage}.{k}"] = tokens.get(f"{sp.stage}.{k}", 0) + int(sp.attrs[k] or 0)
+        out: Dict[str, Dict[str, float]] = {}
+        for stage, vals in by_stage.items():
+            vals.sort()
+            out[stage] = {
+                "count": len(vals),
+                "mean_ms": round(sum(vals) / len(vals), 3),
+                "p50_ms": round(_percentile(vals, 50), 3),
+                "p95_ms": round(_percentile(vals, 95), 3),
+                "p99_ms": round(_percentile(vals, 99), 3),
+                "max_ms": round(vals[-1], 3),
+            }
+            for k in ("prompt_tokens", "completion_tokens"):
+                if f"{stage}.{k}" in tokens:
+                    out[stage][k] = tokens[f"{stage}.{k}"]
+        return out
+
+    def export_jsonl(self, dest: Union[str, IO[str]]) -> int:
+        """Write all recorded spans as JSON lines; returns the number written."""
+        rows = self.spans()
+        if isinstance(dest, str):
+            with open(dest, "w", encoding="utf-8") as fh:
+                for r in rows:
+                    fh.write(json.dumps(r, default=str) + "\n")
+        else:
+            for r in rows:
+                dest.write(json.dumps(r, default=str) + "\n")
+        return len(rows)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sink is not None:
+                self._sink.close()
+                self._sink = None
+
+
+_tracer = Tracer(enabled=os.environ.get("ARS_TRACE", "").lower() in ("1", "true", "yes"))
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def enable(jsonl_path: Optional[str] = None, max_spans: int = DEFAULT_MAX_SPANS) -> Tracer:
+    """Install a fresh enabled tracer (optionally streaming spans to a JSONL file)."""
+    global _tracer
+    _tracer.close()
+    _tracer = Tracer(enabled=True, max_spans=max_spans, jsonl_path=jsonl_path)
+    return _tracer
+
+
+def disable() -> None:
+    _tracer.enabled = False
+
+
+def span(stage: str, **attrs: Any):
+    """Context manager timing `stage`; a shared no-op when tracing is disabled."""
+    if not _tracer.enabled:
+        return _NOOP
+    return Span(_tracer, stage, attrs)
+
+
+def annotate(**attrs: Any) -> None:
+    """Attach attributes (e.g. token usage) to the innermost active span, if any."""
+    if not _tracer.enabled:
+        return
+    sp = _current_span.get()
+    if sp is not None:
+        sp.attrs.update(attrs)
@@ -5,17 +5,26 @@ Prompt loader & renderer using jinja2.
 Functions:
 - load_yaml_template(path: Path) -> dict
 - render_template(template: Union[dict, str], context: dict) -> str
+- render_many(template: Union[dict, str], contexts: Iterable[dict]) -> List[str]
+- get_compiled(template: Union[dict, str]) -> jinja2.Template
+
+All rendering goes through one shared jinja2 Environment. Compiled templates are
+kept in a bounded LRU keyed by a hash of the template source, so each distinct
+prompt is parsed/compiled once per process.
 
 Template can be:
 - a dict {'prompt': '...'} (loaded from YAML)
 - a raw string prompt
 """
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Iterable, List
+import hashlib
+import threading
 import yaml
 
 try:
-    from jinja2 import Template, StrictUndefined
+    from jinja2 import Environment, Template, StrictUndefined
 except Exception as e:
     raise RuntimeError("jinja2 is required for prompt rendering. Install with `pip install jinja2`.") from e
 
@@ -30,21 +39,67 @@ def load_yaml_template(path: Union[str, Path]) -> Dict[str, Any]:
     return data
 
 
-def render_template(template: Union[Dict[str, Any], str], context: Dict[str, Any]) -> str:
-    """
-    Render a template (dict with 'prompt' key OR raw string) using jinja2.
-    Context is a mapping that will contain at least 'task' key.
-    """
+DEFAULT_COMPILED_CACHE_SIZE = 256
+
+# Shared environment with strict undefined to surface missing keys quickly.
+_env = Environment(undefined=StrictUndefined)
+_compiled: "OrderedDict[str, Template]" = OrderedDict()
+_compiled_lock = threading.Lock()
+_compiled_max = DEFAULT_COMPILED_CACHE_SIZE
+
+
+def template_source(template: Union[Dict[str, Any], str]) -> str:
+    """Return the raw jinja2 source of a template dict ('prompt'/'template' key) or string."""
     if isinstance(template, dict):
         tpl_str = template.get("prompt") or template.get("template") or ""
     else:
         tpl_str = template
+    return tpl_str if tpl_str is not None else ""
+
+
+def get_compiled(template: Union[Dict[str, Any], str]) -> Template:
+    """Return the compiled jinja2 Template for `template`, compiling at most once per distinct source."""
+    src = template_source(template)
+    key = hashlib.sha1(src.encode("utf-8")).hexdigest()
+    with _compiled_lock:
+        jtpl = _compiled.get(key)
+        if jtpl is not None:
+            _compiled.move_to_end(key)
+            return jtpl
+    # compile outside the lock; a racing duplicate compile is harmless
+    jtpl = _env.from_string(src)
+    with _compiled_lock:
+        _compiled[key] = jtpl
+        while len(_compiled) > _compiled_max:
+            _compiled.popitem(last=False)
+    return jtpl
 
-    if tpl_str is None:
-        tpl_str = ""
 
-    # Create Jinja2 template with strict undefined to surface missing keys quickly.
-    jtpl = Template(tpl_str, undefined=StrictUndefined)
+def set_compiled_cache_size(size: int) -> None:
+    """Resize the compiled-template LRU (evicts oldest entries if shrinking)."""
+    global _compiled_max
+    with _compiled_lock:
+        _compiled_max = max(1, int(size))
+        while len(_compiled) > _compiled_max:
+            _compiled.popitem(last=False)
+
+
+def clear_compiled_cache() -> None:
+    with _compiled_lock:
+        _compiled.clear()
+
+
+def render_template(template: Union[Dict[str, Any], str], context: Dict[str, Any]) -> str:
+    """
+    Render a template (dict with 'prompt' key OR raw string) using jinja2.
+    Context is a mapping that will contain at least 'task' key.
+    """
+    jtpl = get_compiled(template)
     # Best practice: provide the whole context object as 'task' and allow top-level destructuring via dot/dict access.
-    render_ctx = dict(context)
-    return jtpl.render(**render_ctx)
+    return jtpl.render(**context)
+
+
+def render_many(template: Union[Dict[str, Any], str], contexts: Iterable[Dict[str, Any]]) -> List[str]:
+    """Render one template against many contexts (single cache lookup)."""
+    jtpl = get_compiled(template)
+    return [jtpl.render(**ctx) for ctx in contexts]
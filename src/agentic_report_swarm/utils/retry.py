@@ -0,0 +1,206 @@
+# src/agentic_report_swarm/utils/retry.py
+"""
+Retry, backoff and rate-limit governor for LLM calls.
+
+- is_retryable(exc): classify transient errors (timeouts, connection errors,
+  HTTP 408/409/425/429/5xx, provider RateLimit/Timeout/Connection errors).
+- RetryPolicy: exponential backoff with full jitter; honours Retry-After.
+- TokenBucket / RateLimiter: shared requests-per-minute + tokens-per-minute
+  budget that every concurrent agent draws from. A 429 pauses the whole
+  limiter, so a burst of parallel subtasks slows down together instead of
+  each one hammering the provider.
+
+Usage:
+    limiter = RateLimiter(rpm=500, tpm=200_000)
+    client = LLMClient(adapter, retry_policy=RetryPolicy(max_attempts=5), rate_limiter=limiter)
+"""
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+from .cancellation import DeadlineExceeded, LLMCancelled
+
+RETRYABLE_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+RETRYABLE_EXC_NAMES = frozenset({
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+    "ServiceUnavailableError", "Timeout", "TimeoutException", "ConnectError",
+    "ReadTimeout", "ConnectTimeout", "RemoteProtocolError",
+})
+
+
+class TransientLLMError(RuntimeError):
+    """A retryable backend failure (default HTTP 503)."""
+
+    def __init__(self, message: str = "transient LLM backend error", status_code: int = 503, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class RateLimitError(TransientLLMError):
+    """Provider rejected the call for rate limiting (HTTP 429)."""
+
+    def __init__(self, message: str = "rate limited", retry_after: Optional[float] = None):
+        super().__init__(message, status_code=429, retry_after=retry_after)
+
+
+def status_of(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after_of(exc: BaseException) -> Optional[float]:
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is not None:
+            value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (DeadlineExceeded, LLMCancelled)):
+        return False
+    if isinstance(exc, (TimeoutError, ConnectionError, TransientLLMError)):
+        return True
+    status = status_of(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return type(exc).__name__ in RETRYABLE_EXC_NAMES
+
+
+def is_rate_limit(exc: BaseException) -> bool:
+    return status_of(exc) == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def estimate_tokens(prompt: str, max_tokens: int = 0) -> int:
+    """Rough token cost of a call (~4 chars/token for the prompt plus the completion budget)."""
+    return max(1, len(prompt) // 4) + max_tokens
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: Callable[[BaseException], bool] = is_retryable
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Backoff before retry number `attempt` (1-based): full jitter, at least Retry-After."""
+        cap = min(self.max_delay, self.base_delay * (self.multiplier ** (attempt - 1)))
+        d = self.rng.uniform(0, cap) if self.jitter else cap
+        hinted = retry_after_of(exc) if exc is not None else None
+        if hinted is not None:
+            d = max(d, min(hinted, self.max_delay))
+        return d
+
+    def call(self, fn: Callable[..., Any], *args, on_retry: Optional[Callable[[BaseException, float], None]] = None, **kwargs) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.retry_on(e):
+                    raise
+                d = self.delay(attempt, e)
+                if on_retry is not None:
+                    on_retry(e, d)
+                time.sleep(d)
+                attempt += 1
+
+    async def acall(self, fn: Callable[..., Any], *args, on_retry: Optional[Callable[[BaseException, float], None]] = None, **kwargs) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.retry_on(e):
+                    raise
+                d = self.delay(attempt, e)
+                if on_retry is not None:
+                    on_retry(e, d)
+                await asyncio.sleep(d)
+                attempt += 1
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate` tokens/second up to `capacity`.
+    `reserve(n)` takes tokens immediately (the level may go negative) and returns how long
+    the caller must wait, so sync and async callers share one fair FIFO-ish budget.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._level = self.capacity
+        self._ts = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._ts) * self.rate)
+        self._ts = now
+
+    def reserve(self, n: float = 1.0) -> float:
+        n = min(n, self.capacity)
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level -= n
+            return max(0.0, -self._level / self.rate)
+
+    def acquire(self, n: float = 1.0) -> None:
+        wait = self.reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, n: float = 1.0) -> None:
+        wait = self.reserve(n)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Shared requests-per-minute and tokens-per-minute governor (either may be None)."""
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None, burst_seconds: float = 1.0):
+        # burst capacity = `burst_seconds` worth of budget, so bursts are smoothed out
+        self.requests = TokenBucket(rpm / 60.0, max(1.0, rpm / 60.0 * burst_seconds)) if rpm else None
+        self.tokens = TokenBucket(tpm / 60.0, max(1.0, tpm / 60.0 * burst_seconds)) if tpm else None
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out budget for `seconds` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait_for(self, tokens: int) -> float:
+        wait = max(0.0, self._paused_until - time.monotonic())
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens is not None and tokens:
+            wait = max(wait, self.tokens.reserve(tokens))
+        return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        wait = self._wait_for(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        wait = self._wait_for(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -7,45 +7,146 @@ Responsibilities:
 - load them into a dict mapping key -> template dict
 - provide helper to get single template by name
 - validate basic shape (must be a mapping and contain 'prompt' key ideally)
+
+Reloads are incremental: an index of (path, mtime, size, sha1) is kept and only
+files whose stat or content changed are re-parsed. Readers always get an
+immutable snapshot; a refresh builds a new snapshot and swaps it in atomically,
+so concurrent agents never observe a half-reloaded template set.
+`TemplateRegistry.shared(dir)` returns one process-wide registry per directory,
+and `start_watcher()` polls for changes in a background thread (hot reload).
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+import hashlib
+import threading
 import yaml
 
 DEFAULT_TEMPLATE_DIR = Path("config/agent_templates")
+TEMPLATE_SUFFIXES = (".yaml", ".yml", ".json")
+
+@dataclass(frozen=True)
+class TemplateFileInfo:
+    path: Path
+    mtime_ns: int
+    size: int
+    sha1: str
+
+@dataclass(frozen=True)
+class TemplateSnapshot:
+    """Immutable view of the registry at one point in time. Template dicts must be treated as read-only."""
+    version: int
+    templates: Mapping[str, Dict[str, Any]]
 
 class TemplateRegistry:
+    _shared: Dict[Path, "TemplateRegistry"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, template_dir: Optional[Path] = None):
         self.template_dir = Path(template_dir) if template_dir else DEFAULT_TEMPLATE_DIR
-        self.templates: Dict[str, Dict[str, Any]] = {}
+        # key -> (file info, parsed template)
+        self._index: Dict[str, tuple] = {}
+        self._snapshot = TemplateSnapshot(version=0, templates=MappingProxyType({}))
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
         self.load_all()
 
-    def load_all(self) -> Dict[str, Dict[str, Any]]:
-        """Discover and load all .yaml/.yml/.json files in template_dir."""
-        self.templates = {}
-        if not self.template_dir.exists():
-            return self.templates
-        for p in sorted(self.template_dir.glob("*")):
-            if p.suffix.lower() not in (".yaml", ".yml", ".json"):
-                continue
-            try:
-                raw = yaml.safe_load(p.read_text())
-                if isinstance(raw, dict):
+    @classmethod
+    def shared(cls, template_dir: Optional[Path] = None) -> "TemplateRegistry":
+        """Process-wide registry for `template_dir` (created on first use)."""
+        key = Path(template_dir or DEFAULT_TEMPLATE_DIR).resolve()
+        with cls._shared_lock:
+            reg = cls._shared.get(key)
+            if reg is None:
+                reg = cls(key)
+                cls._shared[key] = reg
+            return reg
+
+    @property
+    def templates(self) -> Mapping[str, Dict[str, Any]]:
+        return self._snapshot.templates
+
+    def snapshot(self) -> TemplateSnapshot:
+        return self._snapshot
+
+    def load_all(self) -> Mapping[str, Dict[str, Any]]:
+        """Discover and load all .yaml/.yml/.json files in template_dir (ignores the index)."""
+        with self._reload_lock:
+            self._index = {}
+        return self.refresh()
+
+    def _load_file(self, p: Path, stat, previous: Optional[tuple]) -> Optional[tuple]:
+        data = p.read_bytes()
+        sha1 = hashlib.sha1(data).hexdigest()
+        info = TemplateFileInfo(path=p, mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha1=sha1)
+        if previous is not None and previous[0].sha1 == sha1:
+            # touched but unchanged content -> keep parsed object
+            return (info, previous[1])
+        raw = yaml.safe_load(data.decode("utf-8"))
+        if not isinstance(raw, dict):
+            # skip non-mapping files
+            return None
+        return (info, raw)
+
+    def refresh(self) -> Mapping[str, Dict[str, Any]]:
+        """Re-scan template_dir, re-parsing only files whose (mtime, size) or content changed."""
+        with self._reload_lock:
+            new_index: Dict[str, tuple] = {}
+            if self.template_dir.exists():
+                for p in sorted(self.template_dir.glob("*")):
+                    if p.suffix.lower() not in TEMPLATE_SUFFIXES:
+                        continue
                     # key name: filename without extension
                     key = p.stem
-                    self.templates[key] = raw
-                else:
-                    # skip non-mapping files
-                    continue
-            except Exception:
-                # skip broken files (could log)
-                continue
-        return self.templates
+                    try:
+                        stat = p.stat()
+                        prev = self._index.get(key)
+                        if prev is not None and prev[0].path == p and prev[0].mtime_ns == stat.st_mtime_ns and prev[0].size == stat.st_size:
+                            new_index[key] = prev
+                            continue
+                        entry = self._load_file(p, stat, prev)
+                    except Exception:
+                        # skip broken files (could log)
+                        continue
+                    if entry is not None:
+                        new_index[key] = entry
+
+            changed = new_index.keys() != self._index.keys() or any(
+                new_index[k][1] is not self._index[k][1] for k in new_index
+            )
+            self._index = new_index
+            if changed:
+                templates = {k: entry[1] for k, entry in new_index.items()}
+                self._snapshot = TemplateSnapshot(version=self._snapshot.version + 1, templates=MappingProxyType(templates))
+            return self._snapshot.templates
+
+    def index(self) -> Dict[str, TemplateFileInfo]:
+        return {k: entry[0] for k, entry in self._index.items()}
 
     def get(self, name: str) -> Optional[Dict[str, Any]]:
         return self.templates.get(name)
 
-    def refresh(self) -> Dict[str, Dict[str, Any]]:
-        """Reload from disk."""
-        return self.load_all()
+    def start_watcher(self, interval: float = 2.0) -> None:
+        """Poll template_dir every `interval` seconds and hot-reload changes (daemon thread)."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watch_stop.clear()
+
+        def _loop():
+            while not self._watch_stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    continue
+
+        self._watcher = threading.Thread(target=_loop, name=f"template-watcher:{self.template_dir}", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self, timeout: Optional[float] = None) -> None:
+        self._watch_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout)
+            self._watcher = None
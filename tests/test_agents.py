@@ -12,3 +12,33 @@ def test_generic_agent_with_mock_llm():
     res = agent.run(task)
     assert "MOCK-ADAPTER" in res["text"] or "Generated for" in res["text"]
     assert res["meta"]["task_id"] == "t1"
+
+def test_generic_agent_render_prompts_batch():
+    factory = AgentFactory(llm_client=LLMClient(MockOpenAIAdapter()), templates={"research": {"prompt": "R {{ task.payload.topic }}"}})
+    agent = factory.build("research")
+    tasks = [{"id": f"t{i}", "type": "research", "payload": {"topic": str(i)}} for i in range(3)]
+    assert agent.render_prompts(tasks) == ["R 0", "R 1", "R 2"]
+
+def test_factory_pools_agents_per_template(tmp_path):
+    tpl = {"prompt": "R {{ task.payload.topic }}"}
+    templates = {"research": tpl}
+    factory = AgentFactory(llm_client=LLMClient(MockOpenAIAdapter()), templates=templates)
+    a = factory.build("research")
+    assert factory.build("research") is a
+    templates["research"] = {"prompt": "changed {{ task.id }}"}
+    b = factory.build("research")
+    assert b is not a
+    assert b.render_prompts([{"id": "t9"}]) == ["changed t9"]
+    assert AgentFactory(llm_client=LLMClient(MockOpenAIAdapter()), templates=templates, pool_agents=False).build("research") is not b
+
+def test_path_template_resolved_once_and_reloaded_on_change(tmp_path):
+    import os
+    p = tmp_path / "research.yaml"
+    p.write_text("prompt: v1 {{ task.id }}\n")
+    factory = AgentFactory(llm_client=LLMClient(MockOpenAIAdapter()), templates={"research": str(p)})
+    agent = factory.build("research")
+    assert factory.build("research") is agent
+    assert agent.render_prompts([{"id": "x"}]) == ["v1 x"]
+    p.write_text("prompt: v2 {{ task.id }}\n")
+    os.utime(p, ns=(p.stat().st_atime_ns, p.stat().st_mtime_ns + 10_000_000))
+    assert factory.build("research").render_prompts([{"id": "x"}]) == ["v2 x"]
@@ -0,0 +1,62 @@
+# tests/test_batch_runner.py
+import json
+import pytest
+from agentic_report_swarm.orchestrator.batch_runner import run_batch, read_topics, iter_batch_processes, JSONLSink, DirectorySink
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.adapters.openai_adapter import MockOpenAIAdapter
+
+def _factory():
+    return AgentFactory(llm_client=LLMClient(MockOpenAIAdapter()), templates={})
+
+def test_read_topics_accepts_text_and_jsonl(tmp_path):
+    p = tmp_path / "topics.jsonl"
+    p.write_text('AI in healthcare\n{"topic": "fintech"}\n"edtech"\n\n')
+    assert list(read_topics(p)) == ["AI in healthcare", "fintech", "edtech"]
+
+def test_run_batch_streams_to_jsonl(tmp_path):
+    out = tmp_path / "reports.jsonl"
+    topics = (f"topic {i}" for i in range(10))
+    summary = run_batch(topics, sink=JSONLSink(out), agent_factory=_factory(), max_concurrency=3)
+    assert summary["total"] == 10 and summary["failed"] == 0
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r["index"] for r in rows) == list(range(10))
+    assert all("Research Report" in r["markdown"] for r in rows)
+
+def test_run_batch_writes_directory(tmp_path):
+    summary = run_batch(["Quantum Computing"], sink=DirectorySink(tmp_path / "out"), agent_factory=_factory())
+    assert summary["succeeded"] == 1
+    assert (tmp_path / "out" / "000000-quantum-computing.md").exists()
+
+def _crashing_factory():
+    from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+    return AgentFactory(llm_client=LLMClient(FakeLLMAdapter(response=_exit_on_crash)), templates={})
+
+def _exit_on_crash(prompt):
+    import os
+    if "crash" in prompt:
+        os._exit(3)
+    return "ok"
+
+def _broken_factory():
+    raise ValueError("no credentials")
+
+def test_run_batch_processes_streams_all_topics(tmp_path):
+    out = tmp_path / "reports.jsonl"
+    summary = run_batch([f"topic {i}" for i in range(12)], sink=JSONLSink(out), processes=2,
+                        factory_builder=_factory, max_concurrency=3)
+    assert summary["total"] == 12 and summary["failed"] == 0
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r["index"] for r in rows) == list(range(12))
+    assert all("Research Report" in r["markdown"] for r in rows)
+
+def test_iter_batch_processes_reports_topics_lost_to_a_dead_worker():
+    items = list(iter_batch_processes(["fine", "crash me", "never run"], _crashing_factory, processes=1, max_concurrency=1))
+    by_topic = {i["topic"]: i for i in items}
+    assert by_topic["fine"]["success"]
+    assert not by_topic["crash me"]["success"] and "exited" in by_topic["crash me"]["error"]
+    assert sorted(i["index"] for i in items) == [0, 1, 2] and not by_topic["never run"]["success"]
+
+def test_iter_batch_processes_surfaces_worker_startup_errors():
+    with pytest.raises(RuntimeError, match="no credentials"):
+        list(iter_batch_processes(["a"], _broken_factory, processes=1))
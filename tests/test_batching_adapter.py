@@ -0,0 +1,76 @@
+# tests/test_batching_adapter.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from agentic_report_swarm.adapters.batching_adapter import BatchingAdapter
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.adapters.openai_adapter import MockOpenAIAdapter
+
+def test_concurrent_calls_are_coalesced_and_fanned_out():
+    backend = FakeLLMAdapter(latency=0.01)
+    adapter = BatchingAdapter(backend, max_batch_size=8, max_wait_ms=20)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            outs = list(pool.map(adapter.generate, [f"p{i}" for i in range(32)]))
+    finally:
+        adapter.close()
+    assert outs == [f"[FAKE] p{i}" for i in range(32)]
+    assert backend.stats()["prompts"] == 32
+    assert backend.stats()["requests"] < 32
+    assert adapter.stats()["avg_batch_size"] > 1
+
+def test_different_kwargs_are_not_mixed():
+    seen = []
+    class Recorder(FakeLLMAdapter):
+        def generate_batch(self, prompts, **kwargs):
+            seen.append((tuple(prompts), kwargs.get("temperature")))
+            return super().generate_batch(prompts, **kwargs)
+    adapter = BatchingAdapter(Recorder(), max_batch_size=4, max_wait_ms=30)
+
+    async def run():
+        return await asyncio.gather(
+            adapter.agenerate("a", temperature=0.1), adapter.agenerate("b", temperature=0.1),
+            adapter.agenerate("c", temperature=0.9), adapter.agenerate("d", temperature=0.9),
+        )
+
+    assert asyncio.run(run()) == ["[FAKE] a", "[FAKE] b", "[FAKE] c", "[FAKE] d"]
+    adapter.close()
+    assert all(len({p for p in prompts}) == 2 for prompts, _ in seen)
+    assert {t for _, t in seen} == {0.1, 0.9}
+
+def test_errors_propagate_to_every_caller_and_passthrough():
+    class Broken(FakeLLMAdapter):
+        def generate_batch(self, prompts, **kwargs):
+            raise RuntimeError("backend down")
+    adapter = BatchingAdapter(Broken(), max_batch_size=2, max_wait_ms=50)
+    futs = [adapter.submit("x"), adapter.submit("y")]
+    for f in futs:
+        with pytest.raises(RuntimeError, match="backend down"):
+            f.result(timeout=2)
+    adapter.close()
+    # adapters without generate_batch are called directly
+    assert BatchingAdapter(MockOpenAIAdapter()).generate("z") == "[MOCK-ADAPTER] Generated for: z"
+
+def test_deadlines_do_not_split_batches_and_bound_the_wait():
+    from agentic_report_swarm.utils.cancellation import Deadline, deadline_scope
+    from agentic_report_swarm.utils.llm_client import LLMClient
+    backend = FakeLLMAdapter(latency=0.01)
+    adapter = BatchingAdapter(backend, max_batch_size=16, max_wait_ms=30)
+    client = LLMClient(adapter)
+
+    def call(i):
+        with deadline_scope(Deadline.after(5.0 + i)):
+            return client.generate(f"p{i}")
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            outs = list(pool.map(call, range(16)))
+        assert outs == [f"[FAKE] p{i}" for i in range(16)]
+        assert adapter.stats()["batches"] <= 2
+
+        slow = BatchingAdapter(FakeLLMAdapter(latency=1.0), max_wait_ms=1)
+        with pytest.raises(TimeoutError):
+            slow.generate("p", timeout=0.05)
+        slow.close()
+        assert slow.adapter.stats()["timeouts"] == 1  # the batch was sent with the caller's timeout
+    finally:
+        adapter.close()
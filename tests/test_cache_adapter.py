@@ -0,0 +1,47 @@
+# tests/test_cache_adapter.py
+import asyncio
+import time
+from agentic_report_swarm.adapters.cache_adapter import CachingAdapter
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+class CountingAdapter:
+    model = "m1"
+    def __init__(self):
+        self.calls = 0
+    def generate(self, prompt: str, **kwargs) -> str:
+        self.calls += 1
+        return f"{prompt}:{kwargs.get('temperature')}:{self.calls}"
+
+def test_hits_and_misses_keyed_on_prompt_and_kwargs():
+    inner = CountingAdapter()
+    client = LLMClient(CachingAdapter(inner))
+    a = client.generate("p", temperature=0.1)
+    assert client.generate("p", temperature=0.1) == a
+    # timeout is transport-only and does not change the key
+    assert client.generate("p", temperature=0.1, timeout=5) == a
+    assert client.generate("p", temperature=0.9) != a
+    stats = client.adapter.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert inner.calls == 2
+
+def test_lru_size_and_ttl_eviction():
+    inner = CountingAdapter()
+    cache = CachingAdapter(inner, max_entries=2, ttl=0.05)
+    cache.generate("a"); cache.generate("b"); cache.generate("c")
+    cache.generate("a")  # evicted by size
+    assert inner.calls == 4
+    time.sleep(0.06)
+    cache.generate("c")  # expired
+    assert inner.calls == 5
+
+def test_disk_tier_survives_restart(tmp_path):
+    db = tmp_path / "cache.sqlite"
+    first = CachingAdapter(CountingAdapter(), disk_path=db)
+    value = first.generate("topic")
+    inner = CountingAdapter()
+    second = CachingAdapter(inner, disk_path=db)
+    assert second.generate("topic") == value
+    assert asyncio.run(second.agenerate("topic")) == value
+    assert inner.calls == 0
+    assert second.stats()["disk_hits"] == 1
+    assert second.stats()["memory_hits"] == 1
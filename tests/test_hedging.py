@@ -0,0 +1,130 @@
+# tests/test_hedging.py
+import asyncio
+import threading
+import time
+import pytest
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter, bimodal_latency
+from agentic_report_swarm.adapters.hedged_adapter import HedgedAdapter, LatencyTracker
+from agentic_report_swarm.core.planner import simple_planner
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+from agentic_report_swarm.utils.cancellation import CancelToken, Deadline, DeadlineExceeded, LLMCancelled, cancel_scope, deadline_scope
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.utils.retry import RetryPolicy
+
+STATIC = {t: {"prompt": t + " on {{ task.payload.topic }}"} for t in ("research", "trends", "insights", "writer")}
+
+class RecordingAdapter:
+    def __init__(self):
+        self.timeouts = []
+    def generate(self, prompt, **kwargs):
+        self.timeouts.append(kwargs.get("timeout"))
+        return "ok"
+
+def test_deadline_scope_caps_adapter_timeout_and_only_tightens():
+    adapter = RecordingAdapter()
+    client = LLMClient(adapter)
+    with deadline_scope(Deadline.after(5.0)):
+        with deadline_scope(Deadline.after(60.0)):
+            client.generate("p")
+        client.generate("p", timeout=1.0)
+    client.generate("p")
+    assert 4.0 < adapter.timeouts[0] <= 5.0
+    assert adapter.timeouts[1] == 1.0
+    assert adapter.timeouts[2] is None
+
+def test_expired_deadline_stops_retries():
+    client = LLMClient(FakeLLMAdapter(latency=0.2), retry_policy=RetryPolicy(max_attempts=5, base_delay=0.01))
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        client.generate("p", deadline=Deadline.after(0.05))
+    assert time.perf_counter() - started < 0.2
+
+def test_subtask_timeout_fails_slow_subtasks_fast():
+    af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter(latency=1.0)), templates=STATIC)
+    mgr = SwarmManager(agent_factory=af, max_workers=4, subtask_timeout=0.05)
+    started = time.perf_counter()
+    results = mgr.execute_plan(simple_planner("EV"))
+    assert time.perf_counter() - started < 0.5
+    assert not results["t1"]["success"]
+
+def test_plan_timeout_abandons_subtasks_that_ignore_it():
+    class DeafAdapter:
+        def generate(self, prompt, **kwargs):
+            time.sleep(0.01 if prompt.startswith("research") else 0.5)  # ignores `timeout`
+            return "ok"
+    af = AgentFactory(llm_client=LLMClient(DeafAdapter()), templates=STATIC)
+    mgr = SwarmManager(agent_factory=af, max_workers=4, plan_timeout=0.1)
+    started = time.perf_counter()
+    results = mgr.execute_plan(simple_planner("EV"))
+    assert time.perf_counter() - started < 0.3
+    assert results["t1"]["success"]
+    assert results["t2"]["error"] == "deadline_exceeded"
+    assert not any(r["success"] for tid, r in results.items() if tid != "t1")
+
+def test_plan_timeout_with_speculation_fails_cleanly():
+    af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter(latency=1.0)), templates=STATIC)
+    mgr = SwarmManager(agent_factory=af, max_workers=4, speculative=True, plan_timeout=0.2)
+    started = time.perf_counter()
+    results = mgr.execute_plan(simple_planner("EV"))
+    assert time.perf_counter() - started < 0.6
+    assert results["t1"]["error"] == "deadline_exceeded"
+    assert not any(r["success"] for r in results.values())
+    assert mgr.last_run_stats["spec_discarded"] == mgr.last_run_stats["speculated"]
+
+def test_latency_tracker_quantile():
+    tracker = LatencyTracker()
+    for v in range(1, 101):
+        tracker.record(v / 100)
+    assert tracker.quantile(0.95) == 0.95
+    assert LatencyTracker().quantile(0.5) is None
+
+def test_hedge_cuts_straggler_latency_and_cancels_loser():
+    primary = FakeLLMAdapter(latency=1.0)
+    alternate = FakeLLMAdapter(latency=0.01)
+    adapter = HedgedAdapter(primary, alternate=alternate, hedge_after=0.05)
+    started = time.perf_counter()
+    assert adapter.generate("hello world") == "[FAKE] hello world"
+    assert time.perf_counter() - started < 0.5
+    stats = adapter.stats()
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1 and stats["cancelled"] == 1
+    assert adapter.latencies.quantile(0.5) >= 0.05  # end-to-end, not the hedge's own run time
+    adapter.close()
+
+def test_hedging_arms_after_min_samples():
+    adapter = HedgedAdapter(FakeLLMAdapter(latency_dist=bimodal_latency(0.001, 0.5, p_slow=0.0)), min_samples=5)
+    for _ in range(5):
+        adapter.generate("p")
+    assert adapter.stats()["hedged"] == 0
+    assert adapter.hedge_delay() is not None and adapter.hedge_delay() < 0.1
+    adapter.close()
+
+def test_hedged_stream_yields_winner_and_forwards_outer_cancel():
+    adapter = HedgedAdapter(FakeLLMAdapter(latency=1.0), alternate=FakeLLMAdapter(latency=0.01), hedge_after=0.05)
+    assert list(adapter.stream("hi")) == ["[FAKE] hi"]
+    assert adapter.stats()["hedge_wins"] == 1
+    slow = HedgedAdapter(FakeLLMAdapter(latency=1.0), alternate=FakeLLMAdapter(latency=1.0), hedge_after=0.05)
+    token = CancelToken()
+    threading.Timer(0.15, token.cancel).start()
+    started = time.perf_counter()
+    with pytest.raises(LLMCancelled):
+        LLMClient(slow).generate("x", cancel_token=token)
+    assert time.perf_counter() - started < 0.5
+    assert slow.stats()["hedged"] == 1 and slow.stats()["cancelled"] == 2
+    with cancel_scope(token), pytest.raises(LLMCancelled):
+        list(slow.stream("y"))
+    adapter.close()
+    slow.close()
+
+def test_async_hedge_cancels_slow_primary():
+    adapter = HedgedAdapter(FakeLLMAdapter(latency=1.0), alternate=FakeLLMAdapter(latency=0.01), hedge_after=0.05)
+
+    async def go():
+        started = time.perf_counter()
+        text = await adapter.agenerate("q")
+        return text, time.perf_counter() - started
+
+    text, took = asyncio.run(go())
+    assert text == "[FAKE] q" and took < 0.5
+    assert adapter.stats()["cancelled"] == 1
+    adapter.close()
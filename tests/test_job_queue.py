@@ -0,0 +1,90 @@
+# tests/test_job_queue.py
+import threading
+import pytest
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.orchestrator.job_queue import JobQueue, QueueFull
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+def _factory(latency=0.0):
+    return AgentFactory(llm_client=LLMClient(FakeLLMAdapter(latency=latency)), templates={})
+
+def test_job_streams_sections_and_finishes():
+    jobs = JobQueue(_factory(), workers=2)
+    job = jobs.submit("AI in healthcare")
+    sections = list(job.iter_sections(timeout=5))
+    assert job.status == "done"
+    assert sections[0].startswith("# Research Report — AI in healthcare")
+    assert len(sections) == 5
+    assert job.to_dict()["markdown"] == "".join(sections)
+    assert jobs.stats()["done"] == 1
+    jobs.close()
+
+def test_full_queue_rejects_instead_of_blocking():
+    gate = threading.Event()
+
+    class GatedAdapter(FakeLLMAdapter):
+        def generate(self, prompt, **kwargs):
+            gate.wait(5)
+            return super().generate(prompt, **kwargs)
+
+    jobs = JobQueue(AgentFactory(llm_client=LLMClient(GatedAdapter()), templates={}), workers=1, max_queued=1)
+    first = jobs.submit("one")
+    first.wait_sections(0, timeout=5)  # picked up by the worker
+    jobs.submit("two")
+    with pytest.raises(QueueFull):
+        jobs.submit("three")
+    assert jobs.stats()["rejected"] == 1
+    gate.set()
+    jobs.close()
+    assert first.status == "done" and jobs.stats()["done"] == 2
+
+def test_failed_job_reports_error(monkeypatch):
+    def boom(*args, **kwargs):
+        raise RuntimeError("boom")
+        yield
+
+    monkeypatch.setattr("agentic_report_swarm.orchestrator.job_queue.stream_topic", boom)
+    jobs = JobQueue(_factory(), workers=1)
+    job = jobs.submit("x")
+    assert list(job.iter_sections(timeout=5)) == []
+    assert job.status == "failed" and job.error == "boom"
+    jobs.close()
+
+def test_listeners_hear_every_section_and_status_change():
+    gate = threading.Event()
+
+    class GatedAdapter(FakeLLMAdapter):
+        def generate(self, prompt, **kwargs):
+            gate.wait(5)
+            return super().generate(prompt, **kwargs)
+
+    calls = []
+    jobs = JobQueue(AgentFactory(llm_client=LLMClient(GatedAdapter()), templates={}), workers=1)
+    job = jobs.submit("AI in healthcare")
+    job.add_listener(lambda: calls.append(job.status))
+    gate.set()
+    list(job.iter_sections(timeout=5))
+    jobs.close()
+    assert calls[-1] == "done" and calls.count("done") == 1 and len(calls) >= 6  # 5 sections + done
+
+def test_close_does_not_block_on_a_full_queue():
+    import time
+    gate = threading.Event()
+
+    class GatedAdapter(FakeLLMAdapter):
+        def generate(self, prompt, **kwargs):
+            gate.wait(5)
+            return super().generate(prompt, **kwargs)
+
+    jobs = JobQueue(AgentFactory(llm_client=LLMClient(GatedAdapter()), templates={}), workers=1, max_queued=1)
+    jobs.submit("one").wait_sections(0, timeout=5)
+    queued = jobs.submit("two")
+    started = time.perf_counter()
+    jobs.close(wait=False)
+    assert time.perf_counter() - started < 0.1
+    with pytest.raises(RuntimeError, match="closed"):
+        jobs.submit("three")
+    gate.set()
+    list(queued.iter_sections(timeout=5))
+    assert queued.status == "done"  # queued work still drains after close
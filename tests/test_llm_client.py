@@ -0,0 +1,75 @@
+# tests/test_llm_client.py
+import asyncio
+import json
+import httpx
+from agentic_report_swarm.utils import logging as tracing
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.adapters.openai_adapter import (
+    MockOpenAIAdapter,
+    HTTPOpenAIAdapter,
+    shared_async_http_client,
+)
+
+class SyncOnlyAdapter:
+    def generate(self, prompt: str, **kwargs) -> str:
+        return f"sync:{prompt}"
+
+def _chat_handler(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    assert request.headers["authorization"] == "Bearer sk-test"
+    content = f"echo:{body['messages'][0]['content']}:{body['max_tokens']}"
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+def test_agenerate_uses_async_adapter():
+    client = LLMClient(MockOpenAIAdapter())
+    out = asyncio.run(client.agenerate("hello"))
+    assert out == "[MOCK-ADAPTER] Generated for: hello"
+
+def test_agenerate_falls_back_to_thread_for_sync_adapter():
+    client = LLMClient(SyncOnlyAdapter())
+
+    async def many():
+        return await asyncio.gather(*(client.agenerate(str(i)) for i in range(5)))
+
+    assert asyncio.run(many()) == [f"sync:{i}" for i in range(5)]
+
+def test_stream_and_astream_account_usage_and_open_llm_span():
+    tracer = tracing.enable()
+    try:
+        client = LLMClient(MockOpenAIAdapter())
+        assert "".join(client.stream("hello there")) == client.adapter.generate("hello there")
+
+        async def consume():
+            return [c async for c in client.astream("hi")]
+
+        asyncio.run(consume())
+        gen = client.stream("abandon this prompt")
+        next(gen)
+        gen.close()
+        usage = client.usage()
+        assert usage["calls"] == 3 and usage["completion_tokens"] > 0 and usage["cancelled_calls"] == 1
+        llm = [s for s in tracer.spans() if s["stage"] == "llm"]
+        assert len(llm) == 3 and all(s["streamed"] and s["response_chars"] > 0 for s in llm)
+        assert [s.get("cancelled", False) for s in llm] == [False, False, True]
+    finally:
+        tracing.disable()
+
+def test_http_adapter_sync_and_async():
+    transport = httpx.MockTransport(_chat_handler)
+    adapter = HTTPOpenAIAdapter(
+        api_key="sk-test",
+        max_tokens=7,
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+    assert adapter.generate("hi") == "echo:hi:7"
+    assert asyncio.run(LLMClient(adapter).agenerate("yo", max_tokens=3)) == "echo:yo:3"
+
+def test_shared_async_client_is_reused_per_loop():
+    async def grab():
+        a = shared_async_http_client(pool_size=3)
+        b = shared_async_http_client(pool_size=3)
+        await a.aclose()
+        return a is b
+
+    assert asyncio.run(grab())
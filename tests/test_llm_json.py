@@ -1,4 +1,5 @@
 # tests/test_llm_json.py
+import pytest
 from agentic_report_swarm.utils.llm_json import parse_maybe_json
 
 def test_parse_plain_json():
@@ -24,3 +25,35 @@ def test_non_json_returns_text():
     out = parse_maybe_json(txt)
     assert isinstance(out, str)
     assert out == txt
+
+def test_braces_inside_strings_do_not_break_extraction():
+    txt = 'Result: {"note": "use } and { carefully", "n": [1, "]"]} trailing'
+    out = parse_maybe_json(txt)
+    assert out == {"note": "use } and { carefully", "n": [1, "]"]}
+
+def test_fenced_block_preferred_over_earlier_bare_span():
+    txt = 'See [1] for details.\n```json\n{"answer": 42}\n```'
+    assert parse_maybe_json(txt) == {"answer": 42}
+
+def test_repairs_single_quotes_and_trailing_commas():
+    assert parse_maybe_json("Here: {'a': 1, 'b': [2, 3,],}") == {"a": 1, "b": [2, 3]}
+
+def test_skips_unparseable_span_and_tries_next():
+    txt = 'Note {see below}. Data: {"k": "v"}'
+    assert parse_maybe_json(txt) == {"k": "v"}
+
+def test_truncated_json_returns_text():
+    txt = 'Partial: {"a": {"b": [1, 2'
+    assert parse_maybe_json(txt) == txt
+
+def test_find_brace_substring_is_string_aware():
+    from agentic_report_swarm.utils.llm_json import find_brace_substring
+    assert find_brace_substring('x {"a": "}"} y') == '{"a": "}"}'
+
+def test_fenced_string_does_not_run_past_its_block():
+    txt = 'Run ```"abc``` then say "hi" {"a": 1}'
+    assert parse_maybe_json(txt) == {"a": 1}
+
+@pytest.mark.parametrize("txt", ["null", "42", '"x"', "true"])
+def test_json_scalars_are_returned_as_text(txt):
+    assert parse_maybe_json(txt) == txt
@@ -0,0 +1,57 @@
+# tests/test_logging.py
+import contextvars
+import io
+import json
+from agentic_report_swarm.utils import logging as tracing
+from agentic_report_swarm.orchestrator.super_agent import run_topic
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+
+TEMPLATES = {t: {"prompt": f"{t} {{{{ task.payload.topic }}}}"} for t in ("research", "trends", "insights", "writer")}
+
+def test_disabled_tracer_records_nothing():
+    tracing.disable()
+    tracer = tracing.get_tracer()
+    tracer.reset()
+    with tracing.span("plan") as sp:
+        sp.set(x=1)
+    tracing.annotate(prompt_tokens=3)
+    assert tracer.spans() == []
+
+def test_pipeline_spans_summary_and_export(tmp_path):
+    tracer = tracing.enable(jsonl_path=str(tmp_path / "live.jsonl"))
+    try:
+        run_topic("ai", templates=TEMPLATES, llm_client=LLMClient(FakeLLMAdapter()))
+        spans = tracer.spans()
+        stages = {s["stage"] for s in spans}
+        assert {"report", "plan", "subtask", "render", "llm", "parse", "aggregate"} <= stages
+        llm = [s for s in spans if s["stage"] == "llm"]
+        assert len(llm) == 4
+        # nested spans inherit the subtask identity; adapter-reported tokens are attached
+        assert {s["subtask_type"] for s in llm} == {"research", "trends", "insights", "writer"}
+        assert all(s["prompt_tokens"] > 0 and s["response_chars"] > 0 for s in llm)
+
+        summary = tracer.summary()
+        assert summary["llm"]["count"] == 4
+        assert set(summary["llm"]) >= {"p50_ms", "p95_ms", "p99_ms", "prompt_tokens", "completion_tokens"}
+
+        buf = io.StringIO()
+        assert tracer.export_jsonl(buf) == len(spans)
+        assert json.loads(buf.getvalue().splitlines()[0])["stage"]
+        assert len((tmp_path / "live.jsonl").read_text().splitlines()) == len(spans)
+    finally:
+        tracing.get_tracer().close()
+        tracing.disable()
+
+def test_subtask_workers_run_in_the_callers_context():
+    var = contextvars.ContextVar("caller", default=None)
+    seen = []
+
+    class Adapter:
+        def generate(self, prompt, **kwargs):
+            seen.append(var.get())
+            return "ok"
+
+    var.set("report-1")
+    run_topic("ai", templates=TEMPLATES, llm_client=LLMClient(Adapter()))
+    assert seen == ["report-1"] * 4
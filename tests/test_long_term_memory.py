@@ -0,0 +1,49 @@
+# tests/test_long_term_memory.py
+import time
+import pytest
+
+pytest.importorskip("numpy")
+
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.memory import long_term
+from agentic_report_swarm.memory.long_term import DEFAULT_MAX_AGE_S, ReportMemory
+from agentic_report_swarm.orchestrator.super_agent import run_topic
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+def _factory():
+    backend = FakeLLMAdapter()
+    return backend, AgentFactory(llm_client=LLMClient(backend), templates={})
+
+def test_near_duplicate_topic_reuses_prior_report(tmp_path):
+    mem = ReportMemory(tmp_path / "mem", similarity_threshold=0.75)
+    backend, af = _factory()
+    run_topic("AI in healthcare", agent_factory=af, report_memory=mem)
+    assert backend.stats()["requests"] == 4
+    md = run_topic("healthcare AI trends 2026", agent_factory=af, report_memory=mem)
+    assert backend.stats()["requests"] == 4
+    assert md.startswith("# Research Report — healthcare AI trends 2026")
+    run_topic("coffee exports Brazil", agent_factory=af, report_memory=mem)
+    assert backend.stats()["requests"] == 8
+    assert mem.stats()["reused"] == 1 and mem.stats()["stored"] == 2
+    mem.close()
+    # persisted: a reopened memory still finds the report
+    assert ReportMemory(tmp_path / "mem").lookup("AI in healthcare")["mode"] == "reuse"
+
+def test_stale_prior_refreshes_all_but_research():
+    mem = ReportMemory(max_age_s=0.0, refresh_age_s=3600)
+    backend, af = _factory()
+    run_topic("EV batteries Indonesia", agent_factory=af, report_memory=mem)
+    time.sleep(0.01)
+    run_topic("EV batteries Indonesia", agent_factory=af, report_memory=mem)
+    assert backend.stats()["requests"] == 4 + 3
+    assert mem.stats()["refreshed"] == 1
+
+def test_default_max_age_expires_reuse(monkeypatch):
+    mem = ReportMemory()
+    _, af = _factory()
+    run_topic("EV batteries Indonesia", agent_factory=af, report_memory=mem)
+    assert mem.lookup("EV batteries Indonesia")["mode"] == "reuse"
+    later = time.time() + DEFAULT_MAX_AGE_S + 1
+    monkeypatch.setattr(long_term.time, "time", lambda: later)
+    assert mem.lookup("EV batteries Indonesia") is None
@@ -0,0 +1,88 @@
+# tests/test_parallel_runner.py
+import threading
+import time
+import pytest
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.swarm.parallel_runner import ParallelRunner, temperature_variants
+from agentic_report_swarm.swarm.reducer import merge_json
+from agentic_report_swarm.swarm.scoring import default_scorer, json_validity_score, keyword_coverage_score
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+TASK = {"id": "t1", "type": "writer", "payload": {"topic": "electric vehicles Indonesia"}}
+
+class VariantAgent:
+    def __init__(self, variant, calls):
+        self.variant = variant
+        self.calls = calls
+    def run(self, task):
+        self.calls.append(self.variant["name"])
+        time.sleep(self.variant.get("delay", 0))
+        if self.variant.get("fail"):
+            raise RuntimeError("candidate failed")
+        return {"text": self.variant["text"], "meta": {}}
+
+def test_heuristic_scorers():
+    assert keyword_coverage_score()({"text": "Electric vehicles sell well"}, TASK) == pytest.approx(2 / 3)
+    assert json_validity_score({"text": 'note: {"a": 1}'}, TASK) == 1.0
+    assert json_validity_score({"text": "plain"}, TASK) == 0.0
+    assert temperature_variants(3) == [{"llm_kwargs": {"temperature": t}} for t in (0.2, 0.6, 1.0)]
+
+def test_best_candidate_wins_and_failures_are_tolerated():
+    calls = []
+    variants = [
+        {"name": "short", "text": "EV"},
+        {"name": "broken", "fail": True, "text": ""},
+        {"name": "good", "text": "electric vehicles Indonesia " * 20},
+    ]
+    runner = ParallelRunner(variants=variants, scorer=default_scorer())
+    out = runner.run(lambda v: VariantAgent(v, calls), TASK)
+    assert out["text"].startswith("electric vehicles")
+    assert out["meta"]["fanout"]["completed"] == 2 and out["meta"]["fanout"]["failed"] == 1
+
+def test_early_cancel_returns_first_good_answer():
+    calls = []
+    good = "electric vehicles Indonesia " * 20
+    variants = [{"name": "fast", "text": good}, {"name": "slow", "delay": 1.0, "text": good},
+                {"name": "queued", "text": good}]
+    runner = ParallelRunner(variants=variants, scorer=default_scorer(), threshold=0.9, max_parallel=2)
+    started = time.perf_counter()
+    out = runner.run(lambda v: VariantAgent(v, calls), TASK)
+    assert time.perf_counter() - started < 0.5
+    assert out["meta"]["fanout"]["early_stop"] is True
+    assert "queued" not in calls
+
+def test_merge_json_unions_candidates():
+    cands = [
+        {"index": 0, "score": 0.9, "output": {"text": "a", "json": {"facts": ["x"], "a": 1}}},
+        {"index": 1, "score": 0.5, "output": {"text": "b", "json": {"facts": ["x", "y"], "b": 2}}},
+    ]
+    assert merge_json(cands)["json"] == {"facts": ["x", "y"], "a": 1, "b": 2}
+
+def test_swarm_fanout_passes_llm_kwargs_per_variant():
+    seen = []
+    lock = threading.Lock()
+    class RecordingAdapter:
+        def generate(self, prompt, **kwargs):
+            with lock:
+                seen.append(kwargs.get("temperature"))
+            return "electric vehicles Indonesia report"
+    af = AgentFactory(llm_client=LLMClient(RecordingAdapter()), templates={})
+    plan = Plan("p", "electric vehicles Indonesia", [SubTask.make("writer", {"topic": "electric vehicles Indonesia"}, id="t1")])
+    results = SwarmManager(agent_factory=af, fanout={"writer": ParallelRunner(n=3)}).execute_plan(plan)
+    assert results["t1"]["success"]
+    assert sorted(seen) == [0.2, 0.6, 1.0]
+
+def test_candidates_inherit_caller_deadline():
+    from agentic_report_swarm.utils.cancellation import Deadline, current_deadline, deadline_scope
+    seen = []
+    class DeadlineAgent:
+        def run(self, task):
+            seen.append(current_deadline())
+            return {"text": "ok", "meta": {}}
+    runner = ParallelRunner(variants=[{}, {}])
+    deadline = Deadline.after(5.0)
+    with deadline_scope(deadline):
+        runner.run(lambda v: DeadlineAgent(), TASK)
+    assert seen == [deadline, deadline]
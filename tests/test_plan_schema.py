@@ -0,0 +1,56 @@
+# tests/test_plan_schema.py
+import pytest
+from agentic_report_swarm.core.plan_schema import CODEC_JSON, CODEC_MSGPACK, Plan, SubTask, SubtaskResult
+from agentic_report_swarm.core.planner import simple_planner
+
+def test_schema_types_are_slotted_and_ids_unique():
+    plan = simple_planner("EV")
+    assert not hasattr(plan, "__dict__") and not hasattr(plan.subtasks[0], "__dict__")
+    ids = {SubTask.make("research", {}).id for _ in range(1000)}
+    assert len(ids) == 1000
+    assert SubTask("a", "research", {}).depends_on is not SubTask("b", "research", {}).depends_on
+    assert Plan("p", "x").subtasks == [] and Plan("p", "x") != Plan("q", "x")
+
+def test_plan_bytes_round_trip():
+    plan = simple_planner("électric vehicles")
+    data = plan.to_bytes(codec=CODEC_JSON)
+    assert data[:2] == b"AR"
+    assert Plan.from_bytes(data) == plan
+    assert Plan.from_bytes(bytearray(data)).to_dict() == plan.to_dict()
+    with pytest.raises(ValueError):
+        Plan.from_bytes(b"XX" + data[2:])
+
+def test_msgpack_codec_round_trip():
+    pytest.importorskip("msgpack")
+    plan = simple_planner("EV")
+    assert Plan.from_bytes(plan.to_bytes(codec=CODEC_MSGPACK)) == plan
+
+def test_result_output_is_lazy_and_passed_through():
+    out = {"text": '{"facts": [1, 2]}', "json": {"facts": [1, 2]}, "meta": {"agent": "research_agent"}}
+    res = SubtaskResult("t1", True, out)
+    data = res.to_bytes(codec=CODEC_JSON)
+    assert data.count(b"facts") == 1  # json copy is rebuilt from text, not stored
+    back = SubtaskResult.from_bytes(data)
+    assert not back.decoded
+    assert back.to_bytes(codec=CODEC_JSON) == data and not back.decoded
+    assert back.output == out and back.decoded and back == res
+
+def test_result_keeps_json_that_differs_from_text():
+    out = {"text": '{"a": 1}', "json": {"a": 1, "b": 2}}
+    back = SubtaskResult.from_bytes(SubtaskResult("t1", True, out).to_bytes(codec=CODEC_JSON))
+    assert back.output == out
+    failed = SubtaskResult.from_bytes(SubtaskResult("t2", False, error="boom").to_bytes())
+    assert failed.to_dict() == {"id": "t2", "success": False, "output": None, "error": "boom"}
+
+def test_to_dict_copies_nested_containers_and_default_codec_is_json():
+    st = SubTask("a", "research", {"topic": "EV", "sources": ["x"], "opts": {"k": 1}}, ["b"])
+    d = st.to_dict()
+    d["payload"]["sources"].append("y")
+    d["payload"]["opts"]["k"] = 2
+    d["depends_on"].append("c")
+    assert st.payload == {"topic": "EV", "sources": ["x"], "opts": {"k": 1}} and st.depends_on == ["b"]
+    res = SubtaskResult("t1", True, {"json": {"facts": [1]}})
+    res.to_dict()["output"]["json"]["facts"].append(2)
+    assert res.output == {"json": {"facts": [1]}}
+    plan = simple_planner("EV")
+    assert plan.to_bytes() == plan.to_bytes(codec=CODEC_JSON)
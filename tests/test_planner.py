@@ -14,3 +14,88 @@ def test_planner_creates_four_tasks():
     assert deps["t2"] == ["t1"]
     assert deps["t3"] == ["t1", "t2"]
     assert deps["t4"] == ["t3"]
+
+import json
+import pytest
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.core.planner import LLMPlanner, PlanValidationError, RulePlanner, validate_plan
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.orchestrator.super_agent import run_topic
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+WIDE = {"subtasks": [
+    {"id": "r1", "type": "research", "focus": "Java", "depends_on": []},
+    {"id": "r2", "type": "research", "focus": "Sumatra", "depends_on": []},
+    {"id": "r3", "type": "research", "focus": "Bali", "depends_on": []},
+    {"id": "i1", "type": "insights", "depends_on": ["r1", "r2", "r3"]},
+    {"id": "w1", "type": "writer", "depends_on": ["i1"]},
+]}
+
+def _plan(*subtasks):
+    return Plan(plan_id="p", topic="x", subtasks=[SubTask(id=i, type="research", payload={}, depends_on=d) for i, d in subtasks])
+
+def test_validate_plan_reports_missing_ids_and_cycles():
+    with pytest.raises(PlanValidationError) as e:
+        validate_plan(_plan(("a", []), ("b", ["nope"]), ("a", [])))
+    assert "depends on missing id 'nope'" in str(e.value) and "duplicate subtask id 'a'" in str(e.value)
+    with pytest.raises(PlanValidationError, match="cycle"):
+        validate_plan(_plan(("a", ["c"]), ("b", ["a"]), ("c", ["b"]), ("d", [])))
+    assert validate_plan(simple_planner("x")).plan_id
+
+def test_llm_planner_builds_wide_plan_and_memoizes_by_topic():
+    adapter = FakeLLMAdapter(response=json.dumps(WIDE))
+    planner = LLMPlanner(LLMClient(adapter))
+    plan = planner.plan("EV market in Indonesia")
+    assert [st.id for st in plan.subtasks] == ["r1", "r2", "r3", "i1", "w1"]
+    assert plan.subtasks[0].payload == {"topic": "EV market in Indonesia", "focus": "Java"}
+    again = planner.plan("  ev market in INDONESIA? ")
+    assert adapter.stats()["requests"] == 1 and planner.stats()["hits"] == 1
+    assert again.plan_id != plan.plan_id and again.subtasks[0].payload["topic"] == "  ev market in INDONESIA? "
+
+def test_llm_planner_falls_back_on_invalid_reply():
+    bad = {"subtasks": [{"id": "a", "type": "research", "depends_on": ["b"]}, {"id": "b", "type": "research", "depends_on": ["a"]}]}
+    planner = LLMPlanner(LLMClient(FakeLLMAdapter(response=json.dumps(bad))))
+    assert [st.type for st in planner.plan("x").subtasks] == ["research", "trends", "insights", "writer"]
+    assert planner.stats()["fallbacks"] == 1 and planner.stats()["cached"] == 0
+    with pytest.raises(PlanValidationError):
+        LLMPlanner(LLMClient(FakeLLMAdapter(response="no plan")), strict=True).plan("x")
+
+def test_run_topic_with_wide_planner():
+    planner = LLMPlanner(LLMClient(FakeLLMAdapter(response=json.dumps(WIDE))))
+    af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter()), templates={})
+    md = run_topic("EV", agent_factory=af, max_workers=4, planner=planner)
+    assert md.count("### research") == 3 and "FAILED" not in md
+    assert RulePlanner().plan("EV").subtasks[3].depends_on == ["t3"]
+
+@pytest.mark.parametrize("item", [
+    {"id": "a", "type": "research", "depends_on": 5},
+    {"id": "a", "type": ["research"]},
+    {"id": {"x": 1}, "type": "research"},
+])
+def test_llm_planner_falls_back_on_malformed_fields(item):
+    planner = LLMPlanner(LLMClient(FakeLLMAdapter(response=json.dumps({"subtasks": [item]}))))
+    assert [st.id for st in planner.plan("x").subtasks] == ["t1", "t2", "t3", "t4"]
+    assert planner.stats()["fallbacks"] == 1
+
+def test_planner_base_is_abstract():
+    from agentic_report_swarm.core.planner import Planner
+    with pytest.raises(TypeError):
+        Planner()
+
+def test_llm_planner_falls_back_when_the_llm_call_fails():
+    planner = LLMPlanner(LLMClient(FakeLLMAdapter(fail_first=10)))
+    assert [st.id for st in planner.plan("x").subtasks] == ["t1", "t2", "t3", "t4"]
+    assert planner.stats()["fallbacks"] == 1
+    with pytest.raises(Exception):
+        LLMPlanner(LLMClient(FakeLLMAdapter(fail_first=10)), strict=True).plan("x")
+
+def test_llm_planner_plans_a_topic_once_under_concurrency():
+    from concurrent.futures import ThreadPoolExecutor
+    adapter = FakeLLMAdapter(response=json.dumps(WIDE), latency=0.05)
+    planner = LLMPlanner(LLMClient(adapter))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        plans = list(pool.map(planner.plan, ["EV"] * 8))
+    assert adapter.stats()["requests"] == 1
+    assert all(len(p.subtasks) == 5 for p in plans)
+    assert planner.stats()["misses"] == 1 and planner.stats()["hits"] == 7
@@ -15,3 +15,16 @@ def test_load_yaml_and_render(tmp_path):
     out = render_template(loaded, {"task": {"payload": {"topic": "ml"}, "id": "t123"}})
     assert "Topic: ml" in out
     assert "ID: t123" in out
+
+def test_compiled_template_is_cached_and_render_many():
+    from agentic_report_swarm.utils.prompt_loader import get_compiled, render_many
+    tpl = {"prompt": "Topic {{ task.payload.topic }}"}
+    assert get_compiled(tpl) is get_compiled("Topic {{ task.payload.topic }}")
+    out = render_many(tpl, [{"task": {"payload": {"topic": t}}} for t in ("a", "b")])
+    assert out == ["Topic a", "Topic b"]
+
+def test_strict_undefined_still_raises():
+    import pytest
+    from jinja2 import UndefinedError
+    with pytest.raises(UndefinedError):
+        render_template("{{ missing.key }}", {"task": {}})
@@ -0,0 +1,62 @@
+# tests/test_result_store.py
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.swarm.result_store import ResultStore
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+
+class CountingFactory:
+    def __init__(self, fail_types=()):
+        self.calls = []
+        self.fail_types = set(fail_types)
+        self.templates = {"research": {"prompt": "r"}, "writer": {"prompt": "w"}}
+    def build(self, agent_type):
+        factory = self
+        class Agent:
+            def run(self, task):
+                factory.calls.append(task["id"])
+                if task["type"] in factory.fail_types:
+                    raise RuntimeError("down")
+                return {"text": f"{task['type']}:{task['payload'].get('topic')}"}
+        return Agent()
+
+def _plan(topic="x"):
+    return Plan(plan_id="p1", topic=topic, subtasks=[
+        SubTask.make(type="research", payload={"topic": topic}, id="t1"),
+        SubTask.make(type="trends", payload={"topic": topic}, depends_on=["t1"], id="t2"),
+        SubTask.make(type="writer", payload={"topic": topic}, depends_on=["t2"], id="t3"),
+    ])
+
+def test_rerun_resumes_only_failed_part(tmp_path):
+    store = ResultStore(tmp_path / "results.sqlite")
+    failing = CountingFactory(fail_types={"writer"})
+    first = SwarmManager(agent_factory=failing, max_workers=1, result_store=store).execute_plan(_plan())
+    assert not first["t3"]["success"]
+
+    # durable: a new store instance on the same file sees the stored results
+    store2 = ResultStore(tmp_path / "results.sqlite")
+    fixed = CountingFactory()
+    mgr = SwarmManager(agent_factory=fixed, max_workers=2, result_store=store2)
+    results = mgr.execute_plan(_plan())
+    assert fixed.calls == ["t3"]
+    assert results["t1"]["cached"] and results["t3"]["success"]
+    assert mgr.last_run_stats == {"skipped": 2, "recomputed": 1}
+
+def test_changed_inputs_invalidate_subtask_and_dependents():
+    store = ResultStore()
+    factory = CountingFactory()
+    SwarmManager(agent_factory=factory, max_workers=1, result_store=store).execute_plan(_plan())
+    factory.calls.clear()
+    factory.templates["writer"] = {"prompt": "new writer"}
+    SwarmManager(agent_factory=factory, max_workers=1, result_store=store).execute_plan(_plan())
+    assert factory.calls == ["t3"]
+    factory.calls.clear()
+    mgr = SwarmManager(agent_factory=factory, max_workers=1, result_store=store)
+    mgr.execute_plan(_plan(topic="y"))
+    assert factory.calls == ["t1", "t2", "t3"]
+    assert mgr.last_run_stats == {"skipped": 0, "recomputed": 3}
+
+def test_run_topic_with_store_reuses_results():
+    from agentic_report_swarm.orchestrator.super_agent import run_topic
+    store = ResultStore()
+    first = run_topic("EV Indonesia", result_store=store)
+    assert run_topic("EV Indonesia", result_store=store) == first
+    assert store.stats()["hits"] == 4
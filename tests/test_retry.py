@@ -0,0 +1,78 @@
+# tests/test_retry.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from agentic_report_swarm.utils.retry import (
+    RetryPolicy, RateLimiter, TokenBucket, RateLimitError, TransientLLMError, is_retryable,
+)
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+
+FAST = dict(base_delay=0.001, max_delay=0.01)
+
+class HTTPStatusError(Exception):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+def test_classification():
+    assert is_retryable(RateLimitError())
+    assert is_retryable(TimeoutError())
+    assert is_retryable(HTTPStatusError(502))
+    assert not is_retryable(HTTPStatusError(400))
+    assert not is_retryable(ValueError("bad prompt"))
+
+def test_backoff_is_capped_and_honours_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=False)
+    assert [policy.delay(a) for a in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 4.0]
+    assert policy.delay(1, RateLimitError(retry_after=3.0)) == 3.0
+
+def test_client_retries_transient_failures():
+    fake = FakeLLMAdapter(fail_first=2)
+    client = LLMClient(fake, retry_policy=RetryPolicy(max_attempts=3, **FAST))
+    assert client.generate("x") == "[FAKE] x"
+    assert fake.stats()["failures"] == 2
+    with pytest.raises(TransientLLMError):
+        LLMClient(FakeLLMAdapter(fail_first=5), retry_policy=RetryPolicy(max_attempts=2, **FAST)).generate("x")
+
+def test_non_retryable_error_is_not_retried():
+    calls = []
+    def boom():
+        calls.append(1)
+        raise ValueError("bad")
+    with pytest.raises(ValueError):
+        RetryPolicy(**FAST).call(boom)
+    assert len(calls) == 1
+
+def test_async_retry():
+    client = LLMClient(FakeLLMAdapter(fail_first=1), retry_policy=RetryPolicy(**FAST))
+    assert asyncio.run(client.agenerate("y")) == "[FAKE] y"
+
+def test_token_bucket_paces_callers():
+    bucket = TokenBucket(rate=100.0, capacity=1.0)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+def test_shared_limiter_avoids_429s_under_burst():
+    fake = FakeLLMAdapter(rate_limit=(5, 0.1))
+    # 40 req/s with a burst of 2 stays under the 5-per-100ms the fake backend allows
+    limiter = RateLimiter(rpm=2400, burst_seconds=0.05)
+    client = LLMClient(fake, rate_limiter=limiter, retry_policy=RetryPolicy(max_attempts=6, **FAST))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outs = list(pool.map(client.generate, [str(i) for i in range(12)]))
+    assert len(outs) == 12
+    assert fake.stats()["rate_limited"] <= 1
+
+def test_swarm_manager_retries_subtasks():
+    fake = FakeLLMAdapter(fail_first=1)
+    from agentic_report_swarm.factory.agent_factory import AgentFactory
+    af = AgentFactory(llm_client=LLMClient(fake), templates={"research": {"prompt": "r"}})
+    plan = Plan(plan_id="p", topic="x", subtasks=[SubTask.make(type="research", payload={}, id="t1")])
+    assert not SwarmManager(af).execute_plan(plan)["t1"]["success"]
+    fake.fail_first = 2
+    res = SwarmManager(af, retry_policy=RetryPolicy(**FAST)).execute_plan(plan)
+    assert res["t1"]["success"]
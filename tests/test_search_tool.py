@@ -0,0 +1,84 @@
+# tests/test_search_tool.py
+import json
+import os
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.agents.tools.search_tool import SearchIndex, SearchTool, tokenize
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+def _corpus(root):
+    root.mkdir()
+    (root / "ev.md").write_text("# EV batteries\nLithium battery supply chains for electric vehicles.")
+    (root / "solar.txt").write_text("Solar panel prices fell sharply; solar adoption grows.")
+    (root / "news.jsonl").write_text(
+        json.dumps({"id": "n1", "title": "Battery recycling", "text": "Battery recycling recovers lithium and cobalt."}) + "\n"
+        + json.dumps({"id": "n2", "text": "Retail banking moves to mobile apps."}) + "\n"
+    )
+    return root
+
+def test_tokenize_drops_stopwords_and_case():
+    assert tokenize("The EV and its Battery, 2026!") == ["ev", "battery", "2026"]
+
+def test_bm25_ranks_and_persists(tmp_path):
+    corpus = _corpus(tmp_path / "corpus")
+    index = SearchIndex(tmp_path / "idx")
+    assert index.index_directory(corpus) == {"indexed": 3, "skipped": 0, "removed": 0}
+    hits = index.search("lithium battery", k=3)
+    assert {h["id"] for h in hits[:2]} == {"ev.md", "n1"}
+    assert hits[0]["score"] >= hits[1]["score"] > 0
+    assert index.search("solar")[0]["title"] == "Solar panel prices fell sharply; solar adoption grows."
+    index.close()
+
+    reopened = SearchIndex(tmp_path / "idx")
+    assert len(reopened) == 4
+    assert reopened.search("cobalt")[0]["id"] == "n1"
+    reopened.close()
+
+def test_incremental_reindex_replaces_changed_and_removed_files(tmp_path):
+    corpus = _corpus(tmp_path / "corpus")
+    index = SearchIndex(tmp_path / "idx")
+    index.index_directory(corpus)
+    (corpus / "solar.txt").write_text("Wind turbines offshore.")
+    os.utime(corpus / "solar.txt", ns=(1, 1))
+    (corpus / "ev.md").unlink()
+    assert index.index_directory(corpus) == {"indexed": 1, "skipped": 1, "removed": 1}
+    assert index.search("solar") == []
+    assert index.search("wind")[0]["source"] == "solar.txt"
+    assert [h["id"] for h in index.search("lithium")] == ["n1"]
+    live = len(index)
+    assert index.total_len == sum(index._doclens[d] for d in range(len(index._doclens)) if d not in index._deleted)
+    stats = index.stats()
+    assert stats["deleted"] == 2 and stats["avgdl"] == round(index.total_len / live, 3)
+    segments = stats["segments"]
+    index.compact()
+    stats = index.stats()
+    assert stats["segments"] == 1 < segments and stats["deleted"] == 0 and len(index) == live
+    assert [h["id"] for h in index.search("lithium")] == ["n1"]
+    index.close()
+    reopened = SearchIndex(tmp_path / "idx")
+    assert len(reopened) == live and reopened.stats()["deleted"] == 0
+    assert json.loads((tmp_path / "idx" / "deleted.json").read_text()) == []
+    reopened.close()
+
+def test_batch_queries_and_cache(tmp_path):
+    index = SearchIndex(tmp_path / "idx")
+    index.add_documents([{"text": f"document {i} about topic{i % 5}"} for i in range(50)])
+    index.commit()
+    batch = index.search_batch(["topic1", "topic2", "Topic1"], k=20)
+    assert len(batch[0]) == 10 and batch[0] == batch[2]
+    assert index.stats()["cache_hits"] == 0
+    index.search("topic1", k=20)
+    assert index.stats()["cache_hits"] == 1
+    index.close()
+
+def test_research_agent_prompt_gets_sources(tmp_path):
+    index = SearchIndex(tmp_path / "idx")
+    index.index_directory(_corpus(tmp_path / "corpus"))
+    prompts = []
+    adapter = FakeLLMAdapter(response=lambda p: prompts.append(p) or "ok")
+    af = AgentFactory(llm_client=LLMClient(adapter), search_tool=SearchTool(index, k=2))
+    af.build("research").run({"id": "t1", "type": "research", "payload": {"topic": "lithium battery"}})
+    af.build("trends").run({"id": "t2", "type": "trends", "payload": {"topic": "lithium battery"}})
+    assert "Sources (internal corpus)" in prompts[0] and "[1]" in prompts[0]
+    assert "Sources (internal corpus)" not in prompts[1]
+    index.close()
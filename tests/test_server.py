@@ -0,0 +1,48 @@
+# tests/test_server.py
+import threading
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.orchestrator.job_queue import JobQueue
+from agentic_report_swarm.server import create_app
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+def _client(adapter=None, **kw):
+    af = AgentFactory(llm_client=LLMClient(adapter or FakeLLMAdapter()), templates={})
+    return TestClient(create_app(jobs=JobQueue(af, **kw)))
+
+def test_submit_poll_and_stream_events():
+    with _client() as client:
+        r = client.post("/reports", json={"topic": "AI in healthcare"})
+        assert r.status_code == 202
+        job_id = r.json()["job_id"]
+        with client.stream("GET", f"/reports/{job_id}/events") as resp:
+            body = "".join(resp.iter_text())
+        assert body.count("event: section") == 5
+        assert body.rstrip().endswith('data: {"sections": 5}')
+        assert client.app.state.jobs.get(job_id)._listeners == []
+        status = client.get(f"/reports/{job_id}").json()
+        assert status["status"] == "done" and "Research Report" in status["markdown"]
+        assert client.get("/reports/nope").status_code == 404
+        assert client.post("/reports", json={"topic": ""}).status_code == 422
+
+def test_full_queue_returns_429():
+    gate = threading.Event()
+
+    class GatedAdapter(FakeLLMAdapter):
+        def generate(self, prompt, **kwargs):
+            gate.wait(5)
+            return super().generate(prompt, **kwargs)
+
+    with _client(GatedAdapter(), workers=1, max_queued=1) as client:
+        first = client.post("/reports", json={"topic": "one"}).json()["job_id"]
+        client.app.state.jobs.get(first).wait_sections(0, timeout=5)
+        assert client.post("/reports", json={"topic": "two"}).status_code == 202
+        r = client.post("/reports", json={"topic": "three"})
+        assert r.status_code == 429 and r.headers["Retry-After"]
+        assert client.get("/healthz").json()["rejected"] == 1
+        gate.set()
@@ -0,0 +1,47 @@
+# tests/test_short_term_memory.py
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.memory.short_term import ShortTermMemory, allocate_budget, truncate_to_tokens
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+
+def test_allocate_budget_gives_unused_share_to_long_items():
+    assert allocate_budget([10, 500, 500], 210) == [10, 100, 100]
+    assert sum(allocate_budget([1000, 1000, 1000], 300)) <= 300
+
+def test_view_references_outputs_and_bounds_context():
+    mem = ShortTermMemory(token_budget=50)
+    research = {"text": "word " * 400}
+    mem.put("t1", research, "research")
+    mem.put("t2", {"text": "short trends"}, "trends")
+    view = mem.view(["t1", "t2", "missing"])
+    assert list(view) == ["t1", "t2"]
+    assert view["t1"] is research
+    ctx = view.context
+    assert "### trends (t2)\nshort trends" in ctx
+    assert ctx.count("…[truncated]") == 1
+    assert len(ctx) < 50 * 4 + 64
+    assert truncate_to_tokens("abc", 10) == "abc"
+
+class EchoAgent:
+    def __init__(self, seen):
+        self.seen = seen
+    def run(self, task):
+        up = task.get("upstream")
+        self.seen[task["id"]] = up.context if up is not None else None
+        return {"text": f"{task['id']} " + "x" * 4000}
+
+class EchoFactory:
+    def __init__(self):
+        self.seen = {}
+    def build(self, agent_type):
+        return EchoAgent(self.seen)
+
+def test_dependents_receive_bounded_upstream_context():
+    subtasks = [SubTask.make(type="s", payload={}, id="t0")]
+    for i in range(1, 6):
+        subtasks.append(SubTask.make(type="s", payload={}, depends_on=[f"t{j}" for j in range(i)], id=f"t{i}"))
+    factory = EchoFactory()
+    SwarmManager(agent_factory=factory, max_workers=2, upstream_token_budget=200).execute_plan(Plan("p", "x", subtasks))
+    assert factory.seen["t0"] is None
+    assert "### s (t0)" in factory.seen["t1"]
+    # deeper subtasks see more dependencies but the same bounded context size
+    assert all(len(factory.seen[f"t{i}"]) < 200 * 4 + 200 for i in range(1, 6))
@@ -0,0 +1,67 @@
+# tests/test_speculation.py
+import threading
+import time
+import pytest
+from agentic_report_swarm.adapters.fake_adapter import FakeLLMAdapter
+from agentic_report_swarm.core.planner import simple_planner
+from agentic_report_swarm.factory.agent_factory import AgentFactory
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+from agentic_report_swarm.utils.cancellation import CancelToken, LLMCancelled, cancel_scope
+from agentic_report_swarm.utils.llm_client import LLMClient
+
+STATIC = {t: {"prompt": t + " on {{ task.payload.topic }}"} for t in ("research", "trends", "insights", "writer")}
+
+class SlowStreamAdapter:
+    def __init__(self):
+        self.chunks_sent = 0
+    def stream(self, prompt, **kwargs):
+        for _ in range(50):
+            time.sleep(0.01)
+            self.chunks_sent += 1
+            yield "word "
+    def generate(self, prompt, **kwargs):
+        return "".join(self.stream(prompt))
+
+def test_cancel_token_aborts_streamed_call_and_counts_waste():
+    adapter = SlowStreamAdapter()
+    client = LLMClient(adapter)
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel).start()
+    with cancel_scope(token), pytest.raises(LLMCancelled):
+        client.generate("x" * 400)
+    assert adapter.chunks_sent < 50
+    usage = client.usage()
+    assert usage["cancelled_calls"] == 1 and usage["wasted_tokens"] >= 100
+
+def test_speculation_overlaps_chain_of_static_prompts():
+    af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter(latency=0.1)), templates=STATIC)
+    plan = simple_planner("EV")
+    started = time.perf_counter()
+    mgr = SwarmManager(agent_factory=af, max_workers=4, speculative=True)
+    results = mgr.execute_plan(plan)
+    assert time.perf_counter() - started < 0.3
+    assert all(r["success"] for r in results.values())
+    assert mgr.last_run_stats["speculated"] == 3 and mgr.last_run_stats["spec_committed"] == 3
+
+def test_prompts_using_upstream_are_not_speculated():
+    templates = dict(STATIC, trends={"prompt": "trends {{ task.upstream.context }}"})
+    af = AgentFactory(llm_client=LLMClient(FakeLLMAdapter()), templates=templates)
+    mgr = SwarmManager(agent_factory=af, max_workers=4, speculative=True)
+    mgr.execute_plan(simple_planner("EV"))
+    # trends waits for research; insights/writer may still speculate behind it
+    assert mgr.last_run_stats["speculated"] < 3
+    assert mgr.last_run_stats["spec_discarded"] == 0
+
+def test_failed_upstream_cancels_speculative_dependents():
+    class FailResearch(FakeLLMAdapter):
+        def generate(self, prompt, **kwargs):
+            out = super().generate(prompt, **kwargs)
+            if prompt.startswith("research"):
+                raise RuntimeError("research down")
+            return out
+    af = AgentFactory(llm_client=LLMClient(FailResearch(latency=0.05)), templates=STATIC)
+    mgr = SwarmManager(agent_factory=af, max_workers=4, speculative=True)
+    results = mgr.execute_plan(simple_planner("EV"))
+    assert not results["t1"]["success"]
+    assert results["t2"]["error"].startswith("unmet_dependencies")
+    assert mgr.last_run_stats["spec_discarded"] == mgr.last_run_stats["speculated"] > 0
@@ -0,0 +1,47 @@
+# tests/test_streaming.py
+import asyncio
+import json
+import time
+import httpx
+from agentic_report_swarm.agents.generic_agent import GenericAgent
+from agentic_report_swarm.orchestrator.super_agent import run_topic, stream_topic
+from agentic_report_swarm.utils.llm_client import LLMClient
+from agentic_report_swarm.adapters.openai_adapter import MockOpenAIAdapter, HTTPOpenAIAdapter
+
+TEMPLATES = {t: {"prompt": f"{t} about {{{{ task.payload.topic }}}}"} for t in ("research", "trends", "insights", "writer")}
+
+class SlowFirstAdapter(MockOpenAIAdapter):
+    """research is slow; lets later sections finish first to check ordering."""
+    def generate(self, prompt: str, **kwargs) -> str:
+        if prompt.startswith("research"):
+            time.sleep(0.05)
+        return super().generate(prompt, **kwargs)
+
+def test_generic_agent_stream_matches_run():
+    agent = GenericAgent(name="g", llm_client=LLMClient(MockOpenAIAdapter()), template={"prompt": "hello {{ task.id }}"})
+    task = {"id": "t1", "type": "research", "payload": {}}
+    chunks = list(agent.stream(task))
+    assert len(chunks) > 1
+    assert "".join(chunks) == agent.run(task)["text"]
+
+    async def collect():
+        return [c async for c in agent.astream(task)]
+
+    assert "".join(asyncio.run(collect())) == agent.run(task)["text"]
+
+def test_stream_topic_yields_sections_in_plan_order():
+    client = LLMClient(SlowFirstAdapter())
+    chunks_seen = []
+    pieces = list(stream_topic("ai", templates=TEMPLATES, llm_client=client,
+                               on_chunk=lambda tid, c: chunks_seen.append(tid)))
+    assert pieces[0].startswith("# Research Report")
+    assert [p.split("(task ")[1][:2] for p in pieces[1:]] == ["t1", "t2", "t3", "t4"]
+    assert "".join(pieces) == run_topic("ai", templates=TEMPLATES, llm_client=client)
+    assert set(chunks_seen) == {"t1", "t2", "t3", "t4"}
+
+def test_http_adapter_streams_sse():
+    events = [{"choices": [{"delta": {"content": c}}]} for c in ("Hel", "lo")]
+    body = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+    transport = httpx.MockTransport(lambda req: httpx.Response(200, text=body))
+    adapter = HTTPOpenAIAdapter(api_key="sk-test", client=httpx.Client(transport=transport))
+    assert list(LLMClient(adapter).stream("x")) == ["Hel", "lo"]
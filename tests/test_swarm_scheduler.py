@@ -0,0 +1,59 @@
+# tests/test_swarm_scheduler.py
+import threading
+import time
+from agentic_report_swarm.core.plan_schema import Plan, SubTask
+from agentic_report_swarm.swarm.swarm_manager import SwarmManager
+
+class SleepAgent:
+    def __init__(self, tracker):
+        self.tracker = tracker
+    def run(self, task):
+        with self.tracker["lock"]:
+            self.tracker["active"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        time.sleep(0.05)
+        with self.tracker["lock"]:
+            self.tracker["active"] -= 1
+            self.tracker["order"].append(task["id"])
+        if task["type"] == "boom":
+            raise RuntimeError("boom")
+        return {"text": task["id"]}
+
+class SleepFactory:
+    def __init__(self):
+        self.tracker = {"lock": threading.Lock(), "active": 0, "peak": 0, "order": []}
+    def build(self, agent_type):
+        return SleepAgent(self.tracker)
+
+def _wide_plan(width):
+    subtasks = [SubTask.make(type="research", payload={}, id=f"r{i}") for i in range(width)]
+    subtasks.append(SubTask.make(type="writer", payload={}, depends_on=[st.id for st in subtasks], id="w"))
+    return Plan(plan_id="p", topic="x", subtasks=subtasks)
+
+def test_independent_subtasks_run_concurrently():
+    factory = SleepFactory()
+    results = SwarmManager(agent_factory=factory, max_workers=4).execute_plan(_wide_plan(4))
+    assert all(r["success"] for r in results.values())
+    assert factory.tracker["peak"] == 4
+    # writer only runs after all of its dependencies
+    assert factory.tracker["order"][-1] == "w"
+
+def test_max_workers_one_runs_sequentially():
+    factory = SleepFactory()
+    results = SwarmManager(agent_factory=factory, max_workers=1).execute_plan(_wide_plan(3))
+    assert set(results) == {"r0", "r1", "r2", "w"}
+    assert factory.tracker["peak"] == 1
+
+def test_failed_and_missing_dependencies_are_reported():
+    plan = Plan(plan_id="p", topic="x", subtasks=[
+        SubTask.make(type="boom", payload={}, id="a"),
+        SubTask.make(type="writer", payload={}, depends_on=["a"], id="b"),
+        SubTask.make(type="writer", payload={}, depends_on=["nope"], id="c"),
+        SubTask.make(type="writer", payload={}, depends_on=["e"], id="d"),
+        SubTask.make(type="writer", payload={}, depends_on=["d"], id="e"),
+    ])
+    results = SwarmManager(agent_factory=SleepFactory()).execute_plan(plan)
+    assert results["a"] == {"id": "a", "success": False, "error": "boom"}
+    assert results["b"]["error"] == "unmet_dependencies:['a']"
+    assert results["c"]["error"] == "unmet_dependencies:['nope']"
+    assert not results["d"]["success"] and not results["e"]["success"]
@@ -29,3 +29,44 @@ def test_template_registry_and_factory(tmp_path):
     # run agent quickly (mock LLM returns predictable string)
     res = agent.run({"id": "t1", "type": "research", "payload": {"topic": "X"}})
     assert "Generated for" in res["text"] or "[MOCK-ADAPTER]" in res["text"]
+
+def test_incremental_refresh_and_snapshots(tmp_path):
+    cfg_dir = tmp_path / "tpl"
+    cfg_dir.mkdir()
+    (cfg_dir / "a.yaml").write_text("prompt: A1\n")
+    (cfg_dir / "b.yaml").write_text("prompt: B\n")
+    reg = TemplateRegistry(template_dir=cfg_dir)
+    snap1 = reg.snapshot()
+    b_obj = reg.get("b")
+
+    # no changes -> same snapshot object
+    reg.refresh()
+    assert reg.snapshot() is snap1
+
+    (cfg_dir / "a.yaml").write_text("prompt: A2-changed\n")
+    (cfg_dir / "c.yaml").write_text("prompt: C\n")
+    reg.refresh()
+    snap2 = reg.snapshot()
+    assert snap2.version == snap1.version + 1
+    assert snap2.templates["a"]["prompt"] == "A2-changed"
+    assert "c" in snap2.templates
+    # unchanged file is not re-parsed
+    assert reg.get("b") is b_obj
+    # old snapshot is untouched
+    assert snap1.templates["a"]["prompt"] == "A1" and "c" not in snap1.templates
+
+def test_shared_registry_and_watcher(tmp_path):
+    import time
+    cfg_dir = tmp_path / "tpl"
+    cfg_dir.mkdir()
+    reg = TemplateRegistry.shared(cfg_dir)
+    assert TemplateRegistry.shared(str(cfg_dir)) is reg
+    reg.start_watcher(interval=0.01)
+    try:
+        (cfg_dir / "writer.yaml").write_text("prompt: W\n")
+        deadline = time.time() + 2
+        while "writer" not in reg.templates and time.time() < deadline:
+            time.sleep(0.01)
+        assert reg.get("writer") == {"prompt": "W"}
+    finally:
+        reg.stop_watcher()
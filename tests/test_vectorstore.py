@@ -0,0 +1,62 @@
+# tests/test_vectorstore.py
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from agentic_report_swarm.memory.vectorstore import HashingEmbedder, VectorStore
+
+def test_hashing_embedder_is_deterministic_and_normalised():
+    emb = HashingEmbedder(dim=64)
+    a, b = emb.embed(["electric vehicles Indonesia", "electric vehicles Indonesia"])
+    assert np.allclose(a, b)
+    assert abs(float(np.linalg.norm(a)) - 1.0) < 1e-5
+
+def test_text_search_ranks_related_document_first():
+    store = VectorStore(embedder=HashingEmbedder(dim=256))
+    store.add_texts(
+        ["EV battery supply chain in Indonesia", "fashion e-commerce trends Q4", "coffee export prices"],
+        metadata=[{"topic": "ev"}, {"topic": "fashion"}, {"topic": "coffee"}],
+    )
+    vid, score = store.search_text("Indonesia EV battery", k=1)[0]
+    assert store.get(vid) == {"topic": "ev"}
+    assert score > 0.3
+
+def test_exact_search_blocked_matches_brute_force():
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(500, 16)).astype(np.float32)
+    store = VectorStore(dim=16, initial_capacity=8)
+    store.add(data[:200])
+    store.add(data[200:])  # incremental, grows capacity
+    queries = rng.normal(size=(5, 16)).astype(np.float32)
+    hits = store.search(queries, k=5, block_rows=64)
+    normed = data / np.linalg.norm(data, axis=1, keepdims=True)
+    expected = np.argsort(-(queries @ normed.T), axis=1)[:, :5]
+    ids = store._ids
+    assert [[vid for vid, _ in row] for row in hits] == [[ids[i] for i in row] for row in expected]
+
+def test_ivf_index_recall_and_incremental_inserts():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 32))
+    data = (centers[rng.integers(0, 20, 2000)] + 0.1 * rng.normal(size=(2000, 32))).astype(np.float32)
+    store = VectorStore(dim=32)
+    store.add(data[:1500])
+    store.build_index(n_lists=20, n_probe=3)
+    store.add(data[1500:], ids=[f"late{i}" for i in range(500)])
+    queries = data[1500:1520]
+    exact = store.search(queries, k=10, exact=True)
+    approx = store.search(queries, k=10)
+    recall = np.mean([len({a for a, _ in x} & {b for b, _ in y}) / 10 for x, y in zip(exact, approx)])
+    assert recall >= 0.9
+    assert approx[0][0][0] == "late0"
+
+def test_memmap_store_reopens(tmp_path):
+    store = VectorStore(dim=8, path=tmp_path / "vs", initial_capacity=2)
+    ids = store.add(np.eye(8, dtype=np.float32)[:5], metadata=[{"i": i} for i in range(5)])
+    store.close()
+    again = VectorStore(dim=8, path=tmp_path / "vs")
+    assert len(again) == 5 and again.get(ids[3]) == {"i": 3}
+    assert again.search(np.eye(8, dtype=np.float32)[3], k=1)[0][0][0] == ids[3]
+    again.add(np.ones((1, 8), dtype=np.float32), ids=["x"])
+    with pytest.raises(ValueError):
+        again.add(np.ones((1, 8), dtype=np.float32), ids=["x"])
+    again.close()